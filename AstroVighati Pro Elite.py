@@ -37,6 +37,9 @@ Core Architecture:
 - Theming Engine (`EnhancedThemeManager`): Manages the visual styling.
 """
 
+# Annotations are kept as strings and never evaluated at import time.
+from __future__ import annotations
+
 # --- Standard Library Imports ---
 
 import importlib
@@ -45,13 +48,20 @@ import sys
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import combinations
+from bisect import bisect_right
+from dataclasses import dataclass
+from collections import ChainMap
+from types import MappingProxyType
 import threading
 import math
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any, Callable
+from typing import List, Dict, Tuple, Optional, Any, Callable, NamedTuple, FrozenSet, Iterable, Mapping
 import textwrap
+import unicodedata
 import pytz
 import re
 
@@ -231,6 +241,51 @@ def decimal_to_dms(decimal_degrees: Optional[float]) -> str:
 #===================================================================================================
 # DATA & INTERPRETATION STORES
 #===================================================================================================
+def _freeze(value: Any) -> Any:
+    """
+    Recursively turns dicts into read-only MappingProxyType views and lists into tuples.
+
+    String keys and values are interned on the way through, so a name such as
+    "Aries" or "Jupiter" that recurs across the tables is one shared object and
+    later comparisons and dict lookups on it short-circuit on identity.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({_freeze(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+class _LazyClassAttr:
+    """
+    A class attribute computed by ``factory`` on first access. The result then
+    replaces the descriptor on the owner class, so later reads are plain lookups.
+    """
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        value = self.factory()
+        setattr(owner, self.name, value)
+        return value
+
+# Nakshatra lords in Vimshottari order; the 27 nakshatras cycle through it three times.
+_VIMSHOTTARI_LORDS: Tuple[str, ...] = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+
+# Navamsha of the 4 padas, for nakshatras 1, 2, 3 and every third one after.
+_NAVAMSHA_PADA_CYCLE: Tuple[Tuple[str, ...], ...] = (
+    ("Aries", "Taurus", "Gemini", "Cancer"),
+    ("Leo", "Virgo", "Libra", "Scorpio"),
+    ("Sagittarius", "Capricorn", "Aquarius", "Pisces"),
+)
+
+# Sign nature indexed by parity (sign_num & 1): even signs -> 0, odd signs -> 1.
+_SIGN_NATURES: Tuple[str, str] = ("Even", "Odd")
+
 class EnhancedAstrologicalData:
     """
     This class acts as a centralized, read-only database for all the static
@@ -239,37 +294,62 @@ class EnhancedAstrologicalData:
     Using '@staticmethod' means we can call these functions
     (e.g., `EnhancedAstrologicalData.get_all_planets()`) without
     needing to create an instance of the class. It's purely a data container.
-    """
 
-    # Static (class-level) dictionaries for quick lookups
-    PLANET_COLORS: Dict[str, str] = {
-        "Sun": "#FDB813", "Moon": "#C0C0C0", "Mars": "#CD5C5C",
-        "Mercury": "#90EE90", "Jupiter": "#FFD700", "Venus": "#FFB6C1",
-        "Saturn": "#4169E1", "Rahu": "#8B4513", "Ketu": "#A9A9A9",
-        "Ascendant": "#E74C3C"
-    }
+    The table getters are cached: each table is built on the first call and
+    every later call returns that same object. Tables are frozen (dicts become
+    read-only MappingProxyType views, lists become tuples), so the one shared
+    instance can't be modified by any caller. The same objects are also exposed
+    as class attributes (PLANETS, NAKSHATRAS, RASHIS, ...), built on first access.
+    """
 
-    SIGNS: Dict[int, str] = {
+    SIGNS: Mapping[int, str] = MappingProxyType({
         1: "Aries", 2: "Taurus", 3: "Gemini", 4: "Cancer", 5: "Leo", 6: "Virgo",
         7: "Libra", 8: "Scorpio", 9: "Sagittarius", 10: "Capricorn", 11: "Aquarius", 12: "Pisces"
-    }
+    })
+
+    # Everything below is derived, so it is built on first access rather than at import.
+
+    # Planet name -> color, from the planet table's 'color' field (plus the
+    # Ascendant, which has no planet record).
+    PLANET_COLORS: Mapping[str, str] = _LazyClassAttr(lambda: MappingProxyType({
+        **{planet['name']: planet['color'] for planet in EnhancedAstrologicalData.PLANETS},
+        "Ascendant": "#E74C3C",
+    }))
 
     # A reverse-lookup map. Useful for converting "Aries" back to 1.
-    SIGN_NAME_TO_NUM: Dict[str, int] = {v: k for k, v in SIGNS.items()}
+    SIGN_NAME_TO_NUM: Mapping[str, int] = _LazyClassAttr(lambda: MappingProxyType(
+        dict(zip(EnhancedAstrologicalData.SIGNS.values(), EnhancedAstrologicalData.SIGNS.keys()))))
 
     # A map for Varga calculations that depend on sign nature (Odd/Even)
-    SIGN_NATURE: Dict[int, str] = {
-        1: "Odd", 2: "Even", 3: "Odd", 4: "Even", 5: "Odd", 6: "Even",
-        7: "Odd", 8: "Even", 9: "Odd", 10: "Even", 11: "Odd", 12: "Even"
-    }
+    # Derived from parity (see sign_nature) rather than spelled out per sign.
+    SIGN_NATURE: Mapping[int, str] = _LazyClassAttr(lambda: MappingProxyType(
+        {num: _SIGN_NATURES[num & 1] for num in EnhancedAstrologicalData.SIGNS}))
+
+    # The frozen tables as plain class attributes, taken from the get_* builders
+    # below (which return the same objects). Hot paths read these directly: after
+    # the first access it is one attribute load, no call.
+    PLANETS: Tuple[Mapping[str, Any], ...] = _LazyClassAttr(lambda: EnhancedAstrologicalData.get_all_planets())
+    NAKSHATRAS: Tuple[Mapping[str, Any], ...] = _LazyClassAttr(lambda: EnhancedAstrologicalData.get_all_nakshatras())
+    NAKSHATRA_STARTS: Tuple[float, ...] = _LazyClassAttr(lambda: EnhancedAstrologicalData.get_nakshatra_starts())
+    RASHIS: Tuple[Mapping[str, Any], ...] = _LazyClassAttr(lambda: EnhancedAstrologicalData.get_all_rashis())
+    VARGA_DESCRIPTIONS: Mapping[str, Mapping[str, str]] = _LazyClassAttr(lambda: EnhancedAstrologicalData.get_varga_descriptions())
+    # The varga descriptions keyed by bare chart code ("D9" for "D9 - Navamsa").
+    VARGA_BY_CODE: Mapping[str, Mapping[str, str]] = _LazyClassAttr(lambda: MappingProxyType(
+        {key.split(' ', 1)[0]: info for key, info in EnhancedAstrologicalData.VARGA_DESCRIPTIONS.items()}))
+
+    @staticmethod
+    def sign_nature(sign_num: int) -> str:
+        """Returns "Odd" or "Even" for a sign number (1-12) without a table lookup."""
+        return _SIGN_NATURES[sign_num & 1]
 
     @staticmethod
-    def get_varga_descriptions() -> Dict[str, Dict[str, str]]:
+    @lru_cache(maxsize=1)
+    def get_varga_descriptions() -> Mapping[str, Mapping[str, str]]:
         """
         Provides highly detailed descriptions for the 'Varga Meanings' tab.
         Synthesized from classical texts, primarily BPHS, with Lal Kitab context.
         """
-        return {
+        return _freeze({
             "D1 - Rashi": {
                 "title": "D1 - Rashi Kundali (Lagna Chart)",
                 "domain": "The Physical Body, Overall Life, The 'Self'",
@@ -415,17 +495,18 @@ class EnhancedAstrologicalData:
                 "key_karakas": "Lagna, All Planets (analyzed by their Deity)",
                 "lal_kitab_analysis": ("Not Used. Lal Kitab has its own complex system of 'karmic debt' ('Rin') and past-life influences diagnosed *only* from the D1 chart, without using any divisional charts.")
             }
-        }
+        })
     @staticmethod
-    def get_all_planets() -> List[Dict[str, Any]]:
+    @lru_cache(maxsize=1)
+    def get_all_planets() -> Tuple[Mapping[str, Any], ...]:
         """
         Returns a comprehensive list of all 9 planets (Navagrahas) used
         in Vedic astrology, including advanced attributes from BPHS and Lal Kitab.
 
         Returns:
-            list: A list of dictionaries, where each dictionary is a planet.
+            tuple: A tuple of read-only mappings, one per planet.
         """
-        return [
+        return _freeze([
             {
                 "name": "Sun", "sanskrit": "Surya", "devanagari": "सूर्य", "symbol": "☉",
                 "karaka": "Atmakaraka (Soul), Father, King, Government, Authority, Ego, Self-Esteem, Health, Vitality, Right Eye, Heart, Bones",
@@ -570,22 +651,42 @@ class EnhancedAstrologicalData:
                 "bphs_note": "The South Node (Dragon's Tail). A shadow planet. Acts like Mars ('Kuja-vat Ketu'). It is the detacher, representing spirituality, intuition, sudden endings, and past life merits/demerits. It forces introspection and leads towards Moksha.",
                 "lal_kitab_note": "Pakka Ghar: 6. Exalted in 8 (Scorpio) or 9 (Sagittarius). Represents 'aulad' (progeny, especially son) and 'kutta' (dog). Can give deep intuitive abilities. Remedies involve feeding dogs, wearing gold in the ear, or donating blankets to the needy."
             }
-        ]
+        ])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_planet_column(field: str) -> Tuple[Any, ...]:
+        """
+        Returns one attribute of every planet as a tuple, in get_all_planets() order.
+
+        This is a column view of the planet table (e.g. ``get_planet_column("name")``
+        or ``get_planet_column("color")``), so callers that only need one field
+        don't have to walk the planet mappings themselves. Planets without the
+        field contribute None.
+        """
+        return tuple(planet.get(field) for planet in EnhancedAstrologicalData.get_all_planets())
+
     @staticmethod
-    def get_all_nakshatras() -> List[Dict[str, Any]]:
+    @lru_cache(maxsize=1)
+    def get_planets_by_name() -> Mapping[str, Mapping[str, Any]]:
+        """Returns the get_all_planets() entries keyed by planet name, for O(1) lookups."""
+        return MappingProxyType({planet['name']: planet for planet in EnhancedAstrologicalData.get_all_planets()})
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_all_nakshatras() -> Tuple[Mapping[str, Any], ...]:
         """
         Returns a list of all 27 Nakshatras (lunar mansions) with their
         key attributes, including classical details and Lal Kitab notes.
 
         Returns:
-            list: A list of dictionaries, where each dictionary is a nakshatra.
+            tuple: A tuple of read-only mappings, one per nakshatra.
         """
         # Note: Some attributes like Tattva, Direction for Nakshatras vary across sources.
         # The primary classification (Gana, Yoni, Nadi, Lord, Deity) is more standard.
-        return [
-            {"num": 1, "name": "Ashwini", "sanskrit": "Ashwini", "devanagari": "अश्विनी", "lord": "Ketu", "remainder": 0,
-            "deity": "Ashwini Kumaras (Healers)", "symbol": "Horse's Head", "start_degree": 0.0, "end_degree": 13.3333,
-            "padas_rashi": ["Aries"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+        nakshatras = [
+            {"num": 1, "name": "Ashwini", "sanskrit": "Ashwini", "devanagari": "अश्विनी",
+            "deity": "Ashwini Kumaras (Healers)", "symbol": "Horse's Head",
             "syllables": ["चू (Chu)", "चे (Che)", "चो (Cho)", "ला (La)"],
             "gana": "Deva (Divine)", "yoni": "Ashwa (Male Horse)", "nadi": "Adi (Vata)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Dharma", "nature": "Laghu/Kshipra (Light/Swift)",
@@ -593,9 +694,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents swift action, healing energy (like its deities). Ketu's rulership indicates beginnings rooted in past karma or intuition. A Gandanta point starts here.",
             "lal_kitab_note": "Governed by Ketu. Ketu's effect depends on House 6 ('Pakka Ghar'). If Moon is here, remedies involving dogs (Ketu) might apply. Energy influenced by Mars (Aries)."
             },
-            {"num": 2, "name": "Bharani", "sanskrit": "Bharani", "devanagari": "भरणी", "lord": "Venus", "remainder": 1,
-            "deity": "Yama (Lord of Death/Dharma)", "symbol": "Yoni (Female reproductive organ)", "start_degree": 13.3333, "end_degree": 26.6666,
-            "padas_rashi": ["Aries"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 2, "name": "Bharani", "sanskrit": "Bharani", "devanagari": "भरणी",
+            "deity": "Yama (Lord of Death/Dharma)", "symbol": "Yoni (Female reproductive organ)",
             "syllables": ["ली (Li)", "लू (Lu)", "ले (Le)", "लो (Lo)"],
             "gana": "Manushya (Human)", "yoni": "Gaja (Male Elephant)", "nadi": "Madhya (Pitta)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Artha", "nature": "Ugra/Krura (Fierce/Cruel)",
@@ -603,9 +703,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents the process of birth and death, transformation. Deity Yama indicates discipline and judgment. Venus lordship brings creative and procreative energy.",
             "lal_kitab_note": "Governed by Venus. Venus's effect depends on House 7 ('Pakka Ghar'). Influenced by Mars (Aries). Can indicate strong desires. Remedies might involve Venus items (ghee, curd)."
             },
-            {"num": 3, "name": "Krittika", "sanskrit": "Krittika", "devanagari": "कृत्तिका", "lord": "Sun", "remainder": 2,
-            "deity": "Agni (God of Fire)", "symbol": "Knife, Axe, Razor, Flame", "start_degree": 26.6666, "end_degree": 40.0,
-            "padas_rashi": ["Aries"] + ["Taurus"]*3, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 3, "name": "Krittika", "sanskrit": "Krittika", "devanagari": "कृत्तिका",
+            "deity": "Agni (God of Fire)", "symbol": "Knife, Axe, Razor, Flame",
             "syllables": ["अ (A)", "ई (I)", "उ (U)", "ए (E)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Mesha (Female Sheep)", "nadi": "Antya (Kapha)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Kama", "nature": "Misra/Sadharana (Mixed)",
@@ -613,9 +712,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Aries and Taurus. Deity Agni gives purifying fire. Symbol indicates sharpness (intellect, criticism). Sun lordship gives leadership. The Taurus portion adds stability and nurturing.",
             "lal_kitab_note": "Governed by Sun. Sun's effect depends on House 1 ('Pakka Ghar'). Spans Mars (Aries) and Venus (Taurus) Rasis. Can give sharp intelligence and authority. Remedies might involve Sun items (copper, wheat)."
             },
-            {"num": 4, "name": "Rohini", "sanskrit": "Rohini", "devanagari": "रोहिणी", "lord": "Moon", "remainder": 3,
-            "deity": "Brahma/Prajapati (Creator)", "symbol": "Cart, Chariot, Temple, Banyan Tree", "start_degree": 40.0, "end_degree": 53.3333,
-            "padas_rashi": ["Taurus"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 4, "name": "Rohini", "sanskrit": "Rohini", "devanagari": "रोहिणी",
+            "deity": "Brahma/Prajapati (Creator)", "symbol": "Cart, Chariot, Temple, Banyan Tree",
             "syllables": ["ओ (O)", "वा (Va)", "वी (Vi)", "वू (Vu)"],
             "gana": "Manushya (Human)", "yoni": "Sarpa (Male Serpent)", "nadi": "Antya (Kapha)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Moksha", "nature": "Sthira/Dhruva (Fixed/Permanent)",
@@ -623,9 +721,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Moon's favorite Nakshatra, where it is exalted. Represents growth, creation (Brahma), and material abundance. Associated with beauty and charm. Highly fertile.",
             "lal_kitab_note": "Governed by Moon. Moon's effect depends on House 4 ('Pakka Ghar'). In Venus's sign (Taurus). Excellent for wealth and beauty. Remedies involve Moon items (silver, rice)."
             },
-            {"num": 5, "name": "Mrigashira", "sanskrit": "Mrigashira", "devanagari": "मृगशिरा", "lord": "Mars", "remainder": 4,
-            "deity": "Soma (Moon God)", "symbol": "Deer's Head", "start_degree": 53.3333, "end_degree": 66.6666,
-            "padas_rashi": ["Taurus"]*2 + ["Gemini"]*2, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 5, "name": "Mrigashira", "sanskrit": "Mrigashira", "devanagari": "मृगशिरा",
+            "deity": "Soma (Moon God)", "symbol": "Deer's Head",
             "syllables": ["वे (Ve)", "वो (Vo)", "का (Ka)", "की (Ki)"],
             "gana": "Deva (Divine)", "yoni": "Sarpa (Female Serpent)", "nadi": "Madhya (Pitta)", "guna": "Rajasic", "tattva": "Air",
             "motivation": "Moksha", "nature": "Mridu/Maitra (Soft/Friendly)",
@@ -633,9 +730,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Taurus and Gemini ('The Searching Star'). Symbol deer indicates seeking. Deity Soma brings sensitivity. Mars lordship adds drive to the search. Gemini portion adds intellect.",
             "lal_kitab_note": "Governed by Mars. Mars's effect depends on House 3/8 ('Pakka Ghar'). Spans Venus (Taurus) and Mercury (Gemini) Rasis. Can indicate searching/wandering nature. Remedies for Mars may apply."
             },
-            {"num": 6, "name": "Ardra", "sanskrit": "Ardra", "devanagari": "आर्द्रा", "lord": "Rahu", "remainder": 5,
-            "deity": "Rudra (Storm God/Shiva)", "symbol": "Teardrop, Diamond, Human Head", "start_degree": 66.6666, "end_degree": 80.0,
-            "padas_rashi": ["Gemini"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 6, "name": "Ardra", "sanskrit": "Ardra", "devanagari": "आर्द्रा",
+            "deity": "Rudra (Storm God/Shiva)", "symbol": "Teardrop, Diamond, Human Head",
             "syllables": ["कू (Ku)", "घ (Gha)", "ङ (Na)", "छ (Chha)"],
             "gana": "Manushya (Human)", "yoni": "Shwana (Female Dog)", "nadi": "Adi (Vata)", "guna": "Tamasic", "tattva": "Air",
             "motivation": "Kama", "nature": "Tikshna/Daruna (Sharp/Dreadful)",
@@ -643,9 +739,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents intensity and the destructive force needed for creation (Rudra). Symbol teardrop indicates potential sorrow or release. Rahu lordship brings sudden changes and intensity.",
             "lal_kitab_note": "Governed by Rahu. Rahu's effect depends on House 12 ('Pakka Ghar'). In Mercury's sign (Gemini). Can indicate sharp intellect, sudden events, or troubles. Remedies for Rahu (coal, radish) may apply."
             },
-            {"num": 7, "name": "Punarvasu", "sanskrit": "Punarvasu", "devanagari": "पुनर्वसु", "lord": "Jupiter", "remainder": 6,
-            "deity": "Aditi (Mother of Gods)", "symbol": "Bow and Quiver", "start_degree": 80.0, "end_degree": 93.3333,
-            "padas_rashi": ["Gemini"]*3 + ["Cancer"]*1, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 7, "name": "Punarvasu", "sanskrit": "Punarvasu", "devanagari": "पुनर्वसु",
+            "deity": "Aditi (Mother of Gods)", "symbol": "Bow and Quiver",
             "syllables": ["के (Ke)", "को (Ko)", "हा (Ha)", "ही (Hi)"],
             "gana": "Deva (Divine)", "yoni": "Marjara (Female Cat)", "nadi": "Adi (Vata)", "guna": "Sattvic", "tattva": "Air",
             "motivation": "Artha", "nature": "Chara/Chala (Movable/Changing)",
@@ -653,9 +748,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Gemini and Cancer ('Return of the Light'). Deity Aditi brings nurturing and freedom. Jupiter lordship gives wisdom and philosophy. Symbol bow indicates readiness and focus.",
             "lal_kitab_note": "Governed by Jupiter. Jupiter's effect depends on House 9 ('Pakka Ghar'). Spans Mercury (Gemini) and Moon (Cancer) Rasis. Generally auspicious. Remedies for Jupiter (saffron, gold) enhance good effects."
             },
-            {"num": 8, "name": "Pushya", "sanskrit": "Pushya", "devanagari": "पुष्य", "lord": "Saturn", "remainder": 7,
-            "deity": "Brihaspati (Guru of Gods)", "symbol": "Cow's Udder, Flower, Arrow, Circle", "start_degree": 93.3333, "end_degree": 106.6666,
-            "padas_rashi": ["Cancer"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 8, "name": "Pushya", "sanskrit": "Pushya", "devanagari": "पुष्य",
+            "deity": "Brihaspati (Guru of Gods)", "symbol": "Cow's Udder, Flower, Arrow, Circle",
             "syllables": ["हू (Hu)", "हे (He)", "हो (Ho)", "डा (Da)"],
             "gana": "Deva (Divine)", "yoni": "Mesha (Male Sheep)", "nadi": "Madhya (Pitta)", "guna": "Tamasic", "tattva": "Water",
             "motivation": "Dharma", "nature": "Laghu/Kshipra (Light/Swift)",
@@ -663,9 +757,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Considered the most auspicious Nakshatra ('Flower'). Symbol udder signifies nourishment. Deity Brihaspati brings wisdom. Saturn lordship adds stability and service.",
             "lal_kitab_note": "Governed by Saturn. Saturn's effect depends on House 10 ('Pakka Ghar'). In Moon's sign (Cancer). Can create 'Vish Yoga' (Saturn+Moon effect). Requires careful analysis. Remedies for Saturn may be needed."
             },
-            {"num": 9, "name": "Ashlesha", "sanskrit": "Ashlesha", "devanagari": "आश्लेषा", "lord": "Mercury", "remainder": 8,
-            "deity": "Nagas (Serpent Deities)", "symbol": "Coiled Serpent", "start_degree": 106.6666, "end_degree": 120.0,
-            "padas_rashi": ["Cancer"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 9, "name": "Ashlesha", "sanskrit": "Ashlesha", "devanagari": "आश्लेषा",
+            "deity": "Nagas (Serpent Deities)", "symbol": "Coiled Serpent",
             "syllables": ["डी (Di)", "डू (Du)", "डे (De)", "डो (Do)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Marjara (Male Cat)", "nadi": "Antya (Kapha)", "guna": "Sattvic", "tattva": "Water",
             "motivation": "Dharma", "nature": "Tikshna/Daruna (Sharp/Dreadful)",
@@ -673,9 +766,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents the serpent energy ('The Clinging Star'). Deity Nagas bring occult wisdom, intensity, and potential danger (poison/healing duality). Mercury lordship gives intellect. A Gandanta point ends here.",
             "lal_kitab_note": "Governed by Mercury. Mercury's effect depends on House 7 ('Pakka Ghar'). In Moon's sign (Cancer). Can indicate sharp, possibly manipulative intellect. Remedies for Mercury may apply."
             },
-            {"num": 10, "name": "Magha", "sanskrit": "Magha", "devanagari": "मघा", "lord": "Ketu", "remainder": 0,
-            "deity": "Pitrs (Ancestors)", "symbol": "Throne Room, Palanquin", "start_degree": 120.0, "end_degree": 133.3333,
-            "padas_rashi": ["Leo"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 10, "name": "Magha", "sanskrit": "Magha", "devanagari": "मघा",
+            "deity": "Pitrs (Ancestors)", "symbol": "Throne Room, Palanquin",
             "syllables": ["मा (Ma)", "मी (Mi)", "मू (Mu)", "मे (Me)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Mushaka (Male Rat)", "nadi": "Antya (Kapha)", "guna": "Tamasic", "tattva": "Fire",
             "motivation": "Artha", "nature": "Ugra/Krura (Fierce/Cruel)",
@@ -683,9 +775,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents ancestral power and tradition ('The Royal Star'). Symbol throne indicates authority. Ketu lordship connects to past lineage and karma. Falls entirely in Leo (Sun's sign).",
             "lal_kitab_note": "Governed by Ketu. Ketu's effect depends on House 6 ('Pakka Ghar'). In Sun's sign (Leo). Connects strongly to ancestors ('Pitra Rin'). Remedies for Ketu and serving ancestors crucial."
             },
-            {"num": 11, "name": "Purva Phalguni", "sanskrit": "Purva Phalguni", "devanagari": "पूर्व फाल्गुनी", "lord": "Venus", "remainder": 1,
-            "deity": "Bhaga (God of Fortune/Bliss)", "symbol": "Front legs of a Bed, Hammock, Fig Tree", "start_degree": 133.3333, "end_degree": 146.6666,
-            "padas_rashi": ["Leo"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 11, "name": "Purva Phalguni", "sanskrit": "Purva Phalguni", "devanagari": "पूर्व फाल्गुनी",
+            "deity": "Bhaga (God of Fortune/Bliss)", "symbol": "Front legs of a Bed, Hammock, Fig Tree",
             "syllables": ["मो (Mo)", "टा (Ta)", "टी (Ti)", "टू (Tu)"],
             "gana": "Manushya (Human)", "yoni": "Mushaka (Female Rat)", "nadi": "Madhya (Pitta)", "guna": "Rajasic", "tattva": "Fire",
             "motivation": "Kama", "nature": "Ugra/Krura (Fierce/Cruel)",
@@ -693,9 +784,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents enjoyment, love, and fortune ('The Former Reddish One'). Symbol bed/hammock indicates relaxation. Venus lordship emphasizes pleasure and relationships.",
             "lal_kitab_note": "Governed by Venus. Venus's effect depends on House 7 ('Pakka Ghar'). In Sun's sign (Leo). Good for enjoyment but needs balance. Remedies for Venus (cow seva, ghee) may apply."
             },
-            {"num": 12, "name": "Uttara Phalguni", "sanskrit": "Uttara Phalguni", "devanagari": "उत्तर फाल्गुनी", "lord": "Sun", "remainder": 2,
-            "deity": "Aryaman (God of Patronage/Contracts)", "symbol": "Back legs of a Bed, Hammock", "start_degree": 146.6666, "end_degree": 160.0,
-            "padas_rashi": ["Leo"]*1 + ["Virgo"]*3, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 12, "name": "Uttara Phalguni", "sanskrit": "Uttara Phalguni", "devanagari": "उत्तर फाल्गुनी",
+            "deity": "Aryaman (God of Patronage/Contracts)", "symbol": "Back legs of a Bed, Hammock",
             "syllables": ["टे (Te)", "टो (To)", "पा (Pa)", "पी (Pi)"],
             "gana": "Manushya (Human)", "yoni": "Go (Male Cow/Ox)", "nadi": "Adi (Vata)", "guna": "Sattvic", "tattva": "Fire",
             "motivation": "Moksha", "nature": "Sthira/Dhruva (Fixed/Permanent)",
@@ -703,9 +793,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Leo and Virgo ('The Latter Reddish One'). Represents commitments and unions (Aryaman). Sun lordship brings integrity. Virgo portion adds service and analysis.",
             "lal_kitab_note": "Governed by Sun. Sun's effect depends on House 1 ('Pakka Ghar'). Spans Sun (Leo) and Mercury (Virgo) Rasis. Good for commitment and service. Sun remedies may apply."
             },
-            {"num": 13, "name": "Hasta", "sanskrit": "Hasta", "devanagari": "हस्त", "lord": "Moon", "remainder": 3,
-            "deity": "Savitar (Sun God - Inspiration)", "symbol": "Hand", "start_degree": 160.0, "end_degree": 173.3333,
-            "padas_rashi": ["Virgo"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 13, "name": "Hasta", "sanskrit": "Hasta", "devanagari": "हस्त",
+            "deity": "Savitar (Sun God - Inspiration)", "symbol": "Hand",
             "syllables": ["पू (Pu)", "ष (Sha)", "ण (Na)", "ठ (Tha)"],
             "gana": "Deva (Divine)", "yoni": "Mahisha (Female Buffalo)", "nadi": "Adi (Vata)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Moksha", "nature": "Laghu/Kshipra (Light/Swift)",
@@ -713,9 +802,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents skill and manifestation ('The Hand'). Deity Savitar brings inspiration. Moon lordship gives dexterity and mental agility. Falls in analytical Virgo.",
             "lal_kitab_note": "Governed by Moon. Moon's effect depends on House 4 ('Pakka Ghar'). In Mercury's sign (Virgo). Excellent for skills and crafts. Remedies for Moon (serving mother) enhance benefits."
             },
-            {"num": 14, "name": "Chitra", "sanskrit": "Chitra", "devanagari": "चित्रा", "lord": "Mars", "remainder": 4, # Corrected Devanagari
-            "deity": "Tvashtar/Vishwakarma (Celestial Architect)", "symbol": "Bright Jewel, Pearl", "start_degree": 173.3333, "end_degree": 186.6666,
-            "padas_rashi": ["Virgo"]*2 + ["Libra"]*2, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 14, "name": "Chitra", "sanskrit": "Chitra", "devanagari": "चित्रा", # Corrected Devanagari
+            "deity": "Tvashtar/Vishwakarma (Celestial Architect)", "symbol": "Bright Jewel, Pearl",
             "syllables": ["पे (Pe)", "पो (Po)", "रा (Ra)", "री (Ri)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Vyaghra (Female Tiger)", "nadi": "Madhya (Pitta)", "guna": "Tamasic", "tattva": "Earth",
             "motivation": "Kama", "nature": "Mridu/Maitra (Soft/Friendly)",
@@ -723,9 +811,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Virgo and Libra ('The Star of Opportunity'). Symbol jewel represents brilliance. Deity Tvashtar brings skill in creation and maya (illusion). Mars lordship gives drive.",
             "lal_kitab_note": "Governed by Mars. Mars's effect depends on House 3/8 ('Pakka Ghar'). Spans Mercury (Virgo) and Venus (Libra) Rasis. Can give artistic talent and charisma. Mars remedies may apply."
             },
-            {"num": 15, "name": "Swati", "sanskrit": "Swati", "devanagari": "स्वाति", "lord": "Rahu", "remainder": 5,
-            "deity": "Vayu (Wind God)", "symbol": "Young Shoot swaying in wind, Coral, Sword", "start_degree": 186.6666, "end_degree": 200.0,
-            "padas_rashi": ["Libra"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 15, "name": "Swati", "sanskrit": "Swati", "devanagari": "स्वाति",
+            "deity": "Vayu (Wind God)", "symbol": "Young Shoot swaying in wind, Coral, Sword",
             "syllables": ["रू (Ru)", "रे (Re)", "रो (Ro)", "ता (Ta)"],
             "gana": "Deva (Divine)", "yoni": "Mahisha (Male Buffalo)", "nadi": "Antya (Kapha)", "guna": "Tamasic", "tattva": "Air",
             "motivation": "Artha", "nature": "Chara/Chala (Movable/Changing)",
@@ -733,9 +820,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents independence and movement ('The Independent One'). Deity Vayu signifies wind and change. Rahu lordship brings unconventionality and ambition. Falls in Libra (Venus).",
             "lal_kitab_note": "Governed by Rahu. Rahu's effect depends on House 12 ('Pakka Ghar'). In Venus's sign (Libra). Can give success in business/diplomacy but needs grounding. Rahu remedies may apply."
             },
-            {"num": 16, "name": "Vishakha", "sanskrit": "Vishakha", "devanagari": "विशाखा", "lord": "Jupiter", "remainder": 6,
-            "deity": "Indra-Agni (Chief & Fire God)", "symbol": "Triumphal Archway, Potter's Wheel", "start_degree": 200.0, "end_degree": 213.3333,
-            "padas_rashi": ["Libra"]*3 + ["Scorpio"]*1, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 16, "name": "Vishakha", "sanskrit": "Vishakha", "devanagari": "विशाखा",
+            "deity": "Indra-Agni (Chief & Fire God)", "symbol": "Triumphal Archway, Potter's Wheel",
             "syllables": ["ती (Ti)", "तू (Tu)", "ते (Te)", "तो (To)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Vyaghra (Male Tiger)", "nadi": "Antya (Kapha)", "guna": "Sattvic", "tattva": "Air",
             "motivation": "Dharma", "nature": "Misra/Sadharana (Mixed)",
@@ -743,9 +829,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Libra and Scorpio ('The Star of Purpose'). Symbol archway signifies focus on goals. Deities Indra-Agni bring power and drive. Jupiter lordship adds wisdom to ambition.",
             "lal_kitab_note": "Governed by Jupiter. Jupiter's effect depends on House 9 ('Pakka Ghar'). Spans Venus (Libra) and Mars (Scorpio) Rasis. Can give strong ambition. Jupiter remedies enhance benefits."
             },
-            {"num": 17, "name": "Anuradha", "sanskrit": "Anuradha", "devanagari": "अनुराधा", "lord": "Saturn", "remainder": 7,
-            "deity": "Mitra (God of Friendship/Partnership)", "symbol": "Triumphal Archway, Lotus Flower, Staff", "start_degree": 213.3333, "end_degree": 226.6666,
-            "padas_rashi": ["Scorpio"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 17, "name": "Anuradha", "sanskrit": "Anuradha", "devanagari": "अनुराधा",
+            "deity": "Mitra (God of Friendship/Partnership)", "symbol": "Triumphal Archway, Lotus Flower, Staff",
             "syllables": ["ना (Na)", "नी (Ni)", "नू (Nu)", "ने (Ne)"],
             "gana": "Deva (Divine)", "yoni": "Mriga (Female Deer)", "nadi": "Madhya (Pitta)", "guna": "Tamasic", "tattva": "Water",
             "motivation": "Dharma", "nature": "Mridu/Maitra (Soft/Friendly)",
@@ -753,9 +838,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents friendship and success through alliances ('The Star of Success'). Deity Mitra fosters cooperation. Saturn lordship brings structure and loyalty to relationships.",
             "lal_kitab_note": "Governed by Saturn. Saturn's effect depends on House 10 ('Pakka Ghar'). In Mars's sign (Scorpio). Can make one loyal but potentially rigid. Saturn remedies may be needed."
             },
-            {"num": 18, "name": "Jyestha", "sanskrit": "Jyestha", "devanagari": "ज्येष्ठा", "lord": "Mercury", "remainder": 8,
-            "deity": "Indra (Chief of Gods)", "symbol": "Earring, Umbrella, Talisman", "start_degree": 226.6666, "end_degree": 240.0,
-            "padas_rashi": ["Scorpio"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 18, "name": "Jyestha", "sanskrit": "Jyestha", "devanagari": "ज्येष्ठा",
+            "deity": "Indra (Chief of Gods)", "symbol": "Earring, Umbrella, Talisman",
             "syllables": ["नो (No)", "या (Ya)", "यी (Yi)", "यू (Yu)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Mriga (Male Deer)", "nadi": "Adi (Vata)", "guna": "Sattvic", "tattva": "Water",
             "motivation": "Artha", "nature": "Tikshna/Daruna (Sharp/Dreadful)",
@@ -763,9 +847,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents seniority and authority ('The Eldest'). Deity Indra brings power but also potential conflict. Mercury lordship gives strategic intellect. A Gandanta point ends here.",
             "lal_kitab_note": "Governed by Mercury. Mercury's effect depends on House 7 ('Pakka Ghar'). In Mars's sign (Scorpio). Can indicate struggles for seniority or clever strategies. Mercury remedies may apply."
             },
-            {"num": 19, "name": "Mula", "sanskrit": "Mula", "devanagari": "मूल", "lord": "Ketu", "remainder": 0,
-            "deity": "Nirriti (Goddess of Destruction/Dissolution)", "symbol": "Bundle of Roots tied together, Elephant Goad", "start_degree": 240.0, "end_degree": 253.3333,
-            "padas_rashi": ["Sagittarius"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 19, "name": "Mula", "sanskrit": "Mula", "devanagari": "मूल",
+            "deity": "Nirriti (Goddess of Destruction/Dissolution)", "symbol": "Bundle of Roots tied together, Elephant Goad",
             "syllables": ["ये (Ye)", "यो (Yo)", "भा (Bha)", "भी (Bhi)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Shwana (Male Dog)", "nadi": "Adi (Vata)", "guna": "Tamasic", "tattva": "Fire",
             "motivation": "Kama", "nature": "Tikshna/Daruna (Sharp/Dreadful)",
@@ -773,9 +856,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents the root or core ('The Root'). Deity Nirriti signifies destruction of illusion to find truth. Ketu lordship connects to past lives and deep investigation. A Gandanta point starts here.",
             "lal_kitab_note": "Governed by Ketu. Ketu's effect depends on House 6 ('Pakka Ghar'). In Jupiter's sign (Sagittarius). Can indicate deep investigation or disruption. Ketu remedies (dogs) important."
             },
-            {"num": 20, "name": "Purva Ashadha", "sanskrit": "Purva Ashadha", "devanagari": "पूर्वाषाढ़ा", "lord": "Venus", "remainder": 1,
-            "deity": "Apas (God of Waters)", "symbol": "Elephant Tusk, Fan, Winnowing Basket", "start_degree": 253.3333, "end_degree": 266.6666,
-            "padas_rashi": ["Sagittarius"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 20, "name": "Purva Ashadha", "sanskrit": "Purva Ashadha", "devanagari": "पूर्वाषाढ़ा",
+            "deity": "Apas (God of Waters)", "symbol": "Elephant Tusk, Fan, Winnowing Basket",
             "syllables": ["भू (Bhu)", "धा (Dha)", "फा (Pha)", "ढा (Dha)"], # Note: Pha/Fa are often used interchangeably
             "gana": "Manushya (Human)", "yoni": "Vanara (Male Monkey)", "nadi": "Madhya (Pitta)", "guna": "Rajasic", "tattva": "Fire",
             "motivation": "Moksha", "nature": "Ugra/Krura (Fierce/Cruel)",
@@ -783,9 +865,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents early victory or declaration ('The Invincible Star'). Deity Apas brings purification and flow. Venus lordship gives charm and popularity.",
             "lal_kitab_note": "Governed by Venus. Venus's effect depends on House 7 ('Pakka Ghar'). In Jupiter's sign (Sagittarius). Can give popularity and optimism. Venus remedies may apply."
             },
-            {"num": 21, "name": "Uttara Ashadha", "sanskrit": "Uttara Ashadha", "devanagari": "उत्तराषाढ़ा", "lord": "Sun", "remainder": 2,
-            "deity": "Vishvadevas (Universal Gods)", "symbol": "Elephant Tusk, Planks of a Bed", "start_degree": 266.6666, "end_degree": 280.0,
-            "padas_rashi": ["Sagittarius"]*1 + ["Capricorn"]*3, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 21, "name": "Uttara Ashadha", "sanskrit": "Uttara Ashadha", "devanagari": "उत्तराषाढ़ा",
+            "deity": "Vishvadevas (Universal Gods)", "symbol": "Elephant Tusk, Planks of a Bed",
             "syllables": ["भे (Bhe)", "भो (Bho)", "जा (Ja)", "जी (Ji)"],
             "gana": "Manushya (Human)", "yoni": "Nakula (Male Mongoose)", "nadi": "Antya (Kapha)", "guna": "Sattvic", "tattva": "Fire",
             "motivation": "Moksha", "nature": "Sthira/Dhruva (Fixed/Permanent)",
@@ -793,9 +874,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Sagittarius and Capricorn ('The Universal Star'). Represents lasting achievement and duty. Sun lordship gives leadership. Capricorn portion adds structure and discipline.",
             "lal_kitab_note": "Governed by Sun. Sun's effect depends on House 1 ('Pakka Ghar'). Spans Jupiter (Sagittarius) and Saturn (Capricorn) Rasis. Can give leadership roles. Sun remedies may apply."
             },
-            {"num": 22, "name": "Shravana", "sanskrit": "Shravana", "devanagari": "श्रवण", "lord": "Moon", "remainder": 3,
-            "deity": "Vishnu (Preserver)", "symbol": "Ear, Three Footprints", "start_degree": 280.0, "end_degree": 293.3333,
-            "padas_rashi": ["Capricorn"]*4, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 22, "name": "Shravana", "sanskrit": "Shravana", "devanagari": "श्रवण",
+            "deity": "Vishnu (Preserver)", "symbol": "Ear, Three Footprints",
             "syllables": ["खी (Khi)", "खू (Khu)", "खे (Khe)", "खो (Kho)"],
             "gana": "Deva (Divine)", "yoni": "Vanara (Female Monkey)", "nadi": "Antya (Kapha)", "guna": "Rajasic", "tattva": "Earth",
             "motivation": "Artha", "nature": "Chara/Chala (Movable/Changing)",
@@ -803,9 +883,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents hearing and learning ('The Star of Learning'). Symbol ear emphasizes listening. Deity Vishnu links to preservation of knowledge. Moon lordship gives receptivity.",
             "lal_kitab_note": "Governed by Moon. Moon's effect depends on House 4 ('Pakka Ghar'). In Saturn's sign (Capricorn). Can indicate learning from tradition but potential emotional dryness. Moon remedies may apply."
             },
-            {"num": 23, "name": "Dhanishta", "sanskrit": "Dhanishta", "devanagari": "धनिष्ठा", "lord": "Mars", "remainder": 4,
-            "deity": "Ashta Vasus (Eight Gods of Abundance)", "symbol": "Drum (Damaru), Flute", "start_degree": 293.3333, "end_degree": 306.6666,
-            "padas_rashi": ["Capricorn"]*2 + ["Aquarius"]*2, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 23, "name": "Dhanishta", "sanskrit": "Dhanishta", "devanagari": "धनिष्ठा",
+            "deity": "Ashta Vasus (Eight Gods of Abundance)", "symbol": "Drum (Damaru), Flute",
             "syllables": ["गा (Ga)", "गी (Gi)", "गू (Gu)", "गे (Ge)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Simha (Female Lion)", "nadi": "Madhya (Pitta)", "guna": "Tamasic", "tattva": "Earth",
             "motivation": "Dharma", "nature": "Chara/Chala (Movable/Changing)",
@@ -813,9 +892,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Capricorn and Aquarius ('The Star of Symphony'). Represents wealth and rhythm. Deities Vasus bring abundance. Mars lordship gives energy. Aquarius portion adds collective focus.",
             "lal_kitab_note": "Governed by Mars. Mars's effect depends on House 3/8 ('Pakka Ghar'). Spans Saturn's signs (Capricorn/Aquarius). Can bring wealth through effort. Mars remedies may apply."
             },
-            {"num": 24, "name": "Shatabhisha", "sanskrit": "Shatabhisha", "devanagari": "शतभिषा", "lord": "Rahu", "remainder": 5,
-            "deity": "Varuna (God of Cosmic Waters/Sky)", "symbol": "Empty Circle, 100 Physicians/Flowers/Stars", "start_degree": 306.6666, "end_degree": 320.0,
-            "padas_rashi": ["Aquarius"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 24, "name": "Shatabhisha", "sanskrit": "Shatabhisha", "devanagari": "शतभिषा",
+            "deity": "Varuna (God of Cosmic Waters/Sky)", "symbol": "Empty Circle, 100 Physicians/Flowers/Stars",
             "syllables": ["गो (Go)", "सा (Sa)", "सी (Si)", "सू (Su)"],
             "gana": "Rakshasa (Demonic)", "yoni": "Ashwa (Female Horse)", "nadi": "Adi (Vata)", "guna": "Tamasic", "tattva": "Air",
             "motivation": "Dharma", "nature": "Chara/Chala (Movable/Changing)",
@@ -823,9 +901,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents healing on a large scale ('The Veiling Star' or '100 Healers'). Deity Varuna brings cosmic law and mystery. Rahu lordship emphasizes secrets, technology, and unconventional approaches.",
             "lal_kitab_note": "Governed by Rahu. Rahu's effect depends on House 12 ('Pakka Ghar'). In Saturn's sign (Aquarius). Can indicate healing abilities, foreign connections, or secrets. Rahu remedies crucial."
             },
-            {"num": 25, "name": "Purva Bhadrapada", "sanskrit": "Purva Bhadrapada", "devanagari": "पूर्व भाद्रपद", "lord": "Jupiter", "remainder": 6,
-            "deity": "Aja Ekapada (One-footed Goat/Form of Shiva)", "symbol": "Front legs of a Funeral Cot, Man with Two Faces, Sword", "start_degree": 320.0, "end_degree": 333.3333,
-            "padas_rashi": ["Aquarius"]*3 + ["Pisces"]*1, "padas_navamsha": ["Aries", "Taurus", "Gemini", "Cancer"],
+            {"num": 25, "name": "Purva Bhadrapada", "sanskrit": "Purva Bhadrapada", "devanagari": "पूर्व भाद्रपद",
+            "deity": "Aja Ekapada (One-footed Goat/Form of Shiva)", "symbol": "Front legs of a Funeral Cot, Man with Two Faces, Sword",
             "syllables": ["से (Se)", "सो (So)", "दा (Da)", "दी (Di)"],
             "gana": "Manushya (Human)", "yoni": "Simha (Male Lion)", "nadi": "Adi (Vata)", "guna": "Sattvic", "tattva": "Air",
             "motivation": "Artha", "nature": "Ugra/Krura (Fierce/Cruel)",
@@ -833,9 +910,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Bridging Aquarius and Pisces ('The Former Lucky Feet'). Represents intense, fiery energy. Deity Aja Ekapada signifies penance and transformation. Jupiter lordship adds philosophical depth.",
             "lal_kitab_note": "Governed by Jupiter. Jupiter's effect depends on House 9 ('Pakka Ghar'). Spans Saturn (Aquarius) and Jupiter (Pisces) Rasis. Can give intense nature. Jupiter remedies enhance benefits."
             },
-            {"num": 26, "name": "Uttara Bhadrapada", "sanskrit": "Uttara Bhadrapada", "devanagari": "उत्तर भाद्रपद", "lord": "Saturn", "remainder": 7,
-            "deity": "Ahir Budhnya (Serpent of the Deep)", "symbol": "Back legs of a Funeral Cot, Twins, Serpent in Water", "start_degree": 333.3333, "end_degree": 346.6666,
-            "padas_rashi": ["Pisces"]*4, "padas_navamsha": ["Leo", "Virgo", "Libra", "Scorpio"],
+            {"num": 26, "name": "Uttara Bhadrapada", "sanskrit": "Uttara Bhadrapada", "devanagari": "उत्तर भाद्रपद",
+            "deity": "Ahir Budhnya (Serpent of the Deep)", "symbol": "Back legs of a Funeral Cot, Twins, Serpent in Water",
             "syllables": ["दू (Du)", "थ (Tha)", "झ (Jha)", "ञ (Na)"], # Some use 'Da' or 'Nya' for last
             "gana": "Manushya (Human)", "yoni": "Go (Female Cow)", "nadi": "Madhya (Pitta)", "guna": "Tamasic", "tattva": "Water",
             "motivation": "Kama", "nature": "Sthira/Dhruva (Fixed/Permanent)",
@@ -843,9 +919,8 @@ class EnhancedAstrologicalData:
             "bphs_note": "Represents deep wisdom and stability ('The Latter Lucky Feet'). Deity Ahir Budhnya brings kundalini energy and depth. Saturn lordship gives discipline and patience.",
             "lal_kitab_note": "Governed by Saturn. Saturn's effect depends on House 10 ('Pakka Ghar'). In Jupiter's sign (Pisces). Can give deep wisdom but requires patience. Saturn remedies may apply."
             },
-            {"num": 27, "name": "Revati", "sanskrit": "Revati", "devanagari": "रेवती", "lord": "Mercury", "remainder": 8,
-            "deity": "Pushan (Nourisher, Protector of Travelers/Flocks)", "symbol": "Fish swimming in the sea, Drum", "start_degree": 346.6666, "end_degree": 360.0,
-            "padas_rashi": ["Pisces"]*4, "padas_navamsha": ["Sagittarius", "Capricorn", "Aquarius", "Pisces"],
+            {"num": 27, "name": "Revati", "sanskrit": "Revati", "devanagari": "रेवती",
+            "deity": "Pushan (Nourisher, Protector of Travelers/Flocks)", "symbol": "Fish swimming in the sea, Drum",
             "syllables": ["दे (De)", "दो (Do)", "चा (Cha)", "ची (Chi)"],
             "gana": "Deva (Divine)", "yoni": "Gaja (Female Elephant)", "nadi": "Antya (Kapha)", "guna": "Sattvic", "tattva": "Water",
             "motivation": "Moksha", "nature": "Mridu/Maitra (Soft/Friendly)",
@@ -854,20 +929,55 @@ class EnhancedAstrologicalData:
             "lal_kitab_note": "Governed by Mercury. Mercury's effect depends on House 7 ('Pakka Ghar'). In Jupiter's sign (Pisces). Often considered good for wealth and protection. Mercury remedies may apply."
             }
         ]
-        
-    
+        # Every nakshatra spans exactly 13°20' (360/27), so the bounds are computed
+        # rather than typed in as rounded literals (13.3333, 26.6666, ...).
+        # Lords repeat every 9 nakshatras in Vimshottari order ('remainder' is the
+        # position in that cycle). Each nakshatra has 4 padas of 3°20', and 9 padas
+        # fill a Rashi, so a pada's Rashi follows from its overall index. The
+        # Navamshas repeat every 3 nakshatras, so those rows share one tuple.
+        signs = EnhancedAstrologicalData.SIGNS
+        for index, nak in enumerate(nakshatras):
+            nak["lord"] = _VIMSHOTTARI_LORDS[index % 9]
+            nak["remainder"] = index % 9
+            nak["start_degree"] = index * 360 / 27
+            nak["end_degree"] = (index + 1) * 360 / 27
+            nak["padas_rashi"] = tuple(signs[pada // 9 + 1] for pada in range(index * 4, index * 4 + 4))
+            nak["padas_navamsha"] = _NAVAMSHA_PADA_CYCLE[index % 3]
+        return _freeze(nakshatras)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_nakshatra_starts() -> Tuple[float, ...]:
+        """
+        Returns the 'start_degree' of each nakshatra, sorted and in
+        get_all_nakshatras() order, for binary search in nakshatra_at().
+        """
+        return tuple(nak['start_degree'] for nak in EnhancedAstrologicalData.get_all_nakshatras())
+
+    @staticmethod
+    def nakshatra_at(longitude: float) -> Mapping[str, Any]:
+        """Returns the nakshatra containing a sidereal longitude, by binary search over its bounds."""
+        index = bisect_right(EnhancedAstrologicalData.NAKSHATRA_STARTS, longitude % 360.0) - 1
+        return EnhancedAstrologicalData.NAKSHATRAS[index]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_nakshatras_by_name() -> Mapping[str, Mapping[str, Any]]:
+        """Returns the get_all_nakshatras() entries keyed by nakshatra name, for O(1) lookups."""
+        return MappingProxyType({nak['name']: nak for nak in EnhancedAstrologicalData.get_all_nakshatras()})
     
     @staticmethod
-    def get_all_rashis() -> List[Dict[str, Any]]:
+    @lru_cache(maxsize=1)
+    def get_all_rashis() -> Tuple[Mapping[str, Any], ...]:
         """
         Returns a list of all 12 Rashis (Zodiac Signs) with their
         key attributes (lord, element, modality) and advanced
         details from BPHS and Lal Kitab.
 
         Returns:
-            list: A list of dictionaries, where each dictionary is a rashi.
+            tuple: A tuple of read-only mappings, one per rashi.
         """
-        return [
+        return _freeze([
             {"name": "Aries", "sanskrit": "Mesha", "devanagari": "मेष", "lord": "Mars", "tattva": "Fire (Agni)",
             "modality": "Movable (Chara)", "gender": "Male (Odd)", "kalapurusha": "Head", "rising": "Shirshodaya (Rises with Head)",
             "nature": "Kshatriya (Warrior), Quadruped", "direction": "East",
@@ -1000,7 +1110,13 @@ class EnhancedAstrologicalData:
             "lal_kitab_note": "Energy of House 12. Represents expenses, spirituality, and 'Moksha' (liberation). Venus' exaltation ('Uchcha Shukra') here gives high-end luxury and sensual pleasures.",
             "description": "Represents spirituality, dissolution, compassion, and universal consciousness."
             }
-        ]
+        ])
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_rashis_by_name() -> Mapping[str, Mapping[str, Any]]:
+        """Returns the get_all_rashis() entries keyed by rashi name, for O(1) lookups."""
+        return MappingProxyType({rashi['name']: rashi for rashi in EnhancedAstrologicalData.get_all_rashis()})
 
 
 
@@ -1018,18 +1134,46 @@ class InterpretationEngine:
         "Mercury_Direct": 14.0,
         "Mercury_Retrograde": 12.0
     }
+    # Orb by (planet, moving direct); anything not listed uses DEFAULT_COMBUSTION_ORB
+    COMBUSTION_ORB_BY_MOTION: Mapping[Tuple[str, bool], float] = MappingProxyType({
+        ("Venus", True): COMBUSTION_ORBS_SPECIAL["Venus"],
+        ("Venus", False): COMBUSTION_ORBS_SPECIAL["Venus"],
+        ("Mercury", True): COMBUSTION_ORBS_SPECIAL["Mercury_Direct"],
+        ("Mercury", False): COMBUSTION_ORBS_SPECIAL["Mercury_Retrograde"],
+    })
+    # What each house signifies, used as context in the planet-in-house analysis
+    HOUSE_SIGNIFICATIONS: Mapping[int, str] = MappingProxyType({
+        1: "self, physical body, personality, and life's path", 2: "wealth, family, speech, and resources",
+        3: "courage, siblings, communication, and self-efforts", 4: "mother, home, happiness, and property",
+        5: "children, intellect, creativity, and past-life merits", 6: "enemies, health, service, and obstacles",
+        7: "spouse, partnerships, and public image", 8: "longevity, hidden matters, inheritance, and transformation",
+        9: "father, guru, fortune, and higher knowledge (dharma)", 10: "career, public status, and actions (karma)",
+        11: "gains, income, elder siblings, and desires", 12: "losses, expenses, spirituality, and liberation (moksha)"
+    })
+    # Ordinal suffix indexed by n % 100: 1st, 2nd, 3rd, 4th ... 11th, 12th, 13th ... 21st ...
+    ORDINAL_SUFFIXES: Tuple[str, ...] = tuple(
+        "th" if 11 <= n <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th") for n in range(100)
+    )
 
     def __init__(self, app_instance: 'AstroVighatiElite') -> None:
         self.app = app_instance
         # --- Cache data for fast lookups ---
-        self.planet_data_cache = {p['name']: p for p in self.app.astro_data.get_all_planets()}
-        self.rashi_data_cache = {r['name']: r for r in self.app.astro_data.get_all_rashis()}
+        self.planet_data_cache = self.app.astro_data.get_planets_by_name()
+        self.rashi_data_cache = self.app.astro_data.get_rashis_by_name()
+        # Only 9 planets x 12 signs exist, so every sign analysis is built up front
+        self._sign_analysis: Dict[Tuple[str, str], str] = {
+            (planet_name, sign_name): self._build_planet_in_sign_analysis(planet_name, sign_name)
+            for planet_name in self.planet_data_cache for sign_name in self.rashi_data_cache
+        }
         
         # --- Enhanced Knowledge Bases ---
         self._init_bphs_kb()
         self._init_lk_kb()
         self._init_conjunction_kb()
 
+    # The analysis depends only on its arguments and the static knowledge bases,
+    # and the app keeps one engine for its lifetime, so results are memoized.
+    @lru_cache(maxsize=2048)
     def get_planet_in_house_analysis(self, planet_name: str, house_num: int, varga_num: int = 1) -> str:
         """
         Provides detailed BPHS & Lal Kitab interpretation for a planet in a house,
@@ -1037,30 +1181,15 @@ class InterpretationEngine:
         """
         # 1. Get Varga Context
         varga_key = f"D{varga_num}"
-        varga_info = self.app.astro_data.get_varga_descriptions().get(varga_key, {})
-        if not varga_info:
-            for key, info in self.app.astro_data.get_varga_descriptions().items():
-                if key.startswith(varga_key):
-                    varga_info = info; break
+        varga_info = self.app.astro_data.VARGA_BY_CODE.get(varga_key, {})
         varga_context = varga_info.get("title", f"D{varga_num} chart")
         domain_text = varga_info.get("domain", "this area of life")
 
         # 2. Get House Context
-        house_significations: Dict[int, str] = {
-            1: "self, physical body, personality, and life's path", 2: "wealth, family, speech, and resources",
-            3: "courage, siblings, communication, and self-efforts", 4: "mother, home, happiness, and property",
-            5: "children, intellect, creativity, and past-life merits", 6: "enemies, health, service, and obstacles",
-            7: "spouse, partnerships, and public image", 8: "longevity, hidden matters, inheritance, and transformation",
-            9: "father, guru, fortune, and higher knowledge (dharma)", 10: "career, public status, and actions (karma)",
-            11: "gains, income, elder siblings, and desires", 12: "losses, expenses, spirituality, and liberation (moksha)"
-        }
-        house_text = house_significations.get(house_num, "an unknown area")
+        house_text = self.HOUSE_SIGNIFICATIONS.get(house_num, "an unknown area")
 
         # 3. Get Suffix
-        house_suffix = "th"
-        if house_num in [1, 21]: house_suffix = "st"
-        elif house_num in [2, 22]: house_suffix = "nd"
-        elif house_num in [3, 23]: house_suffix = "rd"
+        house_suffix = self.ORDINAL_SUFFIXES[house_num % 100]
 
         # 4. Generate Analysis
         # --- For D1, provide detailed BPHS and Lal Kitab ---
@@ -1087,6 +1216,10 @@ class InterpretationEngine:
         Provides detailed BPHS interpretation for a planet in a sign,
         including dignity and elemental/modal interaction.
         """
+        return self._sign_analysis.get((planet_name, sign_name), "Analysis not available.")
+
+    def _build_planet_in_sign_analysis(self, planet_name: str, sign_name: str) -> str:
+        """Builds the text returned by get_planet_in_sign_analysis (run once per pair in __init__)."""
         planet_data = self.planet_data_cache.get(planet_name)
         sign_data = self.rashi_data_cache.get(sign_name)
         if not planet_data or not sign_data: return "Analysis not available."
@@ -1143,21 +1276,26 @@ class InterpretationEngine:
             analysis.append(f"**Retrograde (Vakri)**:\n  • **BPHS**: {bphs_retro}\n  • **Lal Kitab**: {lk_retro}")
 
         # 2. Combustion Check
-        if planet_name != "Sun":
-            combustion_orb = self.DEFAULT_COMBUSTION_ORB
-            if planet_name == "Venus": combustion_orb = self.COMBUSTION_ORBS_SPECIAL["Venus"]
-            elif planet_name == "Mercury": combustion_orb = self.COMBUSTION_ORBS_SPECIAL["Mercury_Direct"] if speed > 0 else self.COMBUSTION_ORBS_SPECIAL["Mercury_Retrograde"]
-
-            separation = abs(planet_longitude - sun_longitude)
-            if separation > 180: separation = 360 - separation
-
-            if separation <= combustion_orb:
-                bphs_comb = f"Combust (Asta). Within {combustion_orb:.1f}°, {planet_name}'s significations (e.g., intellect for Mercury, love for Venus) are 'burnt' or overpowered by the Sun's ego. The planet loses its independent power and acts as an agent for the Sun."
-                lk_comb = f"The planet is 'Ast' (Combust) or 'sleeping'. Its results are weakened or merged with the Sun. It may require remedies (upay) to 'awaken' it or separate its effect from the Sun's."
-                analysis.append(f"**Combust (Asta)**:\n  • **BPHS**: {bphs_comb}\n  • **Lal Kitab**: {lk_comb}")
+        if self.is_combust(planet_name, speed, sun_longitude, planet_longitude):
+            combustion_orb = self.COMBUSTION_ORB_BY_MOTION.get((planet_name, speed > 0), self.DEFAULT_COMBUSTION_ORB)
+            bphs_comb = f"Combust (Asta). Within {combustion_orb:.1f}°, {planet_name}'s significations (e.g., intellect for Mercury, love for Venus) are 'burnt' or overpowered by the Sun's ego. The planet loses its independent power and acts as an agent for the Sun."
+            lk_comb = f"The planet is 'Ast' (Combust) or 'sleeping'. Its results are weakened or merged with the Sun. It may require remedies (upay) to 'awaken' it or separate its effect from the Sun's."
+            analysis.append(f"**Combust (Asta)**:\n  • **BPHS**: {bphs_comb}\n  • **Lal Kitab**: {lk_comb}")
 
         return "\n\n".join(analysis) if analysis else ""
 
+    def is_combust(self, planet_name: str, speed: float, sun_longitude: float, planet_longitude: float) -> bool:
+        """
+        True if the planet lies within its combustion orb of the Sun. The Sun itself
+        and the nodes are never combust. Tables that only show a "C" flag use this
+        instead of building the full special-state analysis text.
+        """
+        if planet_name in ("Sun", "Rahu", "Ketu"):
+            return False
+        separation = abs(planet_longitude - sun_longitude)
+        if separation > 180: separation = 360 - separation
+        return separation <= self.COMBUSTION_ORB_BY_MOTION.get((planet_name, speed > 0), self.DEFAULT_COMBUSTION_ORB)
+
     def get_conjunction_analysis(self, planets_in_house: List[Dict[str, Any]]) -> str:
         """
         Provides detailed BPHS & Lal Kitab interpretations for planetary conjunctions.
@@ -1166,17 +1304,15 @@ class InterpretationEngine:
         planet_names = sorted([p['name'] for p in planets_in_house])
         
         analysis: List[str] = []
-        # Find all 2-planet pairs within the house
-        for i in range(len(planet_names)):
-            for j in range(i + 1, len(planet_names)):
-                pair = (planet_names[i], planet_names[j])
-                if pair in self.conjunction_kb:
-                    yoga = self.conjunction_kb[pair]
-                    analysis.append(
-                        f"**{yoga['name']} ({pair[0]}/{pair[1]})**:\n"
-                        f"  • **BPHS**: {yoga['bphs']}\n"
-                        f"  • **Lal Kitab**: {yoga['lk']}"
-                    )
+        # Find all 2-planet pairs within the house (sorted names keep the display order stable)
+        for pair in combinations(planet_names, 2):
+            yoga = self.conjunction_kb.get(frozenset(pair))
+            if yoga:
+                analysis.append(
+                    f"**{yoga['name']} ({pair[0]}/{pair[1]})**:\n"
+                    f"  • **BPHS**: {yoga['bphs']}\n"
+                    f"  • **Lal Kitab**: {yoga['lk']}"
+                )
         
         if analysis:
             header = f"**Planetary Yogas/Conjunctions in this House:**\n"
@@ -1451,7 +1587,7 @@ class InterpretationEngine:
 
     def _init_conjunction_kb(self):
         """Initializes the BPHS/Lal Kitab conjunction knowledge base."""
-        self.conjunction_kb = {
+        conjunctions = {
             ('Mercury', 'Sun'): {
                 "name": "Budhaditya Yoga",
                 "bphs": "A yoga for high intelligence, skill, and reputation. (Check combustion).",
@@ -1513,6 +1649,10 @@ class InterpretationEngine:
                 "lk": "'Grahan' (Eclipse). Bad for father and progeny (son). Can cause health issues. Remedies: Feed monkeys (Sun), help son/nephew (Ketu)."
             }
         }
+        # Keyed by planet set, so a pair matches however it was written above
+        self.conjunction_kb: Dict[FrozenSet[str], Dict[str, str]] = {
+            frozenset(pair): yoga for pair, yoga in conjunctions.items()
+        }
 
 #===================================================================================================
 # ASTRONOMICAL & VARGA CALCULATORS
@@ -1671,24 +1811,10 @@ class AstronomicalCalculator:
         degree_in_rashi = longitude % 30
 
         # 3. Find Nakshatra
-        nakshatra_name = "Unknown"
-        nakshatra_lord = "N/A"
-        for nak in EnhancedAstrologicalData.get_all_nakshatras():
-            start_deg = nak['start_degree']
-            end_deg = nak['end_degree']
-
-            # This logic handles the 360/0 degree wrap-around
-            # (e.g., for Revati, which starts at 346.66 and ends at 360/0)
-            if start_deg > end_deg: # This is the wrap-around case
-                if longitude >= start_deg or longitude < end_deg:
-                    nakshatra_name = nak['name']
-                    nakshatra_lord = nak['lord']
-                    break
-            else: # This is the normal case
-                if start_deg <= longitude < end_deg:
-                    nakshatra_name = nak['name']
-                    nakshatra_lord = nak['lord']
-                    break
+        #    Binary search over the 27 exact 13°20' bounds; wrap-around is handled by % 360.
+        nak = EnhancedAstrologicalData.nakshatra_at(longitude)
+        nakshatra_name = nak['name']
+        nakshatra_lord = nak['lord']
 
         # 4. Format for display
         dms_str = decimal_to_dms(degree_in_rashi)
@@ -1738,6 +1864,8 @@ class VargaCalculator:
         """
         lon_in_sign = d1_longitude_in_sign
         sign = d1_sign_num
+        # Odd/Even sign nature is plain parity: Aries (1) is odd, Taurus (2) even, ...
+        odd_sign = bool(sign & 1)
         new_sign: int = 1
         new_lon: float = 0.0
 
@@ -1751,8 +1879,7 @@ class VargaCalculator:
             new_lon = (lon_in_sign % division_size) * 2 # Stretch 15° back to 30°
             # Odd signs (1, 3, 5...): 1st Hora is Sun (Leo), 2nd is Moon (Cancer)
             # Even signs (2, 4, 6...): 1st Hora is Moon (Cancer), 2nd is Sun (Leo)
-            if (EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd' and amsa == 0) or \
-               (EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Even' and amsa == 1):
+            if (odd_sign and amsa == 0) or (not odd_sign and amsa == 1):
                 return 5, new_lon, "Sun's Hora" # Leo
             else:
                 return 4, new_lon, "Moon's Hora" # Cancer
@@ -1782,7 +1909,7 @@ class VargaCalculator:
             amsa = math.floor(lon_in_sign / division_size) # 0-6
             new_lon = (lon_in_sign % division_size) * 7
             # Odd signs: Counting starts from the sign itself
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 new_sign = (sign + amsa - 1) % 12 + 1
             # Even signs: Counting starts from the 7th sign from it
             else:
@@ -1807,7 +1934,7 @@ class VargaCalculator:
             amsa = math.floor(lon_in_sign / division_size) # 0-9
             new_lon = (lon_in_sign % division_size) * 10
             # Odd signs: Counting starts from the sign itself
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 new_sign = (sign + amsa - 1) % 12 + 1
             # Even signs: Counting starts from the 9th sign from it
             else:
@@ -1855,7 +1982,7 @@ class VargaCalculator:
             # This rule, used by JHora, counts forward for odd
             # signs and in reverse for even signs.
             
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 # Odd signs: Start from Leo (5) and count FORWARD
                 start_sign = 5
                 new_sign = (start_sign + amsa - 1) % 12 + 1
@@ -1876,7 +2003,7 @@ class VargaCalculator:
             
             new_lon: float = 0.0
             
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 if 0 <= lon_in_sign < 5: 
                     new_sign = 1  # Aries (Mars)
                     # Zone: 0-5 (Size=5). Find % into this 5-degree zone.
@@ -1944,7 +2071,7 @@ class VargaCalculator:
             amsa = math.floor(lon_in_sign / division_size)
             new_lon = (lon_in_sign % division_size) * 45
             # Odd signs: Counting starts from the sign itself
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 new_sign = (sign + amsa - 1) % 12 + 1
             # Even signs: Counting starts from the 5th sign from it
             else:
@@ -1966,7 +2093,7 @@ class VargaCalculator:
 
             # Determine the D-60 Sign based on the JHora rule
             start_sign: int
-            if EnhancedAstrologicalData.SIGN_NATURE[sign] == 'Odd':
+            if odd_sign:
                 # Odd D-1 signs: Count starts from Aries (Sign 1)
                 start_sign = 1
             else:
@@ -2175,7 +2302,7 @@ class EnhancedThemeManager:
                         )
 
                 # Apply to all Listbox widgets
-                for widget_name in ['nak_listbox', 'rashi_listbox', 'planet_listbox']:
+                for widget_name in ['rashi_listbox', 'planet_listbox']:
                     if hasattr(tab, widget_name):
                         widget = getattr(tab, widget_name)
                         widget.config(
@@ -2240,6 +2367,7 @@ class AstroVighatiElite:
         # --- 5. UI Initialization ---
         self.create_status_bar()
         self.create_main_notebook()
+        configure_explorer_styles()  # Shared styles for the explorer tabs, set up once
         self.create_tabs()  # This will populate all the self.xxx_tab variables
         self.create_menu()
 
@@ -2302,7 +2430,7 @@ class AstroVighatiElite:
         # --- Theme Menu ---
         theme_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Theme", menu=theme_menu)
-        for theme_name in EnhancedThemeManager.THEMES.keys():
+        for theme_name in EnhancedThemeManager.THEMES:
             theme_menu.add_radiobutton(
                 label=theme_name,
                 variable=self.current_theme,
@@ -2792,7 +2920,7 @@ class ResultsPanel(ttk.Frame):
         ttk.Label(varga_control_frame, text="Select Chart:", style="Kundli.TLabel").pack(pady=(0, 5), anchor='w')
         
         varga_combo = ttk.Combobox(varga_control_frame, textvariable=self.varga_var,
-                                   values=list(self.varga_map.keys()), state="readonly",
+                                   values=list(self.varga_map), state="readonly",
                                    width=30, font=('Segoe UI', 10))
         varga_combo.pack(pady=(0,5), fill='x', ipady=4)
         varga_combo.set("D1 - Rashi")
@@ -2949,7 +3077,7 @@ class ResultsPanel(ttk.Frame):
                 if speed < 0 and planet_name not in ["Rahu", "Ketu"]:
                     state_list.append("R")
                 
-                if self.app.interpreter.get_special_state_analysis(planet_name, speed, sun_longitude, pos_data['longitude']).count("Combust"):
+                if self.app.interpreter.is_combust(planet_name, speed, sun_longitude, pos_data['longitude']):
                     state_list.append("C")
 
                 state_prefix = f"[{', '.join(state_list)}]" if state_list else ""
@@ -3109,17 +3237,12 @@ class ResultsPanel(ttk.Frame):
         self.varga_desc_text.config(state='normal')
         self.varga_desc_text.delete('1.0', tk.END)
         
-        all_descs = self.app.astro_data.get_varga_descriptions()
+        all_descs = self.app.astro_data.VARGA_DESCRIPTIONS
+        descs_by_code = self.app.astro_data.VARGA_BY_CODE
         
-        for key in self.varga_map.keys():
-            full_key = key
-            if full_key not in all_descs:
-                varga_num_str = key.split(' ')[0]
-                for desc_key in all_descs.keys():
-                    if desc_key.startswith(varga_num_str):
-                        full_key = desc_key; break
-            
-            desc_data = all_descs.get(full_key)
+        for key in self.varga_map:
+            # Fall back to the bare "Dn" code if the display name differs from the table key
+            desc_data = all_descs.get(key) or descs_by_code.get(key.split(' ')[0])
             if desc_data:
                 self.varga_desc_text.insert(tk.END, f"{desc_data['title'].upper()}\n", "header")
                 self.varga_desc_text.insert(tk.END, f"Primary Domain: {desc_data.get('domain', 'N/A')}\n", "domain")
@@ -3641,7 +3764,7 @@ class EnhancedVighatiTab(ttk.Frame):
 
             # Set Nakshatra
             moon_nak_name = moon_nak_name_raw.split('. ')[-1] if '. ' in moon_nak_name_raw else moon_nak_name_raw
-            moon_nak_info = next((n for n in self.nakshatras if n.get('name') == moon_nak_name), None)
+            moon_nak_info = self.app.astro_data.get_nakshatras_by_name().get(moon_nak_name)
             if moon_nak_info:
                  listbox_value = f"{moon_nak_info.get('num', '?')}. {moon_nak_info['name']} ({moon_nak_info.get('devanagari', '')})"
                  if listbox_value in self.nak_combo['values']:
@@ -3888,9 +4011,10 @@ class TransitCalculatorTab(ttk.Frame):
         
         # --- Constants (Module Level) ---
         # --- FIX: Pull data from the app's centralized astro_data ---
-        self.RASHI_NAMES = [r['name'] for r in self.app.astro_data.get_all_rashis()]
+        all_rashis = self.app.astro_data.get_all_rashis() # Build the table once for both lookups
+        self.RASHI_NAMES = [r['name'] for r in all_rashis]
         
-        self.RASHI_LORDS = {r['name']: r['lord'] for r in self.app.astro_data.get_all_rashis()}
+        self.RASHI_LORDS = {r['name']: r['lord'] for r in all_rashis}
         
         # We need the full nakshatra data for lords and pada calcs
         try:
@@ -3901,7 +4025,7 @@ class TransitCalculatorTab(ttk.Frame):
              
         self.NAKSHATRA_LORDS = {n['name']: n['lord'] for n in self.NAKSHATRA_DATA}
         
-        self.PLANET_NAMES = [p['name'] for p in self.app.astro_data.get_all_planets()]
+        self.PLANET_NAMES = self.app.astro_data.get_planet_column('name')
         # --- END FIX ---
         
         # --- Theme Colors (Enhanced) ---
@@ -4334,7 +4458,7 @@ class TransitCalculatorTab(ttk.Frame):
                     state_list.append("R")
                     tags.append('Retro.Treeview')
                 
-                if self.app.interpreter.get_special_state_analysis(planet_name, speed, sun_longitude, pos_data['longitude']).count("Combust"):
+                if self.app.interpreter.is_combust(planet_name, speed, sun_longitude, pos_data['longitude']):
                     state_list.append("C")
                     tags.append('Combust.Treeview')
 
@@ -4397,9 +4521,9 @@ class TransitCalculatorTab(ttk.Frame):
                 iid = self.bav_tree.insert('', 'end', values=tuple(row_data))
                 
                 if planet in transit_positions:
-                    transit_rashi = transit_positions[planet]['rashi']
-                    if transit_rashi in self.RASHI_NAMES:
-                        col_index = self.RASHI_NAMES.index(transit_rashi) + 1
+                    # RASHI_NAMES columns run in sign order, so the sign number is the column index
+                    col_index = EnhancedAstrologicalData.SIGN_NAME_TO_NUM.get(transit_positions[planet]['rashi'])
+                    if col_index:
                         self.bav_tree.item(iid, tags=(f'col_highlight_{col_index}',))
 
         # Populate SAV Tree
@@ -4664,16 +4788,30 @@ def get_all_nakshatras_with_long() -> List[Dict[str, Any]]:
     # You might want to add other details like Gana, Yoni, Nadi etc. here as well
     return nakshatras
 # --- Helper to get Planet Notes (Place outside the class or in EnhancedAstrologicalData) ---
+@lru_cache(maxsize=32)
 def get_planet_notes(planet_name: str, app_instance: 'AstroVighatiElite') -> tuple[str, str]:
-    """Gets BPHS and Lal Kitab notes for a planet."""
-    # Ensure get_all_planets() is accessible, adjust path if needed
-    if hasattr(app_instance, 'astro_data') and hasattr(app_instance.astro_data, 'get_all_planets'):
-        planet_data = next((p for p in app_instance.astro_data.get_all_planets() if p['name'] == planet_name), None)
+    """
+    Gets BPHS and Lal Kitab notes for a planet.
+
+    Results are memoized per (planet, app) pair, since the planet table is
+    static and Dasha row selection asks for the same 9 lords repeatedly.
+    """
+    # Ensure get_planets_by_name() is accessible, adjust path if needed
+    if hasattr(app_instance, 'astro_data') and hasattr(app_instance.astro_data, 'get_planets_by_name'):
+        planet_data = app_instance.astro_data.get_planets_by_name().get(planet_name)
         if planet_data:
             return planet_data.get('bphs_note', 'N/A'), planet_data.get('lal_kitab_note', 'N/A')
     print(f"Warning: Could not retrieve notes for planet '{planet_name}' via app.astro_data")
     return 'Notes not found.', 'Notes not found.'
 
+class DashaRowMeta(NamedTuple):
+    """Per-row data of the Dasha Treeview, kept in Python for the notes handler."""
+    period_type: str  # "MD" or "AD"
+    lord: str
+    md_lord: str
+    start: datetime
+    end: datetime
+
 class DashaTimelineTab(ttk.Frame):
     """
     This class defines the "Dasha Timeline" tab with precise calculations.
@@ -4681,6 +4819,9 @@ class DashaTimelineTab(ttk.Frame):
     Calculates and displays Vimshottari Dasha sequence (Mahadasha & Antardasha)
     based on the Moon's exact longitude at birth. Requires 'python-dateutil'.
     """
+    # Tolerance (in years / days) for Antardasha boundary comparisons
+    AD_TOLERANCE: float = 0.0001
+
     def __init__(self, parent: ttk.Notebook, app: 'AstroVighatiElite') -> None:
         super().__init__(parent)
         self.app = app
@@ -4702,8 +4843,27 @@ class DashaTimelineTab(ttk.Frame):
             "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10, "Mars": 7,
             "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
         }
-        self.planet_order: List[str] = list(self.dasha_periods.keys())
+        self.planet_order: List[str] = list(self.dasha_periods)
         self.total_dasha_cycle = sum(self.dasha_periods.values()) # 120
+        self._row_meta: Dict[str, DashaRowMeta] = {} # Treeview item id -> row data
+
+        # --- Dasha periods indexed by position in planet_order ---
+        self._planet_idx: Dict[str, int] = {p: i for i, p in enumerate(self.planet_order)}
+        num_lords = len(self.planet_order)
+
+        # --- Antardasha durations in days (row = MD lord index, columns in AD order) ---
+        if NUMPY_AVAILABLE:
+            self._periods_arr = np.array([self.dasha_periods[p] for p in self.planet_order], dtype=np.float64)
+            ad_lord_indices = (np.arange(num_lords)[:, np.newaxis] + np.arange(num_lords)) % num_lords
+            self._ad_days_matrix = (self._periods_arr[:, np.newaxis] * self._periods_arr[ad_lord_indices]
+                                    / self.total_dasha_cycle * 365.2425)
+        else:
+            self._periods_arr = [float(self.dasha_periods[p]) for p in self.planet_order]
+            self._ad_days_matrix = [
+                [(self._periods_arr[i] * self._periods_arr[(i + j) % num_lords]) / self.total_dasha_cycle * 365.2425
+                 for j in range(num_lords)]
+                for i in range(num_lords)
+            ]
 
         # --- Define theme colors (fetch from app or use defaults) ---
         self.theme_bg = self.app.current_theme_data.get("bg_dark", "#2e2e2e")
@@ -4967,6 +5127,99 @@ class DashaTimelineTab(ttk.Frame):
             import traceback
             traceback.print_exc()
 
+    def _format_ad_duration(self, start_date: datetime, end_date: datetime) -> str:
+        """Formats the span between two dates as 'xY xM xD' for the Duration column."""
+        delta = relativedelta(seconds=(end_date - start_date).total_seconds())
+        years, months = delta.years, delta.months
+        day_diff = (end_date - (start_date + relativedelta(years=years, months=months))).total_seconds() / 86400.0
+        days = int(math.ceil(day_diff)) if day_diff > self.AD_TOLERANCE else 0
+        return f"{years}Y {months}M {days}D"
+
+    def _emit_antardashas(self, md_id: str, md_lord_index: int, md_start: datetime, md_end: datetime,
+                          ad_end_dates: List[datetime], elapsed_years: Optional[float] = None) -> None:
+        """
+        Inserts the Antardasha rows of one Mahadasha under `md_id`.
+
+        Args:
+            md_id (str): Treeview item id of the parent Mahadasha row.
+            md_lord_index (int): Index of the Mahadasha lord in `planet_order`.
+            md_start (datetime): Date from which rows are shown (birth for the balance MD).
+            md_end (datetime): End date of the Mahadasha.
+            ad_end_dates (List[datetime]): End dates of the 9 Antardashas, from `_antardasha_end_dates`.
+            elapsed_years (Optional[float]): For the balance MD, the years already elapsed at birth.
+                ADs that finished before birth are skipped, the running one is marked "(Balance)",
+                and an AD overrunning `md_end` is capped and marked "(Partial)".
+                None for full Mahadashas.
+        """
+        is_balance_md = elapsed_years is not None
+        md_lord = self.planet_order[md_lord_index]
+        md_years = self._periods_arr[md_lord_index]
+        elapsed_ad_years_cumulative = 0.0
+        current_ad_start_date = md_start
+
+        for j in range(len(self.planet_order)):
+            ad_lord_index = (md_lord_index + j) % len(self.planet_order)
+            ad_lord = self.planet_order[ad_lord_index]
+            ad_duration_years_decimal = (md_years * self._periods_arr[ad_lord_index]) / self.total_dasha_cycle
+
+            if is_balance_md and elapsed_ad_years_cumulative + ad_duration_years_decimal <= elapsed_years + self.AD_TOLERANCE:
+                elapsed_ad_years_cumulative += ad_duration_years_decimal
+                continue
+
+            ad_start_date = current_ad_start_date
+            ad_end_date = ad_end_dates[j]
+            duration_str_ad = self._format_ad_duration(ad_start_date, ad_end_date)
+            if is_balance_md and elapsed_ad_years_cumulative <= elapsed_years: # AD running at birth
+                duration_str_ad += " (Balance)"
+
+            if is_balance_md and ad_end_date > md_end:
+                ad_end_date = md_end # Cap it
+                duration_str_ad = self._format_ad_duration(ad_start_date, ad_end_date) + " (Partial)"
+
+            ad_id = self.dasha_tree.insert(md_id, "end", values=("  AD", ad_lord,
+                                             ad_start_date.strftime('%d-%b-%Y %H:%M'),
+                                             ad_end_date.strftime('%d-%b-%Y %H:%M'),
+                                             duration_str_ad), tags=(ad_lord,))
+            self._row_meta[ad_id] = DashaRowMeta("AD", ad_lord, md_lord, ad_start_date, ad_end_date)
+
+            current_ad_start_date = ad_end_date
+            elapsed_ad_years_cumulative += ad_duration_years_decimal
+
+            if is_balance_md and current_ad_start_date >= md_end - timedelta(seconds=1):
+                break
+
+    def _antardasha_end_dates(self, md_start_dates: List[datetime], md_lord_indices: List[int]) -> List[List[datetime]]:
+        """
+        Computes the Antardasha end dates for several Mahadashas in one pass.
+
+        With NumPy, the AD durations of every MD are accumulated with a single
+        `cumsum` and broadcast onto the MD start dates as `datetime64` values.
+        Without NumPy, the same running sum is done in plain Python.
+
+        Args:
+            md_start_dates (List[datetime]): Start date of each Mahadasha (for the balance
+                MD, its notional start before birth).
+            md_lord_indices (List[int]): Index of each Mahadasha lord in `planet_order`.
+
+        Returns:
+            List[List[datetime]]: For each Mahadasha, the end dates of its 9 Antardashas.
+        """
+        if NUMPY_AVAILABLE:
+            offsets_days = np.cumsum(self._ad_days_matrix[md_lord_indices], axis=1)
+            offsets_us = np.rint(offsets_days * 86_400_000_000).astype('timedelta64[us]')
+            starts = np.array(md_start_dates, dtype='datetime64[us]')
+            return (starts[:, np.newaxis] + offsets_us).tolist()
+
+        end_dates = []
+        for md_start, md_lord_index in zip(md_start_dates, md_lord_indices):
+            offset_days = 0.0
+            row = []
+            for ad_days in self._ad_days_matrix[md_lord_index]:
+                offset_days += ad_days
+                row.append(md_start + timedelta(days=offset_days))
+            end_dates.append(row)
+        return end_dates
+
     def calculate_dasha(self) -> None:
         """Calculates and displays the Precise Dasha sequence including Bhuktis."""
         if not DATEUTIL_AVAILABLE:
@@ -5059,33 +5312,30 @@ class DashaTimelineTab(ttk.Frame):
             proportion_remaining = remaining_longitude / nak_span
             proportion_remaining = max(0.0, min(1.0, proportion_remaining))
 
-            total_years_first_dasha = self.dasha_periods[nak_lord]
+            md_lord_index_first = self._planet_idx[nak_lord]
+            total_years_first_dasha = self._periods_arr[md_lord_index_first]
             balance_years_decimal = total_years_first_dasha * proportion_remaining
 
             total_days_balance = balance_years_decimal * 365.2425
-            try:
-                 balance_timedelta = timedelta(days=total_days_balance)
-                 first_md_end_date = birth_dt + balance_timedelta
-
-                 # --- FIX: Calculate Y/M/D for display using relativedelta AFTER getting timedelta ---
-                 delta_for_display = relativedelta(birth_dt, first_md_end_date) # Calculate difference
-                 balance_years = abs(delta_for_display.years)
-                 balance_months = abs(delta_for_display.months)
-                 # Calculate remaining days from the timedelta itself
-                 total_seconds_in_delta = abs(balance_timedelta.total_seconds())
-                 seconds_in_ym = abs(relativedelta(years=balance_years, months=balance_months).total_seconds()) if hasattr(relativedelta, 'total_seconds') else abs((datetime(2000+balance_years, 1+balance_months, 1) - datetime(2000,1,1)).total_seconds()) # Approximation if needed
-                 remaining_seconds = total_seconds_in_delta - seconds_in_ym
-                 balance_days = int(math.ceil(remaining_seconds / 86400.0))
-                 # --- END FIX ---
-
-
-            except (OverflowError, ValueError) as dt_err:
-                 messagebox.showerror("Calculation Error", f"Could not calculate the end date of the first Dasha balance: {dt_err}")
-                 return
+            # proportion_remaining is clamped to [0, 1], so the balance never exceeds 20 years
+            balance_timedelta = timedelta(days=total_days_balance)
+            first_md_end_date = birth_dt + balance_timedelta
+
+            # --- FIX: Calculate Y/M/D for display using relativedelta AFTER getting timedelta ---
+            delta_for_display = relativedelta(birth_dt, first_md_end_date) # Calculate difference
+            balance_years = abs(delta_for_display.years)
+            balance_months = abs(delta_for_display.months)
+            # Calculate remaining days from the timedelta itself
+            total_seconds_in_delta = abs(balance_timedelta.total_seconds())
+            seconds_in_ym = abs(relativedelta(years=balance_years, months=balance_months).total_seconds()) if hasattr(relativedelta, 'total_seconds') else abs((datetime(2000+balance_years, 1+balance_months, 1) - datetime(2000,1,1)).total_seconds()) # Approximation if needed
+            remaining_seconds = total_seconds_in_delta - seconds_in_ym
+            balance_days = int(math.ceil(remaining_seconds / 86400.0))
+            # --- END FIX ---
 
             # --- 3. Populate Treeview ---
             for item in self.dasha_tree.get_children():
                 self.dasha_tree.delete(item)
+            self._row_meta.clear()
 
             duration_str_first = f"{balance_years}Y {balance_months}M {balance_days}D (Balance)"
             md_id_first = self.dasha_tree.insert("", "end",
@@ -5094,137 +5344,42 @@ class DashaTimelineTab(ttk.Frame):
                                                  first_md_end_date.strftime('%d-%b-%Y %H:%M'),
                                                  duration_str_first),
                                                 tags=('MahadashaRow', nak_lord))
+            self._row_meta[md_id_first] = DashaRowMeta("MD", nak_lord, nak_lord, birth_dt, first_md_end_date)
 
-            # Calculate Antardashas for the First (Balance) Mahadasha
             proportion_traversed = 1.0 - proportion_remaining
-            md_years_first = self.dasha_periods[nak_lord]
-            dasha_years_elapsed_in_first_md = proportion_traversed * md_years_first
-            md_lord_index_first = self.planet_order.index(nak_lord)
-
-            elapsed_ad_years_cumulative = 0.0
-            current_ad_start_date_first = birth_dt
-
-            for j in range(len(self.planet_order)):
-                ad_lord_index = (md_lord_index_first + j) % len(self.planet_order)
-                ad_lord = self.planet_order[ad_lord_index]
-                ad_years = self.dasha_periods[ad_lord]
-                ad_duration_years_decimal = (md_years_first * ad_years) / self.total_dasha_cycle
-                ad_total_days = ad_duration_years_decimal * 365.2425
-                ad_timedelta = timedelta(days=ad_total_days) # Store timedelta
-
-                if elapsed_ad_years_cumulative + ad_duration_years_decimal <= dasha_years_elapsed_in_first_md + tolerance:
-                    elapsed_ad_years_cumulative += ad_duration_years_decimal
-                    continue
-
-                ad_start_date = current_ad_start_date_first
-                duration_str_ad = ""
-                ad_end_date = datetime.now() # Initialize
-
-                if elapsed_ad_years_cumulative <= dasha_years_elapsed_in_first_md: # AD running at birth
-                    balance_ad_years = (elapsed_ad_years_cumulative + ad_duration_years_decimal) - dasha_years_elapsed_in_first_md
-                    ad_total_days_balance = balance_ad_years * 365.2425
-                    ad_bal_timedelta = timedelta(days=ad_total_days_balance)
-                    ad_end_date = birth_dt + ad_bal_timedelta
-
-                    # --- FIX: Calculate Y/M/D for display using relativedelta on the calculated timedelta ---
-                    delta_ad_bal = relativedelta(seconds=ad_bal_timedelta.total_seconds())
-                    ad_y, ad_m = delta_ad_bal.years, delta_ad_bal.months
-                    # Calculate remaining days
-                    temp_end_ad_bal = birth_dt + relativedelta(years=ad_y, months=ad_m)
-                    ad_d_diff = (ad_end_date - temp_end_ad_bal).total_seconds() / 86400.0
-                    ad_d = int(math.ceil(ad_d_diff)) if ad_d_diff > tolerance else 0
-                    duration_str_ad = f"{ad_y}Y {ad_m}M {ad_d}D (Balance)"
-                    # --- END FIX ---
-
-                else: # Subsequent full AD within first MD balance
-                    ad_end_date = ad_start_date + ad_timedelta
-
-                    # --- FIX: Calculate Y/M/D for display using relativedelta on the full timedelta ---
-                    delta_ad_full = relativedelta(seconds=ad_timedelta.total_seconds())
-                    ad_y, ad_m = delta_ad_full.years, delta_ad_full.months
-                     # Calculate remaining days
-                    temp_end_ad_full = ad_start_date + relativedelta(years=ad_y, months=ad_m)
-                    ad_d_diff = (ad_end_date - temp_end_ad_full).total_seconds() / 86400.0
-                    ad_d = int(math.ceil(ad_d_diff)) if ad_d_diff > tolerance else 0
-                    duration_str_ad = f"{ad_y}Y {ad_m}M {ad_d}D"
-                    # --- END FIX ---
-
-
-                if ad_end_date > first_md_end_date:
-                    time_diff_md_end = first_md_end_date - ad_start_date
-                    ad_end_date = first_md_end_date # Cap it
-
-                    # --- FIX: Calculate Y/M/D for display using relativedelta on the difference timedelta ---
-                    delta_ad_partial = relativedelta(seconds=time_diff_md_end.total_seconds())
-                    part_y, part_m = delta_ad_partial.years, delta_ad_partial.months
-                    # Calculate remaining days
-                    temp_end_ad_part = ad_start_date + relativedelta(years=part_y, months=part_m)
-                    part_d_diff = (ad_end_date - temp_end_ad_part).total_seconds() / 86400.0
-                    part_d = int(math.ceil(part_d_diff)) if part_d_diff > tolerance else 0
-                    duration_str_ad = f"{part_y}Y {part_m}M {part_d}D (Partial)"
-                    # --- END FIX ---
-
-
-                self.dasha_tree.insert(md_id_first, "end", values=("  AD", ad_lord,
-                                                 ad_start_date.strftime('%d-%b-%Y %H:%M'),
-                                                 ad_end_date.strftime('%d-%b-%Y %H:%M'),
-                                                 duration_str_ad), tags=(ad_lord,))
-
-                current_ad_start_date_first = ad_end_date
-                elapsed_ad_years_cumulative += ad_duration_years_decimal
+            dasha_years_elapsed_in_first_md = proportion_traversed * total_years_first_dasha
 
-                if current_ad_start_date_first >= first_md_end_date - timedelta(seconds=1):
-                    break
+            num_full_md_to_show = 8
+            md_lord_indices = [(md_lord_index_first + i) % len(self.planet_order) for i in range(num_full_md_to_show + 1)]
 
+            # MD boundaries follow calendar years; all AD end dates are then computed in one pass.
+            # The balance MD's ADs are measured from its notional start before birth.
+            md_start_dates = [birth_dt, first_md_end_date]
+            for md_lord_index in md_lord_indices[1:]:
+                md_start_dates.append(md_start_dates[-1] + relativedelta(years=self.dasha_periods[self.planet_order[md_lord_index]]))
+            ad_anchor_dates = [birth_dt - timedelta(days=dasha_years_elapsed_in_first_md * 365.2425)] + md_start_dates[1:-1]
+            ad_end_dates = self._antardasha_end_dates(ad_anchor_dates, md_lord_indices)
 
-            # Loop through Subsequent Full Mahadashas
-            current_md_start_date = first_md_end_date
-            num_full_md_to_show = 8
+            # Antardashas for the First (Balance) Mahadasha
+            self._emit_antardashas(md_id_first, md_lord_index_first, birth_dt, first_md_end_date, ad_end_dates[0],
+                                   elapsed_years=dasha_years_elapsed_in_first_md)
 
+            # Subsequent Full Mahadashas
             for i in range(1, num_full_md_to_show + 1):
-                md_lord_index = (md_lord_index_first + i) % len(self.planet_order)
+                md_lord_index = md_lord_indices[i]
                 md_lord = self.planet_order[md_lord_index]
                 md_years = self.dasha_periods[md_lord]
-                md_end_date = current_md_start_date + relativedelta(years=md_years)
+                current_md_start_date = md_start_dates[i]
+                md_end_date = md_start_dates[i + 1]
                 duration_str_md = f"{md_years} Years"
 
                 md_id = self.dasha_tree.insert("", "end", values=("MD", md_lord,
                                                  current_md_start_date.strftime('%d-%b-%Y %H:%M'),
                                                  md_end_date.strftime('%d-%b-%Y %H:%M'),
                                                  duration_str_md), tags=('MahadashaRow', md_lord))
+                self._row_meta[md_id] = DashaRowMeta("MD", md_lord, md_lord, current_md_start_date, md_end_date)
 
-                current_ad_start_date = current_md_start_date
-
-                # Loop through Antardashas for this Full Mahadasha
-                for j in range(len(self.planet_order)):
-                    ad_lord_index = (md_lord_index + j) % len(self.planet_order)
-                    ad_lord = self.planet_order[ad_lord_index]
-                    ad_years = self.dasha_periods[ad_lord]
-
-                    ad_duration_years_decimal = (md_years * ad_years) / self.total_dasha_cycle
-                    ad_total_days = ad_duration_years_decimal * 365.2425
-                    ad_timedelta = timedelta(days=ad_total_days)
-                    ad_end_date = current_ad_start_date + ad_timedelta
-
-                    # --- FIX: Calculate Y/M/D for display using relativedelta on timedelta ---
-                    delta_ad = relativedelta(seconds=ad_timedelta.total_seconds())
-                    ad_y, ad_m = delta_ad.years, delta_ad.months
-                    # Calculate remaining days
-                    temp_end_ad = current_ad_start_date + relativedelta(years=ad_y, months=ad_m)
-                    ad_d_diff = (ad_end_date - temp_end_ad).total_seconds() / 86400.0
-                    ad_d = int(math.ceil(ad_d_diff)) if ad_d_diff > tolerance else 0
-                    duration_str_ad = f"{ad_y}Y {ad_m}M {ad_d}D"
-                    # --- END FIX ---
-
-
-                    self.dasha_tree.insert(md_id, "end", values=("  AD", ad_lord,
-                                                 current_ad_start_date.strftime('%d-%b-%Y %H:%M'),
-                                                 ad_end_date.strftime('%d-%b-%Y %H:%M'),
-                                                 duration_str_ad), tags=(ad_lord,))
-
-                    current_ad_start_date = ad_end_date
-
-                current_md_start_date = md_end_date
+                self._emit_antardashas(md_id, md_lord_index, current_md_start_date, md_end_date, ad_end_dates[i])
 
             self.app.status_var.set("Accurate Dasha timeline calculated.")
 
@@ -5235,10 +5390,10 @@ class DashaTimelineTab(ttk.Frame):
             import traceback
             traceback.print_exc()
 
-    # --- show_dasha_notes method remains the same ---
     def show_dasha_notes(self, event: Optional[tk.Event]) -> None:
         """Shows interpretation notes for the selected Dasha/Antardasha lord."""
-        # (Keep the previously corrected version of this method)
+        # --- This function remains largely the same as the previous version ---
+        # Ensure get_planet_notes is correctly defined and accessible
         selected_items = self.dasha_tree.selection()
         if not selected_items:
             self.notes_text.config(state='normal')
@@ -5247,35 +5402,24 @@ class DashaTimelineTab(ttk.Frame):
             self.notes_text.config(state='disabled')
             return
 
-        item_id = selected_items[0]
-        item_values = self.dasha_tree.item(item_id, "values")
-        item_tags = self.dasha_tree.item(item_id, "tags")
+        # Row data is read from Python memory instead of querying the Treeview
+        meta = self._row_meta.get(selected_items[0])
+        if meta is None: return
 
-        if not item_values or len(item_values) < 4: return
-        if not item_tags: return
+        planet_lord = meta.lord
+        md_lord = meta.md_lord
+        start_date_str = meta.start.strftime('%d-%b-%Y %H:%M')
+        end_date_str = meta.end.strftime('%d-%b-%Y %H:%M')
 
-        period_type_raw = item_values[0].strip()
-        lord = item_values[1]
-        start_date_str = item_values[2]
-        end_date_str = item_values[3]
-
-        period_type = "Mahadasha (MD)" if period_type_raw == "MD" else "Antardasha (AD)"
-
-        md_lord = lord
-        if period_type == "Antardasha (AD)":
-             parent_id = self.dasha_tree.parent(item_id)
-             if parent_id:
-                 md_values = self.dasha_tree.item(parent_id, "values")
-                 if md_values and len(md_values) > 1:
-                     md_lord = md_values[1]
-
-        planet_lord = item_tags[-1]
+        period_type = "Mahadasha (MD)" if meta.period_type == "MD" else "Antardasha (AD)"
 
+        # --- Use the helper function ---
         try:
              bphs_note, lk_note = get_planet_notes(planet_lord, self.app)
         except Exception as e:
              print(f"Error fetching planet notes: {e}")
              bphs_note, lk_note = "Error fetching BPHS notes.", "Error fetching Lal Kitab notes."
+        # --- End Use helper function ---
 
         note = f"Selected Period: {planet_lord} {period_type}\n"
         if period_type == "Antardasha (AD)":
@@ -5310,94 +5454,129 @@ class DashaTimelineTab(ttk.Frame):
         self.notes_text.delete('1.0', tk.END)
         self.notes_text.insert('1.0', note)
         self.notes_text.config(state='disabled')
-        
-    def show_dasha_notes(self, event: Optional[tk.Event]) -> None:
-        """Shows interpretation notes for the selected Dasha/Antardasha lord."""
-        # --- This function remains largely the same as the previous version ---
-        # Ensure get_planet_notes is correctly defined and accessible
-        selected_items = self.dasha_tree.selection()
-        if not selected_items:
-            self.notes_text.config(state='normal')
-            self.notes_text.delete('1.0', tk.END)
-            self.notes_text.insert('1.0', "Select a Dasha/Antardasha period...")
-            self.notes_text.config(state='disabled')
-            return
 
-        item_id = selected_items[0]
-        item_values = self.dasha_tree.item(item_id, "values")
-        item_tags = self.dasha_tree.item(item_id, "tags")
+# --- Shared ttk styles for the Nakshatra / Planet explorer tabs ---
+explorer_styles_configured: bool = False  # Global flag: styles are global to the Tk interpreter
 
-        if not item_values or len(item_values) < 4: return # Check length
-        if not item_tags: return # Need tags for planet name
+def configure_explorer_styles() -> None:
+    """
+    Configures the ttk styles used by the Nakshatra and Planet explorer tabs.
 
-        period_type_raw = item_values[0].strip()
-        lord = item_values[1]
-        start_date_str = item_values[2]
-        end_date_str = item_values[3]
+    Runs once, from AstroVighatiElite.__init__, instead of on every tab
+    construction. Later calls are no-ops.
+    """
+    global explorer_styles_configured
+    if explorer_styles_configured:
+        return
+
+    header_fg = "#ffcc66" # Gold for headers
+    theme_bg = "#2e2e2e"
+    theme_fg = "#ffffff"
+
+    style = ttk.Style()
+    # Nakshatra Explorer
+    style.configure("NakshatraHeader.TLabel", foreground=header_fg,
+                    font=('Segoe UI', 13, 'bold'))
+    style.configure("NakshatraSubHeader.TLabel", foreground=header_fg,
+                    font=('Segoe UI', 12, 'bold'))
+    style.map("TEntry",
+              fieldbackground=[('!focus', theme_bg)],
+              foreground=[('!focus', theme_fg)],
+              insertcolor=[('', theme_fg)]) # Cursor color
+    style.configure('TNotebook.Tab', padding=[10, 5], font=('Segoe UI', 10, 'bold'))
+
+    # Planetary Guide
+    style.configure("TabHeader.TLabel", foreground=header_fg,
+                    font=('Segoe UI', 13, 'bold'))
+    style.configure("DetailHeader.TLabel", foreground=header_fg,
+                    font=('Segoe UI', 12, 'bold'))
+
+    explorer_styles_configured = True
+
+# --- Shared layout for the explorer detail panes ---
+_DETAIL_WIDTH = 66 # Column width of the monospace detail text
+_SEP = "─" * _DETAIL_WIDTH # Section separator line
+_HEADER_BAR = "═" * _DETAIL_WIDTH # Heavy rule under reference titles
+
+# textwrap.fill builds a new TextWrapper on every call; the detail renderers
+# wrap line by line, so they share this preconfigured instance instead.
+_DETAIL_WRAPPER = textwrap.TextWrapper(width=_DETAIL_WIDTH, initial_indent='  ', subsequent_indent='  ',
+                                       break_long_words=False, replace_whitespace=False)
+# Same, with continuation lines indented further to align under list items
+_DETAIL_LIST_WRAPPER = textwrap.TextWrapper(width=_DETAIL_WIDTH, initial_indent='  ', subsequent_indent='    ',
+                                            break_long_words=False, replace_whitespace=False)
 
-        period_type = "Mahadasha (MD)" if period_type_raw == "MD" else "Antardasha (AD)"
+class EnhancedNakshatraTab(ttk.Frame):
+    """
+    This class defines the "Nakshatra Explorer" tab with enhanced UI and data.
+    """
+    # Delay (ms) after the last keystroke before the list is re-filtered
+    FILTER_DEBOUNCE_MS: int = 150
 
-        md_lord = lord # Assume MD initially
-        if period_type == "Antardasha (AD)":
-             parent_id = self.dasha_tree.parent(item_id)
-             if parent_id:
-                 md_values = self.dasha_tree.item(parent_id, "values")
-                 if md_values and len(md_values) > 1:
-                     md_lord = md_values[1]
+    # Strips combining diacritics (U+0300-U+036F) so "Rohiṇī" matches "Rohini"
+    SEARCH_FOLD_TABLE: Dict[int, None] = str.maketrans('', '', ''.join(map(chr, range(0x300, 0x370))))
 
-        # Use the last tag as the planet lord name (safer)
-        planet_lord = item_tags[-1]
+    # Layout of the "Details" pane, filled per nakshatra via str.format_map
+    DETAILS_TEMPLATE: str = f"""
+ {{title_centered}}
+{{separator}}
 
-        # --- Use the helper function ---
-        try:
-             bphs_note, lk_note = get_planet_notes(planet_lord, self.app)
-        except Exception as e:
-             print(f"Error fetching planet notes: {e}")
-             bphs_note, lk_note = "Error fetching BPHS notes.", "Error fetching Lal Kitab notes."
-        # --- End Use helper function ---
+ CORE ATTRIBUTES
+{{separator}}
+   {'Ruling Lord':<18}: {{lord}}
+   {'Presiding Deity':<18}: {{deity}}
+   {'Symbol':<18}: {{symbol}}
 
-        note = f"Selected Period: {planet_lord} {period_type}\n"
-        if period_type == "Antardasha (AD)":
-             note += f"(Running under {md_lord} Mahadasha)\n"
-        note += f"Period: {start_date_str} to {end_date_str}\n"
-        note += "─────────────────────────────────────────────────\n"
-        note += "General Vimshottari Interpretation:\n"
-        if period_type == "Mahadasha (MD)":
-            note += f"  • The overall theme for these ~{self.dasha_periods.get(planet_lord, '?')} years revolves around {planet_lord}'s significations and condition in the birth chart.\n"
-        else:
-            note += f"  • Within the broader {md_lord} MD, this sub-period brings {planet_lord}'s themes to the forefront.\n"
-            note += f"  • Results are a blend: {planet_lord}'s nature interacts with {md_lord}'s overall influence. Check their relationship (friendly/enemy) in the chart.\n"
+ CLASSIFICATION (BPHS / Classical)
+{{separator}}
+   {'Gana (Temperament)':<18}: {{gana}}
+   {'Yoni (Animal)':<18}: {{yoni}}
+   {'Nadi (Constitution)':<18}: {{nadi}}
+   {'Guna (Quality)':<18}: {{guna}}
+   {'Tattva (Element)':<18}: {{tattva}}
+   {'Motivation':<18}: {{motivation}}
+   {'Nature':<18}: {{nature}}
 
-        note += "─────────────────────────────────────────────────\n"
-        note += f"BPHS Notes on Lord ({planet_lord}):\n"
-        note += f"{textwrap.fill(bphs_note, width=60, initial_indent='  ', subsequent_indent='  ')}\n\n"
-        note += f"Lal Kitab Notes on Lord ({planet_lord}):\n"
-        note += f"{textwrap.fill(lk_note, width=60, initial_indent='  ', subsequent_indent='  ')}\n\n"
-        note += ("IMPORTANT:\n"
-                 "Actual results are highly specific to the individual's birth chart.\n"
-                 f"Analyze the {period_type} lord ({planet_lord})'s:\n"
-                 "  - Dignity (Exaltation, Own Sign, Debilitation etc.)\n"
-                 "  - House Placement (Kendra, Trikona, Dusthana etc.)\n"
-                 "  - Aspects Received & Given\n"
-                 "  - Conjunctions\n"
-                 "  - Role in Yogas/Doshas\n"
-                 f"{'  - Relationship with the Mahadasha lord (' + md_lord + ')' if period_type == 'Antardasha (AD)' else ''}\n"
-                 "  - Current Transits (Gochar)")
+ PADA (QUARTERS) & NAME SYLLABLES
+{{separator}}
+   {'Pada 1 Navamsha':<18}: {{pada_1_navamsha:<15}} Syllable: {{syllable_1}}
+   {'Pada 2 Navamsha':<18}: {{pada_2_navamsha:<15}} Syllable: {{syllable_2}}
+   {'Pada 3 Navamsha':<18}: {{pada_3_navamsha:<15}} Syllable: {{syllable_3}}
+   {'Pada 4 Navamsha':<18}: {{pada_4_navamsha:<15}} Syllable: {{syllable_4}}
+
+ KEYWORDS & SIGNIFICATIONS
+{{separator}}
+{{keywords_wrapped}}
 
+ BPHS / CLASSICAL NOTE
+{{separator}}
+{{bphs_note_wrapped}}
 
-        self.notes_text.config(state='normal')
-        self.notes_text.delete('1.0', tk.END)
-        self.notes_text.insert('1.0', note)
-        self.notes_text.config(state='disabled')
+ LAL KITAB NOTE
+{{separator}}
+{{lal_kitab_note_wrapped}}
+"""
+    DETAIL_DEFAULTS: Dict[str, str] = dict.fromkeys(
+        ('lord', 'deity', 'symbol', 'gana', 'yoni', 'nadi', 'guna', 'tattva', 'motivation', 'nature'), 'N/A')
 
-class EnhancedNakshatraTab(ttk.Frame):
-    """
-    This class defines the "Nakshatra Explorer" tab with enhanced UI and data.
-    """
     def __init__(self, parent: ttk.Notebook, app: 'AstroVighatiElite') -> None:
         super().__init__(parent)
         self.app = app
+        self._filter_job: Optional[str] = None # Pending 'after' id for the debounced filter
         self.all_nakshatras = self.app.astro_data.get_all_nakshatras() # Cache data
+        self._by_num: Dict[int, Mapping[str, Any]] = {n['num']: n for n in self.all_nakshatras}
+        # Tree item id of each nakshatra row (its number), in list order
+        self._row_iids: List[str] = [str(nak['num']) for nak in self.all_nakshatras]
+
+        # Precompute folded search text (fields joined by newlines, which
+        # can't be typed into the search box)
+        self._search_haystacks: List[str] = [
+            self._fold_search_text("\n".join((nak['name'], nak['sanskrit'], nak['devanagari'], nak['lord'],
+                                               nak['deity'], str(nak.get('num', '')))))
+            for nak in self.all_nakshatras
+        ]
+        # Details text never changes at runtime, so it is rendered once up front
+        self._rendered: Dict[int, str] = {nak['num']: self._render_details(nak) for nak in self.all_nakshatras}
 
         # Define theme colors
         self.theme_bg = "#2e2e2e"
@@ -5405,22 +5584,9 @@ class EnhancedNakshatraTab(ttk.Frame):
         self.select_bg = "#005f9e"
         self.header_fg = "#ffcc66" # Example: Gold for headers
 
-        self.create_styles()
+        # ttk styles are configured once for all explorer tabs (see configure_explorer_styles)
         self.create_ui()
 
-    def create_styles(self):
-        """Configure custom ttk styles."""
-        style = ttk.Style()
-        style.configure("NakshatraHeader.TLabel", foreground=self.header_fg,
-                        font=('Segoe UI', 13, 'bold'))
-        style.configure("NakshatraSubHeader.TLabel", foreground=self.header_fg,
-                        font=('Segoe UI', 12, 'bold'))
-        # Style for the Entry widget if needed
-        style.map("TEntry",
-                  fieldbackground=[('!focus', self.theme_bg)],
-                  foreground=[('!focus', self.theme_fg)],
-                  insertcolor=[('', self.theme_fg)]) # Cursor color
-
     def create_ui(self) -> None:
         paned = ttk.PanedWindow(self, orient='horizontal')
         paned.pack(expand=True, fill='both', padx=15, pady=15)
@@ -5440,31 +5606,29 @@ class EnhancedNakshatraTab(ttk.Frame):
         # Placeholder text (requires a bit more logic if needed)
         # search_entry.insert(0, "Search by Name, Lord...") 
 
-        # Listbox Frame
+        # List Frame
         list_frame = ttk.Frame(left_panel)
         list_frame.pack(fill='both', expand=True)
 
+        # A tree-only Treeview: rows are created once and filtering just
+        # detaches/reattaches them (colors come from the global 'Treeview' style)
         nak_scrollbar = ttk.Scrollbar(list_frame, orient='vertical')
-        self.nak_listbox = tk.Listbox(
+        self.nak_tree = ttk.Treeview(
             list_frame,
-            font=('Segoe UI', 11),
-            exportselection=False,
-            yscrollcommand=nak_scrollbar.set,
-            background=self.theme_bg,
-            foreground=self.theme_fg,
-            selectbackground=self.select_bg,
-            selectforeground=self.theme_fg,
-            highlightthickness=0,
-            borderwidth=0,
-            activestyle='none',
-            relief='flat'
+            columns=(),
+            show='tree',
+            selectmode='browse',
+            yscrollcommand=nak_scrollbar.set
         )
-        nak_scrollbar.config(command=self.nak_listbox.yview)
+        self.nak_tree.tag_configure('nak', font=('Segoe UI', 11))
+        nak_scrollbar.config(command=self.nak_tree.yview)
         nak_scrollbar.pack(side='right', fill='y')
-        self.nak_listbox.pack(side='left', fill='both', expand=True)
-        self.nak_listbox.bind('<<ListboxSelect>>', self.on_select)
+        self.nak_tree.pack(side='left', fill='both', expand=True)
+        self.nak_tree.bind('<<TreeviewSelect>>', self.on_select)
 
-        self.populate_list() # Fill the list on startup
+        for iid, nak in zip(self._row_iids, self.all_nakshatras):
+            self.nak_tree.insert('', 'end', iid=iid, tags=('nak',),
+                                 text=f" {nak.get('num', '?')}. {nak['name']} ({nak['devanagari']})")
 
         # Right Panel (Notebook for Details & Syllables)
         right_panel = ttk.Frame(paned, padding=(15, 10, 0, 10))
@@ -5473,10 +5637,6 @@ class EnhancedNakshatraTab(ttk.Frame):
         self.details_notebook = ttk.Notebook(right_panel)
         self.details_notebook.pack(fill='both', expand=True)
 
-        # --- Configure Notebook Style (optional, depends on theme) ---
-        style = ttk.Style()
-        style.configure('TNotebook.Tab', padding=[10, 5], font=('Segoe UI', 10, 'bold'))
-
         # Common ScrolledText options
         text_options = {
             "font": ("Courier New", 10), # Monospace for details
@@ -5505,42 +5665,67 @@ class EnhancedNakshatraTab(ttk.Frame):
         syllable_text_options["font"] = ("Segoe UI", 11) # Proportional font might be okay here
         self.syllables_text = scrolledtext.ScrolledText(syllables_frame, **syllable_text_options)
         self.syllables_text.pack(fill='both', expand=True)
-
-        # Populate the syllables tab
-        self.populate_syllables_tab()
+        # Define tags for bold and header (once; populate_syllables_tab only inserts text)
+        self.syllables_text.tag_configure("header", font=('Segoe UI', 12, 'bold'), justify='center')
+        self.syllables_text.tag_configure("subheader", font=('Segoe UI', 10), foreground="#cccccc") # Lighter gray
+        self.syllables_text.tag_configure("nak_name", font=('Segoe UI', 11, 'bold'))
+        self.syllables_text.tag_configure("syllable_data", font=('Segoe UI', 11))
         self.syllables_text.config(state='disabled') # Read-only
 
+        # The syllables reference is only filled in the first time its tab is opened
+        self._syllables_frame = syllables_frame
+        self._syllables_populated = False
+        self.details_notebook.bind('<<NotebookTabChanged>>', self._on_details_tab_changed)
+
+        # The first item is selected (and so displayed) when this tab is first shown
+        self._first_map_bind = self.bind('<Map>', self._on_first_map)
 
-        # Select the first item by default
-        if self.nak_listbox.size() > 0:
-            self.nak_listbox.selection_set(0)
-            self.on_select(None) # Trigger display
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Selects the first item the first time the tab is mapped."""
+        self.unbind('<Map>', self._first_map_bind)
+        rows = self.nak_tree.get_children()
+        if rows:
+            # The <<TreeviewSelect>> this queues renders the details via on_select
+            self.nak_tree.selection_set(rows[0])
 
+    def _on_details_tab_changed(self, event: tk.Event) -> None:
+        """Populates the syllables tab the first time it is selected."""
+        if not self._syllables_populated and self.details_notebook.select() == str(self._syllables_frame):
+            self.populate_syllables_tab()
+            self._syllables_populated = True
+
+
+    @classmethod
+    def _fold_search_text(cls, text: str) -> str:
+        """Lowercases text and drops diacritics, for accent-insensitive search."""
+        return unicodedata.normalize('NFD', text).translate(cls.SEARCH_FOLD_TABLE).lower()
 
     def populate_list(self, filter_term: Optional[str] = None) -> None:
-        """Fills/Refills the listbox, optionally filtering."""
-        self.nak_listbox.delete(0, tk.END)
-        search_term = filter_term.lower() if filter_term else None
+        """Shows only the rows matching the filter (all rows when it is empty)."""
+        search_term = self._fold_search_text(filter_term) if filter_term else None
 
-        for nak in self.all_nakshatras:
-            display_name = f" {nak.get('num', '?')}. {nak['name']} ({nak['devanagari']})"
-            
-            # Check if filtering is needed
-            if search_term:
-                 # More comprehensive search
-                 match = (search_term in nak['name'].lower() or
-                          search_term in nak['sanskrit'].lower() or
-                          search_term in nak['lord'].lower() or
-                          search_term in nak['deity'].lower() or
-                          search_term in str(nak.get('num', '')))
-                 if match:
-                      self.nak_listbox.insert(tk.END, display_name)
-            else:
-                 # No filter, add all
-                 self.nak_listbox.insert(tk.END, display_name)
+        # Name, Sanskrit name, lord, deity and number are searched in one pass
+        matched = [iid for iid, haystack in zip(self._row_iids, self._search_haystacks)
+                   if not search_term or search_term in haystack]
+
+        # set_children reattaches the matches in list order and detaches every
+        # other row in one call; no rows are deleted or recreated
+        self.nak_tree.set_children('', *matched)
 
     def filter_nakshatras(self, *args: Any) -> None:
-        """Calls populate_list with the current search term."""
+        """
+        Schedules populate_list with the current search term.
+
+        Rapid keystrokes are coalesced: each one cancels the pending refresh,
+        so the list is refreshed once, FILTER_DEBOUNCE_MS after typing stops.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(self.FILTER_DEBOUNCE_MS, self._run_filter)
+
+    def _run_filter(self) -> None:
+        """Runs the debounced filter scheduled by filter_nakshatras."""
+        self._filter_job = None
         self.populate_list(self.search_var.get())
 
     def populate_syllables_tab(self) -> None:
@@ -5549,129 +5734,125 @@ class EnhancedNakshatraTab(ttk.Frame):
         self.syllables_text.delete('1.0', tk.END)
         
         title = "NAKSHATRA NAME SYLLABLES (AVAKAHADA CHAKRA)"
-        header_bar = "═" * 66
-        
-        # Define tags for bold and header
-        self.syllables_text.tag_configure("header", font=('Segoe UI', 12, 'bold'), justify='center')
-        self.syllables_text.tag_configure("subheader", font=('Segoe UI', 10), foreground="#cccccc") # Lighter gray
-        self.syllables_text.tag_configure("nak_name", font=('Segoe UI', 11, 'bold'))
-        self.syllables_text.tag_configure("syllable_data", font=('Segoe UI', 11))
 
-        # Insert Header
-        self.syllables_text.insert(tk.END, f"{title}\n", "header")
-        self.syllables_text.insert(tk.END, f"{header_bar}\n\n", "header")
-        
-        # Insert Subheader description
+        # Subheader description
         desc = ("Traditional starting syllables for names based on the Moon's "
                 "Nakshatra Pada (quarter) at birth.\n\n")
-        self.syllables_text.insert(tk.END, desc, "subheader")
-        
-        # Insert Nakshatra Data
+
+        # Collect (text, tag) pairs for the header and every Nakshatra, then insert
+        # them with one Text.insert call (it accepts alternating text/tag arguments)
+        chunks = [f"{title}\n", "header", f"{_HEADER_BAR}\n\n", "header", desc, "subheader"]
         for nak in self.all_nakshatras:
             syllables = nak.get('syllables', ['N/A']*4)
             syllable_str = f"Pada 1: {syllables[0]}, Pada 2: {syllables[1]}, Pada 3: {syllables[2]}, Pada 4: {syllables[3]}"
             
             nak_display = f"{nak.get('num', '?')}. {nak['name']} ({nak['devanagari']})"
-            self.syllables_text.insert(tk.END, f"{nak_display}\n", "nak_name")
-            self.syllables_text.insert(tk.END, f"    {syllable_str}\n\n", "syllable_data")
-            
+            chunks += [f"{nak_display}\n", "nak_name", f"    {syllable_str}\n\n", "syllable_data"]
+
+        self.syllables_text.insert(tk.END, *chunks)
         self.syllables_text.config(state='disabled')
         
     def on_select(self, event: Optional[tk.Event]) -> None:
-        """Called when a user clicks on an item in the listbox."""
-        selection = self.nak_listbox.curselection()
+        """Called when a user clicks on an item in the list."""
+        selection = self.nak_tree.selection()
         if not selection: return 
 
-        # Get listbox text and extract the number part to find the nakshatra
-        nak_name_full = self.nak_listbox.get(selection[0]).strip()
-        try:
-            # Extract number like "1." from " 1. Ashwini (अश्विनी)"
-            nak_num_str = nak_name_full.split('.')[0]
-            nak_num = int(nak_num_str)
-        except (ValueError, IndexError):
-            print(f"Error parsing Nakshatra number from: {nak_name_full}")
-            return # Handle potential parsing error
-
-        # Find the matching data dictionary using the number
-        nak_data = next((n for n in self.all_nakshatras if n.get('num') == nak_num), None)
+        # Row ids are the nakshatra numbers
+        nak_data = self._by_num.get(int(selection[0]))
 
         if nak_data:
             self.show_details(nak_data)
             # Switch focus to the details tab when selection changes
             self.details_notebook.select(0)
 
-    def show_details(self, nak: Dict[str, Any]) -> None:
+    def show_details(self, nak: Mapping[str, Any]) -> None:
         """Displays the formatted details for a selected Nakshatra."""
+        details = self._rendered.get(nak.get('num'))
+        if details is None:
+            details = self._render_details(nak)
+
         self.details_text.config(state='normal')
         self.details_text.delete('1.0', tk.END)
-        
+        self.details_text.insert('1.0', details)
+        self.details_text.config(state='disabled')
+
+    def _render_details(self, nak: Mapping[str, Any]) -> str:
+        """Builds the 'Details' text for a Nakshatra (no Tk calls)."""
         title = f"{nak.get('num', '?')}. {nak['name'].upper()} ({nak['devanagari']})"
-        separator = "─" * 66 
-
-        # Helper for wrapping text - ensure import textwrap at top
-        def wrap_text(text: str, width: int = 66, indent='  ') -> str:
-            if not text or not text.strip(): return indent + "N/A"
-            lines = text.split('\n')
-            wrapped_lines = [textwrap.fill(
-                line, width=width, initial_indent=indent, subsequent_indent=indent,
-                break_long_words=False, replace_whitespace=False
-            ) for line in lines]
-            return '\n'.join(wrapped_lines)
+        # Helper for wrapping text (66 columns, two-space indent)
+        def wrap_text(text: str) -> str:
+            if not text or not text.strip(): return "  N/A"
+            return '\n'.join(_DETAIL_WRAPPER.fill(line) for line in text.split('\n'))
 
         syllables = nak.get('syllables', ['N/A']*4)
         padas_nav = nak.get('padas_navamsha', ['?']*4)
 
-        details = f"""
- {title.center(66)}
-{separator}
+        fields = {
+            'title_centered': title.center(_DETAIL_WIDTH),
+            'separator': _SEP,
+            'keywords_wrapped': wrap_text(nak.get('keywords', 'N/A')),
+            'bphs_note_wrapped': wrap_text(nak.get('bphs_note', 'N/A')),
+            'lal_kitab_note_wrapped': wrap_text(nak.get('lal_kitab_note', 'N/A')),
+        }
+        for pada in range(4):
+            fields[f'pada_{pada + 1}_navamsha'] = padas_nav[pada]
+            fields[f'syllable_{pada + 1}'] = syllables[pada]
 
- CORE ATTRIBUTES
-{separator}
-   {'Ruling Lord':<18}: {nak.get('lord','N/A')}
-   {'Presiding Deity':<18}: {nak.get('deity', 'N/A')}
-   {'Symbol':<18}: {nak.get('symbol', 'N/A')}
+        return self.DETAILS_TEMPLATE.format_map(ChainMap(fields, nak, self.DETAIL_DEFAULTS)).strip()
 
- CLASSIFICATION (BPHS / Classical)
+class EnhancedPlanetTab(ttk.Frame):
+    """
+    This class defines the "Planetary Guide" tab with enhanced aesthetics.
+    Uses a tk.Listbox for a stable, clean, and efficient UI.
+    """
+    # Layout of the details pane, filled per planet via str.format_map.
+    # The dignities rows (variable length) go between the two parts.
+    DETAILS_HEAD_TEMPLATE: str = """
+ BPHS KARAKA (SIGNIFICATOR)
 {separator}
-   {'Gana (Temperament)':<18}: {nak.get('gana', 'N/A')}
-   {'Yoni (Animal)':<18}: {nak.get('yoni', 'N/A')}
-   {'Nadi (Constitution)':<18}: {nak.get('nadi', 'N/A')}
-   {'Guna (Quality)':<18}: {nak.get('guna', 'N/A')}
-   {'Tattva (Element)':<18}: {nak.get('tattva', 'N/A')}
-   {'Motivation':<18}: {nak.get('motivation', 'N/A')}
-   {'Nature':<18}: {nak.get('nature', 'N/A')}
+{karaka_wrapped}
 
- PADA (QUARTERS) & NAME SYLLABLES
+ BPHS DIGNITIES & CORE
 {separator}
-   {'Pada 1 Navamsha':<18}: {padas_nav[0]:<15} Syllable: {syllables[0]}
-   {'Pada 2 Navamsha':<18}: {padas_nav[1]:<15} Syllable: {syllables[1]}
-   {'Pada 3 Navamsha':<18}: {padas_nav[2]:<15} Syllable: {syllables[2]}
-   {'Pada 4 Navamsha':<18}: {padas_nav[3]:<15} Syllable: {syllables[3]}
+"""
+    DETAILS_TAIL_TEMPLATE: str = f"""
+   {('Nature'):<18}: {{nature}}
+   {('Vimshottari Dasha'):<18}: {{vimshottari_dasha}}
+   {('Aspects'):<18}: {{aspects}}
 
- KEYWORDS & SIGNIFICATIONS
-{separator}
-{wrap_text(nak.get('keywords', 'N/A'))}
+ BPHS ATTRIBUTES
+{{separator}}
+   {('Gender'):<18}: {{gender}}
+   {('Element (Tattva)'):<18}: {{element}}
+   {('Caste'):<18}: {{caste}}
+   {('Direction'):<18}: {{direction}}
+   {('Gemstone'):<18}: {{gemstone}}
+   {('Deity'):<18}: {{deity}}
+   {('Body Part'):<18}: {{body_part}}
 
- BPHS / CLASSICAL NOTE
-{separator}
-{wrap_text(nak.get('bphs_note', 'N/A'))}
+ BPHS RELATIONSHIPS (Graha Maitri)
+{{separator}}
+   {('Friends'):<18}: {{friends}}
+   {('Neutral'):<18}: {{neutrals}}
+   {('Enemies'):<18}: {{enemies}}
 
- LAL KITAB NOTE
-{separator}
-{wrap_text(nak.get('lal_kitab_note', 'N/A'))}
-"""
-        self.details_text.insert('1.0', details.strip())
-        self.details_text.config(state='disabled')
+ ADVANCED NOTES
+{{separator}}
+ BPHS NOTE:
+{{bphs_note_wrapped}}
 
-class EnhancedPlanetTab(ttk.Frame):
-    """
-    This class defines the "Planetary Guide" tab with enhanced aesthetics.
-    Uses a tk.Listbox for a stable, clean, and efficient UI.
-    """
+ LAL KITAB NOTE:
+{{lal_kitab_note_wrapped}}
+"""
+    DETAIL_DEFAULTS: Dict[str, str] = dict.fromkeys(
+        ('nature', 'vimshottari_dasha', 'aspects', 'gender', 'element', 'caste',
+         'direction', 'gemstone', 'deity', 'body_part'), 'N/A')
     def __init__(self, parent: ttk.Notebook, app: 'AstroVighatiElite') -> None:
         super().__init__(parent)
         self.app = app
         self.all_planets = self.app.astro_data.get_all_planets()
+        # Details text never changes at runtime, so it is rendered once up front
+        self._rendered: Dict[str, str] = {p['name']: self._render_details(p) for p in self.all_planets}
         
         # --- Define theme colors for easier management ---
         self.theme_bg = "#2e2e2e" 
@@ -5679,18 +5860,9 @@ class EnhancedPlanetTab(ttk.Frame):
         self.select_bg = "#005f9e" # A slightly different blue for selection
         self.header_fg = "#ffcc66" # Example color for headers
 
-        self.create_styles() # Create custom styles
+        # ttk styles are configured once for all explorer tabs (see configure_explorer_styles)
         self.create_ui()
 
-    def create_styles(self):
-        """Configure custom ttk styles if needed (e.g., for headers)."""
-        style = ttk.Style()
-        # You might already have a Heading.TLabel, adjust if needed
-        style.configure("TabHeader.TLabel", foreground=self.header_fg, 
-                        font=('Segoe UI', 13, 'bold')) 
-        style.configure("DetailHeader.TLabel", foreground=self.header_fg,
-                        font=('Segoe UI', 12, 'bold'))
-
     def create_ui(self) -> None:
         # --- Increased padding for the main paned window ---
         paned = ttk.PanedWindow(self, orient='horizontal')
@@ -5729,9 +5901,9 @@ class EnhancedPlanetTab(ttk.Frame):
         # Bind the selection event
         self.planet_listbox.bind('<<ListboxSelect>>', self.on_select)
 
-        # Populate the listbox
-        for planet in self.all_planets:
-            self.planet_listbox.insert(tk.END, f" {planet['symbol']}  {planet['name']} ({planet['devanagari']})") # Added extra space after symbol
+        # Populate the listbox in a single call
+        self.planet_listbox.insert(tk.END, *(f" {planet['symbol']}  {planet['name']} ({planet['devanagari']})" # Added extra space after symbol
+                                             for planet in self.all_planets))
 
         # Right Panel (Details)
         # --- Increased padding ---
@@ -5759,10 +5931,15 @@ class EnhancedPlanetTab(ttk.Frame):
         )
         self.planet_text.pack(fill='both', expand=True)
 
-        # Select first item by default
+        # Select first item by default; it is displayed when this tab is first shown
         if self.planet_listbox.size() > 0:
             self.planet_listbox.selection_set(0)
-            self.on_select(None) 
+            self._first_map_bind = self.bind('<Map>', self._on_first_map)
+
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Displays the default selection the first time the tab is mapped."""
+        self.unbind('<Map>', self._first_map_bind)
+        self.on_select(None)
 
 
     def on_select(self, event: Optional[tk.Event]) -> None:
@@ -5778,34 +5955,30 @@ class EnhancedPlanetTab(ttk.Frame):
             self.show_planet(planet_data)
 
 
-    def show_planet(self, planet: Dict[str, Any]) -> None:
+    def show_planet(self, planet: Mapping[str, Any]) -> None:
         """Displays the formatted details for a selected Planet."""
-        
+        details = self._rendered.get(planet['name'])
+        if details is None:
+            details = self._render_details(planet)
+
         # Update the header label
         # --- Added extra spacing ---
         self.planet_header_label.config(text=f" {planet['symbol']}   {planet['name']} ({planet['devanagari']})")
         
         self.planet_text.config(state='normal')
         self.planet_text.delete('1.0', tk.END)
-        
-        # --- Define consistent line separator ---
-        separator = "─" * 66 
+        self.planet_text.insert('1.0', details)
+        self.planet_text.config(state='disabled')
 
+    def _render_details(self, planet: Mapping[str, Any]) -> str:
+        """Builds the details text for a Planet (no Tk calls)."""
         # Helper for formatting lists
         def join_list(lst):
             return ", ".join(lst) if lst else "None"
 
-        # Helper for wrapping long text blocks
-        def wrap_text(text: str, width: int = 66) -> str: # Adjusted width
-            lines = text.split('\n')
-            wrapped_lines = [textwrap.fill(
-                line, 
-                width=width, 
-                initial_indent='  ', # Indent wrapped text
-                subsequent_indent='  ',
-                break_long_words=False,
-                replace_whitespace=False
-            ) for line in lines]
+        # Helper for wrapping long text blocks (66 columns, two-space indent)
+        def wrap_text(text: str) -> str:
+            wrapped_lines = [_DETAIL_WRAPPER.fill(line) for line in text.split('\n')]
             # Remove initial indent if the original text was empty or just whitespace
             if not text.strip():
                  return ""
@@ -5816,50 +5989,23 @@ class EnhancedPlanetTab(ttk.Frame):
             return '\n'.join(wrapped_lines).strip() # Strip leading/trailing whitespace from final block
 
 
-        # Using f-string for cleaner formatting, removed ASCII box
-        details = f"""
- BPHS KARAKA (SIGNIFICATOR)
-{separator}
-{wrap_text(planet.get('karaka','N/A'))}
+        fields = {
+            'separator': _SEP,
+            'karaka_wrapped': wrap_text(planet.get('karaka','N/A')),
+            'friends': join_list(planet.get('friendly',[])),
+            'neutrals': join_list(planet.get('neutral', [])),
+            'enemies': join_list(planet.get('enemy',[])),
+            'bphs_note_wrapped': wrap_text(planet.get('bphs_note', 'N/A')),
+            'lal_kitab_note_wrapped': wrap_text(planet.get('lal_kitab_note', 'N/A')),
+        }
+        field_map = ChainMap(fields, planet, self.DETAIL_DEFAULTS)
 
- BPHS DIGNITIES & CORE
-{separator}
-"""
+        # Collect the pieces and join once rather than growing a string with +=
+        parts = [self.DETAILS_HEAD_TEMPLATE.format_map(field_map)]
         dignities = planet.get('dignities', {})
-        for dignity, value in dignities.items():
-            details += f"   {dignity:<18}: {value}\n" 
-            
-        details += f"""
-   {('Nature'):<18}: {planet.get('nature','N/A')}
-   {('Vimshottari Dasha'):<18}: {planet.get('vimshottari_dasha','N/A')}
-   {('Aspects'):<18}: {planet.get('aspects', 'N/A')}
-
- BPHS ATTRIBUTES
-{separator}
-   {('Gender'):<18}: {planet.get('gender','N/A')}
-   {('Element (Tattva)'):<18}: {planet.get('element', 'N/A')}
-   {('Caste'):<18}: {planet.get('caste', 'N/A')}
-   {('Direction'):<18}: {planet.get('direction', 'N/A')}
-   {('Gemstone'):<18}: {planet.get('gemstone', 'N/A')}
-   {('Deity'):<18}: {planet.get('deity', 'N/A')}
-   {('Body Part'):<18}: {planet.get('body_part', 'N/A')}
-
- BPHS RELATIONSHIPS (Graha Maitri)
-{separator}
-   {('Friends'):<18}: {join_list(planet.get('friendly',[]))}
-   {('Neutral'):<18}: {join_list(planet.get('neutral', []))}
-   {('Enemies'):<18}: {join_list(planet.get('enemy',[]))}
-
- ADVANCED NOTES
-{separator}
- BPHS NOTE:
-{wrap_text(planet.get('bphs_note', 'N/A'))}
-
- LAL KITAB NOTE:
-{wrap_text(planet.get('lal_kitab_note', 'N/A'))}
-"""
-        self.planet_text.insert('1.0', details.strip()) # Use strip() to remove leading/trailing blank lines
-        self.planet_text.config(state='disabled')
+        parts.extend(f"   {dignity:<18}: {value}\n" for dignity, value in dignities.items())
+        parts.append(self.DETAILS_TAIL_TEMPLATE.format_map(field_map))
+        return "".join(parts).strip() # Use strip() to remove leading/trailing blank lines
                 
 class EnhancedRashiTab(ttk.Frame):
     """
@@ -5869,9 +6015,46 @@ class EnhancedRashiTab(ttk.Frame):
     A simple, read-only encyclopedia for the 12 Rashis (Zodiac Signs)
     with advanced details for astrological study.
     """
+    # Layout of the details pane, filled per rashi via str.format_map
+    DETAILS_TEMPLATE: str = """
+╔══════════════════════════════════════════════════════════════════╗
+║  {title_centered}  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+BPHS CORE (CLASSICAL)
+──────────────────────────────────────────────────────────────────
+ Ruling Lord    : {lord}
+ Gender         : {gender}
+ Tattva (Element) : {tattva}
+ Modality (Nature): {modality}
+ Rising         : {rising}
+ Kalapurusha    : {kalapurusha}
+ Nature         : {nature}
+ Direction      : {direction}
+
+BPHS KARAKATVAS (SIGNIFICATIONS)
+──────────────────────────────────────────────────────────────────
+ Exaltation     : {exaltation}
+ Debilitation   : {debilitation}
+ Mooltrikona    : {mooltrikona}
+
+DESCRIPTION
+──────────────────────────────────────────────────────────────────
+ {description}
+
+LAL KITAB PERSPECTIVE
+──────────────────────────────────────────────────────────────────
+ {lal_kitab_note}
+"""
+    DETAIL_DEFAULTS: Dict[str, str] = dict.fromkeys(
+        ('lord', 'gender', 'tattva', 'modality', 'rising', 'kalapurusha', 'nature',
+         'direction', 'description', 'lal_kitab_note'), 'N/A')
     def __init__(self, parent: ttk.Notebook, app: 'AstroVighatiElite') -> None:
         super().__init__(parent)
         self.app = app # This holds the reference to your main app
+        self.all_rashis = self.app.astro_data.get_all_rashis()
+        # Details text never changes at runtime, so it is rendered once up front
+        self._rendered: Dict[str, str] = {r['name']: self._render_details(r) for r in self.all_rashis}
         self.create_ui()
 
     def create_ui(self) -> None:
@@ -5899,9 +6082,8 @@ class EnhancedRashiTab(ttk.Frame):
 
         self.rashi_listbox.bind('<<ListboxSelect>>', self.on_select)
 
-        # Assumes self.app.astro_data.get_all_rashis() exists
-        for rashi in self.app.astro_data.get_all_rashis():
-            self.rashi_listbox.insert(tk.END, f" {rashi['name']} ({rashi['devanagari']})")
+        self.rashi_listbox.insert(tk.END, *(f" {rashi['name']} ({rashi['devanagari']})"
+                                            for rashi in self.all_rashis))
 
         # Right Panel (Details)
         right_panel = ttk.Frame(paned, padding=10)
@@ -5916,10 +6098,15 @@ class EnhancedRashiTab(ttk.Frame):
         )
         self.rashi_text.pack(fill='both', expand=True)
 
-        # Select first item by default
+        # Select first item by default; it is displayed when this tab is first shown
         if self.rashi_listbox.size() > 0:
             self.rashi_listbox.selection_set(0)
-            self.on_select(None) # Trigger display
+            self._first_map_bind = self.bind('<Map>', self._on_first_map)
+
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Displays the default selection the first time the tab is mapped."""
+        self.unbind('<Map>', self._first_map_bind)
+        self.on_select(None)
 
 
     def on_select(self, event: Optional[tk.Event]) -> None:
@@ -5927,383 +6114,557 @@ class EnhancedRashiTab(ttk.Frame):
         selection = self.rashi_listbox.curselection()
         if not selection: return
 
-        rashi_name_full = self.rashi_listbox.get(selection[0]).strip()
-        rashi_name_eng = rashi_name_full.split(' (')[0]
-
-        rashi_data = next((r for r in self.app.astro_data.get_all_rashis() if r['name'] == rashi_name_eng), None)
+        # Listbox rows are inserted in self.all_rashis order
+        rashi_data = self.all_rashis[selection[0]]
         if rashi_data:
             self.show_details(rashi_data)
 
-    def show_details(self, rashi: Dict[str, Any]) -> None:
+    def show_details(self, rashi: Mapping[str, Any]) -> None:
         """Displays the formatted details for a selected Rashi."""
+        details = self._rendered.get(rashi['name'])
+        if details is None:
+            details = self._render_details(rashi)
+
         self.rashi_text.config(state='normal')
         self.rashi_text.delete('1.0', tk.END)
-        
+        self.rashi_text.insert('1.0', details)
+        self.rashi_text.config(state='disabled')
+
+    def _render_details(self, rashi: Mapping[str, Any]) -> str:
+        """Builds the details text for a Rashi (no Tk calls)."""
         title = f"{rashi['name'].upper()} ({rashi['sanskrit']} / {rashi['devanagari']})"
         bphs = rashi.get('bphs_special', {}) # Get the sub-dict
 
-        details = f"""
-╔══════════════════════════════════════════════════════════════════╗
-║  {title.center(62)}  ║
-╚══════════════════════════════════════════════════════════════════╝
-
-BPHS CORE (CLASSICAL)
-──────────────────────────────────────────────────────────────────
- Ruling Lord    : {rashi.get('lord','N/A')}
- Gender         : {rashi.get('gender','N/A')}
- Tattva (Element) : {rashi.get('tattva','N/A')}
- Modality (Nature): {rashi.get('modality','N/A')}
- Rising         : {rashi.get('rising','N/A')}
- Kalapurusha    : {rashi.get('kalapurusha','N/A')}
- Nature         : {rashi.get('nature','N/A')}
- Direction      : {rashi.get('direction','N/A')}
-
-BPHS KARAKATVAS (SIGNIFICATIONS)
-──────────────────────────────────────────────────────────────────
- Exaltation     : {bphs.get('exaltation', 'None')}
- Debilitation   : {bphs.get('debilitation', 'None')}
- Mooltrikona    : {bphs.get('mooltrikona', 'None')}
+        fields = {
+            'title_centered': title.center(62),
+            'exaltation': bphs.get('exaltation', 'None'),
+            'debilitation': bphs.get('debilitation', 'None'),
+            'mooltrikona': bphs.get('mooltrikona', 'None'),
+        }
+        return self.DETAILS_TEMPLATE.format_map(ChainMap(fields, rashi, self.DETAIL_DEFAULTS))
+        
+# --- Enhanced Data Functions ---
+# The record tables are module-level constants built once at import; the
+# getters return them directly, so every caller shares the same objects.
+# Everything shared is immutable (frozen records, tuples, read-only
+# MappingProxyType views), so no caller can alter another's data.
+
+# Yoga/Dosha name -> Devanagari form, kept out of the records themselves
+_DEVANAGARI: Mapping[str, str] = MappingProxyType({
+    "Ruchaka Yoga": "रूचक योग",
+    "Bhadra Yoga": "भद्र योग",
+    "Hamsa Yoga": "हंस योग",
+    "Malavya Yoga": "मालव्य योग",
+    "Sasa Yoga": "शश योग",
+    "Dharma-Karmadhipati Yoga": "धर्म कर्माधिपति योग",
+    "Gaja Kesari Yoga": "गज केसरी योग",
+    "Neecha Bhanga Rajyoga": "नीच भंग राजयोग",
+    "Viparita Rajyoga": "विपरीत राजयोग",
+    "Budhaditya Yoga": "बुधादित्य योग",
+    "Chandra Mangala Yoga": "चंद्र मंगल योग",
+    "Manglik Dosha": "मांगलिक दोष",
+    "Kaal Sarpa Dosha": "काल सर्प दोष",
+    "Pitra Dosha": "पितृ दोष",
+    "Grahan Dosha": "ग्रहण दोष",
+    "Kendradhipati Dosha": "केन्द्राधिपति दोष",
+    "Guru Chandal Dosha": "गुरु चांडाल दोष",
+    "Vish Yoga": "विष योग",
+    "Kemadruma Dosha": "केमद्रुम दोष",
+})
+
+def devanagari_for(name: str) -> str:
+    """Returns the Devanagari form of a Yoga/Dosha name ('' if unknown)."""
+    return _DEVANAGARI.get(name, "")
+
+@dataclass(frozen=True, slots=True)
+class YogaRecord:
+    """One Yoga or Dosha reference entry (immutable; fields are plain strings)."""
+    category: str
+    name: str
+    formation: str
+    logic: str
+    bphs_results: str
+    lal_kitab_note: str
+    planet: str = "" # Only set for the Pancha Mahapurusha Yogas
+
+    def __post_init__(self) -> None:
+        # Intern the short fields the Yogas & Doshas tab compares and uses as
+        # dict keys, so equal values share one object across records and the
+        # tab's own lookup dicts. (The long prose fields are unique, and equal
+        # literals already share the module's constant table.)
+        for key in ('category', 'name', 'planet'):
+            object.__setattr__(self, key, sys.intern(getattr(self, key)))
+        # The triple-quoted prose carries the source indentation on every line;
+        # drop the common margin once here instead of in every renderer.
+        for key in ('formation', 'logic', 'bphs_results', 'lal_kitab_note'):
+            object.__setattr__(self, key, textwrap.dedent(getattr(self, key)))
+
+    @property
+    def devanagari(self) -> str:
+        """The Devanagari form of `name`, looked up in the shared _DEVANAGARI table."""
+        return devanagari_for(self.name)
+
+_MAHAPURUSHA_DATA_DETAILED: Tuple[YogaRecord, ...] = (
+    YogaRecord(category="Mahapurusha Yoga", name="Ruchaka Yoga", planet="Mars",
+     formation="Mars in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Aries, Scorpio) or exaltation sign (Capricorn).",
+     logic="Mars represents energy, courage, action, and determination. When strongly placed in an angular house (Kendra), which represents the pillars of life (self, home/mother, spouse/partnerships, career/public life), Mars infuses these areas with its core qualities. The individual becomes driven, courageous, and action-oriented in a way that defines their core identity and life path. It signifies a 'Martian' personality making its mark.",
+     bphs_results="""
+     BPHS describes the native as having a long face, attractive brows, dark hair, possibly cruel tendencies, fond of battle, and commanding presence.
+     - **Effects**: Grants physical strength, bravery, leadership qualities, success in competitive fields (military, police, sports, surgery), acquisition of land/property, potentially a commanding or aggressive nature.
+     - **Variations**: Strongest in Capricorn (exaltation), then Aries (Mooltrikona), then Scorpio. Placement in different Kendras modifies expression (1H: Personality, 4H: Domestic strength/conflict, 7H: Dominant partner/business, 10H: Powerful career).
+     """,
+     lal_kitab_note="""
+     Lal Kitab doesn't use the term 'Ruchaka Yoga'. However:
+     - Mars exalted in H10 (Capricorn) is considered extremely powerful ('Uchcha Mangal'), forming a 'Karmayogi' (driven worker) combination, excellent for career.
+     - Mars in H1 (Aries or Scorpio) can be 'Mangal Nek' (good) or 'Mangal Bad' depending on other factors, giving strong will but potential aggression.
+     - Focus is on the house Mars occupies and aspects, e.g., Mars in H3 ('Pakka Ghar') is strong. Remedies involve Mars items (honey, sindoor, helping brothers).
+     """
+    ),
+    YogaRecord(category="Mahapurusha Yoga", name="Bhadra Yoga", planet="Mercury",
+     formation="Mercury in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Gemini) or own & exaltation sign (Virgo).",
+     logic="Mercury represents intellect ('Buddhi'), communication, analysis, adaptability, and skill. When strongly placed in a Kendra, these qualities become central to the native's life expression. The person's intelligence, speech, and analytical abilities define their interactions with the world and their path.",
+     bphs_results="""
+     BPHS describes the native as lion-like (strong build), with a steady gait, long arms, learned, eloquent, virtuous, and having a 'satwik' nature.
+     - **Effects**: Grants high intelligence, sharp analytical skills, excellent communication (writing, speaking), dexterity, success in fields like academia, commerce, astrology, law, writing, media. Gives a youthful appearance and adaptability.
+     - **Variations**: Strongest in Virgo (exaltation + Mooltrikona), then Gemini. Placement modifies expression (1H: Intellectual personality, 4H: Learned mother/home environment, 7H: Intelligent partner/business, 10H: Career in communication/analysis).
+     """,
+     lal_kitab_note="""
+     Term not used.
+     - Mercury exalted in H6 (Virgo) gives sharp intellect, good for analysis and dealing with enemies/competition, but potentially problematic for maternal relatives ('nankaa ghar').
+     - Mercury in H7 ('Pakka Ghar') needs support.
+     - Mercury in Gemini (e.g., H1, H4, H7, H10) is strong but analyzed based on house rules. Remedies often involve serving young girls ('kanya daan' symbolism), using green items, or piercing the nose.
+     """
+    ),
+    YogaRecord(category="Mahapurusha Yoga", name="Hamsa Yoga", planet="Jupiter",
+     formation="Jupiter in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Sagittarius, Pisces) or exaltation sign (Cancer).",
+     logic="Jupiter ('Guru') represents wisdom, knowledge, expansion, dharma (righteousness), wealth, and fortune. When strong in a Kendra, these divine qualities become foundational pillars of the native's life, guiding their actions and bestowing grace.",
+     bphs_results="""
+     BPHS describes the native as having markings of Shankha (conch), Padma (lotus), etc. on hands/feet, handsome, virtuous, respected by rulers, fond of righteous deeds.
+     - **Effects**: Grants wisdom, knowledge of scriptures/philosophy, high morals, respect, good fortune, wealth, happiness from children, often association with teaching, law, finance, or spiritual guidance.
+     - **Variations**: Strongest in Cancer (exaltation), then Sagittarius (Mooltrikona), then Pisces. Placement modifies expression (1H: Wise/respected personality, 4H: Happy home/mother, good education, 7H: Noble partner, fortunate partnerships, 10H: Esteemed career in teaching/finance/law).
+     """,
+     lal_kitab_note="""
+     Term not used.
+     - Jupiter exalted in H4 (Cancer) is considered extremely auspicious, granting immense happiness, property, and divine grace ('Dev Guru' blessings).
+     - Jupiter in H9 ('Pakka Ghar') is strong for dharma and fortune.
+     - Jupiter in Sagittarius/Pisces (e.g., H1, H4, H7, H10) is powerful but analyzed by house. Remedies involve wearing gold, applying saffron ('kesar') tilak, respecting elders/gurus.
+     """
+    ),
+    YogaRecord(category="Mahapurusha Yoga", name="Malavya Yoga", planet="Venus",
+     formation="Venus in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Taurus, Libra) or exaltation sign (Pisces).",
+     logic="Venus ('Shukra') represents love, beauty, arts, pleasure, luxury, relationships, and diplomacy. When strong in a Kendra, these qualities define the native's life experience, bringing refinement, comfort, and strong relationship focus.",
+     bphs_results="""
+     BPHS describes the native as having a slender waist, attractive appearance, bright eyes, learned, wealthy, blessed with spouse, vehicles, and sensual enjoyments.
+     - **Effects**: Grants physical beauty, charm, artistic talents (music, arts, fashion), luxurious lifestyle, vehicles, happy relationships, diplomatic skills, success in creative fields or dealing with luxuries/women.
+     - **Variations**: Strongest in Pisces (exaltation), then Libra (Mooltrikona), then Taurus. Placement modifies expression (1H: Charming personality, 4H: Beautiful home/vehicles, happy mother, 7H: Attractive/loving spouse, success in partnerships, 10H: Career in arts/luxury/diplomacy).
+     """,
+     lal_kitab_note="""
+     Term not used.
+     - Venus exalted in H12 (Pisces) gives high-level comforts and luxury ('Uchcha Shukra') but can also indicate high expenses or hidden relationships.
+     - Venus in H7 ('Pakka Ghar') affects marriage significantly.
+     - Venus in Taurus/Libra (e.g., H1, H4, H7, H10) is strong but analyzed by house rules. Remedies often involve serving cows ('Gau Seva'), donating ghee/curd, maintaining good character.
+     """
+    ),
+    YogaRecord(category="Mahapurusha Yoga", name="Sasa Yoga", planet="Saturn",
+     formation="Saturn in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Capricorn, Aquarius) or exaltation sign (Libra).",
+     logic="Saturn ('Shani') represents discipline, structure, responsibility, perseverance, justice, and connection to the masses. When strong in a Kendra, these qualities form the foundation of the native's life, leading to authority and influence built through hard work and time.",
+     bphs_results="""
+     BPHS describes the native as commanding armies, ruling villages or towns, potentially having questionable morals (depending on other factors), interested in others' wealth, but successful and authoritative.
+     - **Effects**: Grants discipline, patience, perseverance, leadership, authority, influence over masses, success in politics, real estate, judiciary, or large organizations. Can indicate a serious demeanor. Rise often comes later in life after considerable effort.
+     - **Variations**: Strongest in Libra (exaltation), then Aquarius (Mooltrikona), then Capricorn. Placement modifies expression (1H: Serious/disciplined personality, 4H: Property, influence in homeland, 7H: Mature/stable partner, public dealings, 10H: Powerful career, leadership).
+     """,
+     lal_kitab_note="""
+     Term not used.
+     - Saturn exalted in H7 (Libra) is considered very good for wealth and status ('Uchcha Shani') but potentially problematic for marital harmony (delay or detachment).
+     - Saturn in H10 ('Pakka Ghar') is strong for career.
+     - Saturn in Capricorn/Aquarius (e.g., H1, H4, H7, H10) gives strong results based on house rules. Remedies involve donating oil, black cloth, serving the needy, feeding crows/snakes.
+     """
+    )
+)
+
+def get_mahapurusha_data_detailed() -> Tuple[YogaRecord, ...]:
+    """Returns detailed structured data for Pancha Mahapurusha Yogas."""
+    return _MAHAPURUSHA_DATA_DETAILED
+
+_RAJYOGA_DATA_DETAILED: Tuple[YogaRecord, ...] = (
+    YogaRecord(category="Rajyoga", name="Dharma-Karmadhipati Yoga",
+     formation="A connection between the lord of the 9th house (Dharma Bhava - fortune, righteousness, father, higher learning) and the lord of the 10th house (Karma Bhava - career, status, public life, action). Connection types: \n  • Conjunction (in any house, stronger in auspicious ones like Kendras/Trikonas).\n  • Mutual Aspect (Parashari aspects).\n  • Parivartana Yoga (Exchange of signs).\n  • Placement in each other's house.",
+     logic="This yoga links the house of purpose, fortune, and divine grace (9H) with the house of action, status, and worldly achievement (10H). It signifies that the native's actions (10H) are aligned with their purpose and supported by fortune (9H), leading to significant rise, success, and recognition in their profession and public life.",
+     bphs_results="""
+     Considered a Maha Raja Yoga (Great Royal Combination) in BPHS. Parashara states this makes one a 'King or equal to a King'.
+     - **Effects**: Grants high status, authority, success in career, fame, wealth, virtuous conduct, leadership roles, fulfillment of ambitions. The strength depends on the involved planets' dignity, house placement, and freedom from affliction. Strongest when formed in Kendras or Trikonas.
+     """,
+     lal_kitab_note="""
+     The concept of linking fortune (H9 - Jupiter's domain) and career (H10 - Saturn's domain) is highly valued.
+     - Conjunctions of planets ruling/representing these houses are analyzed based on the house they occur in. For example, Jupiter+Saturn can be powerful but also indicate struggle depending on placement.
+     - Lal Kitab emphasizes the 'activation age' of planets and houses, suggesting such yogas might fructify strongly at specific times. Remedies aim to strengthen the positive planet and pacify any negative influences.
+     """
+    ),
+    YogaRecord(category="Rajyoga", name="Gaja Kesari Yoga",
+     formation="Jupiter ('Gaja' - Elephant) is placed in a Kendra (1st, 4th, 7th, 10th house) from the Moon ('Kesari' - Lion, metaphorically). Important conditions for full effect: \n  • Jupiter and Moon should be strong (not debilitated, combust, or heavily afflicted).\n  • Ideally, Jupiter should not be in the 6th, 8th, or 12th house from the Ascendant.",
+     logic="The Moon represents the mind, emotions, and public perception. Jupiter represents wisdom, knowledge, expansion, and benevolence. When Jupiter strongly influences the Moon from an angular position, it imbues the mind with wisdom, optimism, morality, and expansive thinking. This leads to recognition, respect, and noble conduct.",
+     bphs_results="""
+     BPHS highlights this yoga's positive effects: Makes the native intelligent, virtuous, wealthy, acclaimed by rulers (authorities), possess lasting fame, build villages/towns (implying leadership/development), and destroy enemies through intellect. The analogy suggests the noble power (Jupiter) protecting/guiding the mind (Moon).
+     - **Effects**: Generally bestows intelligence, good speech, virtuous nature, fame, wealth, respect, strong character, and ability to influence others positively.
+     """,
+     lal_kitab_note="""
+     While the specific Kendra-from-Moon rule isn't used, the combination or mutual aspect of Moon and Jupiter is considered highly auspicious ('Sona+Chandi' - Gold+Silver).
+     - Jupiter exalted in H4 (Cancer - Moon's sign) strongly resonates with Gaja Kesari principles, giving immense domestic happiness and wisdom.
+     - If either planet is afflicted or in a 'bad' house (e.g., H6, H8, H12), the positive effects are reduced. Remedies aim to strengthen both planets (e.g., serving mother for Moon, respecting elders for Jupiter, using silver and gold).
+     """
+    ),
+    YogaRecord(category="Rajyoga", name="Neecha Bhanga Rajyoga",
+     formation="Cancellation ('Bhanga') of a planet's debilitation ('Neecha'). Numerous rules exist in classical texts, key ones include:\n  • Lord of the sign where the planet is debilitated (Dispositor) is in a Kendra from Lagna or Moon.\n  • Planet which gets Exalted in the sign where the planet is debilitated is in a Kendra from Lagna or Moon.\n  • Debilitated planet is conjunct or aspected by its Exaltation Lord.\n  • Debilitated planet aspects its own sign of debilitation.\n  • Debilitated planet exchanges signs with its Dispositor (a form of Parivartana).\n  • Two debilitated planets aspect each other.\n  • Debilitated planet is exalted in the Navamsha chart (D9).",
+     logic="A planet in debilitation is weak and struggles to express its positive qualities. 'Neecha Bhanga' implies that this weakness is overcome due to specific redeeming factors. This often signifies initial struggles, low self-esteem, or hardship related to the planet's significations, followed by a significant rise, often sudden or unexpected, as the 'cancellation' takes effect. The native gains strength through overcoming weakness.",
+     bphs_results="""
+     BPHS and other classics like Phaladeepika extensively list the rules for cancellation. A properly cancelled debilitation is stated to produce results equivalent to an exalted planet ('Raja Yoga'), making the person powerful, wealthy, and virtuous. The timing often corresponds to the Dasha periods of the planets involved in the cancellation.
+     - **Effects**: Potential for great success after initial struggles, resilience, overcoming adversity, achieving high status unexpectedly. The specific area of life depends on the planet and house involved.
+     """,
+     lal_kitab_note="""
+     Lal Kitab doesn't use the term 'Neecha Bhanga'. It analyzes debilitated planets ('Mandi Graha') based on house placement.
+     - A debilitated planet might receive support ('Madaad') from friendly planets placed in specific relative positions, mitigating the negativity.
+     - Some placements of debilitated planets are considered particularly bad (e.g., Sun in H7, Saturn in H1).
+     - Remedies focus on strengthening supporting planets or pacifying the debilitated planet through donations or actions related to its significations (e.g., serving uncles for bad Saturn).
+     """
+    ),
+     YogaRecord(category="Rajyoga", name="Viparita Rajyoga",
+     formation="Formed by lords of Dusthana houses (6th: Roga/Ripu - disease, debt, enemies; 8th: Randhra/Ayur - obstacles, longevity, secrets; 12th: Vyaya - loss, expense, isolation). Three types:\n  • **Harsha Yoga**: 6th Lord in 8th or 12th house.\n  • **Sarala Yoga**: 8th Lord in 6th or 12th house.\n  • **Vimala Yoga**: 12th Lord in 6th or 8th house.\n  **Crucial Condition**: The involved Dusthana lords should be relatively strong (e.g., not combust or heavily afflicted by other malefics) and SHOULD NOT be conjunct or aspected by lords of auspicious houses (Kendras, Trikonas).",
+     logic="'Viparita' means contrary or inverse. The negative potential of one difficult house lord placed in another difficult house tends to destroy the negativity of both houses involved, leading to positive outcomes arising from adversity. It's like 'a poison nullifies another poison'. The native gains through loss, overcomes enemies through challenges, or benefits from unexpected events.",
+     bphs_results="""
+     BPHS describes these yogas:
+     - **Harsha**: Happiness, enjoyment, destruction of enemies, good fortune.
+     - **Sarala**: Learning, prosperity, overcomes obstacles, long-lived, defeats foes.
+     - **Vimala**: Frugal, independent, virtuous conduct, happiness, good profession.
+     - **Effects**: Gives unexpected rise in life, sudden gains, ability to overcome powerful enemies or obstacles, success through unconventional means, often after a period of struggle or loss. Strength depends on the planets involved and lack of affliction.
+     """,
+     lal_kitab_note="""
+     The direct concept doesn't exist. However, planets in H6, H8, H12 are analyzed with specific rules:
+     - Sometimes, a malefic planet placed in these houses is said to 'kill' the negativity of the house (e.g., Mars in H6 can destroy enemies, Ketu in H6).
+     - Conversely, benefics in these houses are often considered weak or problematic ('Mande Graha').
+     - Lal Kitab focuses heavily on specific conjunctions and aspects within these houses, rather than just lordship placements. Remedies are highly specific to the planets and house.
+     """
+    ),
+    YogaRecord(category="Rajyoga", name="Budhaditya Yoga",
+     formation="Conjunction of the Sun (Aditya) and Mercury (Budha) in the same house. Conditions for strength:\n  • Mercury should not be combust (too close to the Sun, typically within 8-12 degrees depending on tradition). If combust, its intellectual power is weakened.\n  • The conjunction should occur in an auspicious house (Kendra, Trikona, 2H, 11H) or in favorable signs (like Gemini, Virgo, Leo).",
+     logic="The Sun represents soul, authority, and vitality. Mercury represents intellect, communication, and skill. Their combination synergizes these qualities, bestowing sharp intelligence, analytical ability, eloquence, learning capacity, and potential for recognition or status.",
+     bphs_results="""
+     BPHS and other texts praise this yoga. It is said to grant intelligence 'equal to the Sun's brilliance', skill in arts and sciences, persuasive speech, good reputation, wealth, and physical attractiveness. The house of conjunction significantly influences the area of manifestation.
+     - **Effects**: High intelligence, good education, strong communication skills, analytical mind, success in fields requiring intellect (writing, teaching, consulting, business).
+     """,
+     lal_kitab_note="""
+     Sun + Mercury conjunction is analyzed based on the house it occupies.
+     - Very auspicious in houses like H1, H4, H5, H11, considered 'Raj Yoga Saman' (equal to Raj Yoga), promising intelligence, wealth, and status.
+     - Can be problematic in certain houses (e.g., H7 - affecting spouse/partners, H10 - potentially causing career instability if afflicted).
+     - Mercury's combustion ('Budh Ast') is a key factor. Remedies aim to strengthen Mercury (e.g., green items, serving sisters/aunts) or balance the Sun's dominance.
+     """
+    ),
+    YogaRecord(category="Rajyoga", name="Chandra Mangala Yoga",
+     formation="Conjunction of the Moon and Mars in the same house, or being in mutual aspect (opposition 7th/7th, or Mars' special 4th/8th aspect onto Moon).",
+     logic="Combines the Moon (mind, emotions, liquidity, public) with Mars (energy, action, drive, property). This synergy creates a dynamic mind focused on action and acquisition. Mars provides the energy to manifest the Moon's desires, particularly regarding wealth and assets.",
+     bphs_results="""
+     Classical texts often associate this yoga strongly with wealth generation ('Dhana Yoga'). BPHS suggests wealth possibly earned through dealings related to women, liquids, or even potentially unethical means if afflicted. It can also indicate a quick temper, impulsiveness, but also strong initiative and earning capacity.
+     - **Effects**: Strong drive, ambition, ability to earn wealth quickly, potential for property ownership, energetic mind, sometimes impatience or emotional volatility. Strength depends on sign/house placement and aspects.
+     """,
+     lal_kitab_note="""
+     Moon + Mars is generally considered a 'Lakshmi Yoga', highly auspicious for wealth ('Paisa'). Mars provides support ('Madaad') to the Moon (cash flow).
+     - Its effect is highly house-dependent. For example, in H4 (Moon's 'Pakka Ghar'), it can be excellent for property but potentially bad for mother's peace due to Mars. In H6, it might lead to debt issues.
+     - Remedies often focus on Mars (donating 'masoor dal', honey, sindoor) to channel its energy positively.
+     """
+    ),
+    # Add more Rajyogas here...
+)
+
+def get_rajyoga_data_detailed() -> Tuple[YogaRecord, ...]:
+    """Returns detailed structured data for common Rajyogas."""
+    return _RAJYOGA_DATA_DETAILED
+
+_DOSHA_DATA_DETAILED: Tuple[YogaRecord, ...] = (
+    YogaRecord(category="Dosha", name="Manglik Dosha",
+     formation="Mars placed in the 1st (personality), 4th (domestic peace), 7th (spouse), 8th (marital longevity/obstacles), or 12th (bed pleasures/loss) house from the Ascendant (Lagna), Moon (Chandra Lagna), or Venus (Kalatra Karaka). Some traditions (esp. South India) also include the 2nd house (family/speech).",
+     logic="Mars is a fiery, aggressive planet representing energy, conflict, and separation. Its placement in these sensitive houses related to self, home, partnership, and intimacy disrupts harmony. It injects Martian qualities (aggression, dominance, impatience, accidents) into areas requiring sensitivity and compromise, leading to marital friction, separation, or potential harm/ill health to the partner.",
+     bphs_results="""
+     BPHS (Stree Jataka chapter) explicitly links Mars in these houses (1, 4, 7, 8, 12) to potential widowhood for a female, implying danger to the spouse. It states the effect applies equally causing widower-hood for males.
+     - **Cancellation (Bhanga)**: The primary cancellation mentioned in BPHS is marriage to another person with a similar Manglik Dosha, nullifying the effect. Other classical cancellations include: Mars in own sign (Aries/Scorpio) or exaltation (Capricorn), Mars aspected by strong benefics (esp. Jupiter), Mars in certain signs within these houses (e.g., Mars in Leo/Aquarius often considered less malefic), presence of strong benefics in Kendras.
+     """,
+     lal_kitab_note="""
+     Lal Kitab doesn't use the specific 1/4/7/8/12 house rule from Lagna/Moon/Venus. It identifies 'Mangal Bad' (Bad Mars) based on specific house placements or conjunctions, regardless of marriage implications:
+     - Mars in H1 or H8 is often considered 'Bad'.
+     - Mars in H4 is particularly bad, said to 'burn' family happiness.
+     - Mars conjunct Saturn is highly problematic ('Manda Mangal').
+     - Remedies focus on pacifying Mars ('Thanda Karna') or improving its effects, e.g., feeding sweet tandoori roti to dogs, donating 'masoor dal' (red lentils), keeping an elephant tusk (real/ivory substitute), respecting brothers.
+     """
+    ),
+    YogaRecord(category="Dosha", name="Kaal Sarpa Dosha",
+     formation="All seven classical planets (Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn) are located between the Rahu-Ketu axis (within 180 degrees). Two main types:\n  • **Anuloma**: Planets moving towards Rahu (Ketu -> Rahu direction).\n  • **Viloma**: Planets moving towards Ketu (Rahu -> Ketu direction).\n  Partial Kaal Sarpa is when one planet escapes the axis.",
+     logic="(Modern Interpretation) Rahu (the head - insatiable desire, future karma) and Ketu (the tail - detachment, past karma) represent the karmic axis. When all planets are 'hemmed' or 'trapped' between them, the native's life is strongly influenced by this karmic pull. It suggests a life where free will feels constrained, events happen suddenly, and progress is often blocked or delayed until the karmic pattern is worked through (often stated to be effective up to mid-life).",
+     bphs_results="""
+     **This yoga is NOT mentioned in BPHS** or other primary classical astrological texts like Phaladeepika, Jataka Parijata, Saravali. It gained prominence in 20th-century Indian astrology. Classical scholars argue that Rahu/Ketu act through their dispositors and conjunctions, and this 'hemming' concept is not a standalone principle in Parashari astrology. The effects attributed to it can often be explained by other classical combinations involving Rahu/Ketu or house lordships.
+     """,
+     lal_kitab_note="""
+     Lal Kitab **does not use the term 'Kaal Sarpa Dosha'**.
+     - It analyzes Rahu and Ketu based on their house placement, conjunctions, and aspects according to its unique principles.
+     - For example, Rahu in H12 ('Pakka Ghar') or Ketu in H6 ('Pakka Ghar') have specific interpretations. Conjunctions like Rahu+Moon (Grahan) or Rahu+Jupiter (Chandal) are given specific meanings and remedies.
+     - Remedies are always specific to Rahu or Ketu based on their position and affliction (e.g., floating coal/barley/radish, keeping items like solid silver elephant).
+     """
+    ),
+    YogaRecord(category="Dosha", name="Pitra Dosha",
+     formation="A broad category indicating ancestral afflictions or karmic debts. No single combination, but common indicators include:\n  • **Sun afflicted**: Sun (significator of father/lineage) conjunct/aspected by Saturn, Rahu, or Ketu, especially in malefic houses or debilitation (Libra).\n  • **9th House afflicted**: 9H (father, ancestors, past merits) or 9th Lord afflicted by Saturn, Rahu, Ketu, or lords of Dusthanas.\n  • **Moon afflicted**: Moon (mother/mind) can also indicate maternal lineage issues if afflicted similarly.\n  • **Rahu/Ketu axis**: Across Lagna/7H or 2H/8H involving Sun/Moon/Jupiter.",
+     logic="The Sun and 9th house represent the connection to the paternal lineage, ancestors ('Pitrs'), and the store of past good karma ('Punya'). Afflictions indicate unresolved issues, unfulfilled duties, or negative karmic patterns passed down ('Rin' - debt) or curses ('Shrap') from ancestors. This blockage manifests as obstacles in the native's life, particularly concerning progeny (5H often gets impacted), health, finances, and overall well-being, as the ancestral blessings are obstructed.",
+     bphs_results="""
+     BPHS has a specific chapter titled **'Purva Janma Shapadyaya' (Curses from Past Lives)** which is the classical foundation for Pitra Dosha. It details numerous specific combinations indicating curses from father, mother, brother, spouse, Brahmin, etc., primarily manifesting as difficulty or denial in having children.
+     - **Example (Father's Curse)**: Sun in debilitation (Libra) in 5H, 5th Lord with malefic, Lagna Lord weak/afflicted.
+     - **Remedies**: BPHS suggests remedies like Japa (mantra), Homa (fire ritual), Daana (charity), Tarpana/Shraddha (rituals for ancestors), feeding Brahmins, and specific worship based on the afflicting planet.
+     """,
+     lal_kitab_note="""
+     **Pitra Rin (Ancestral Debt) is a fundamental concept in Lal Kitab.** It believes certain planetary placements indicate specific debts owed due to actions (or inactions) of ancestors, which the native must remedy ('Upay').
+     - **Examples**: Jupiter in H5 (debt related to Guru/father), Venus in H2/H7 afflicted (debt related to wife/mother figure), Saturn in H10/H11 afflicted (debt related to property/livelihood).
+     - **Diagnosis**: Based on specific planet+house combinations.
+     - **Remedies**: Unique and specific to the identified debt, often involving collective action by blood relatives (e.g., collecting equal money for religious purpose), serving specific relatives (e.g., uncles for Saturn), or specific donations/rituals.
+     """
+    ),
+    # ... (Include other Doshas like Grahan, Kendradhipati, etc. with similar detailed structure) ...
+     YogaRecord(category="Dosha", name="Grahan Dosha",
+     formation="'Eclipse Affliction'. Sun or Moon conjunct Rahu or Ketu in the same house. Proximity (degrees) matters; closer conjunction is stronger.",
+     logic="Rahu (North Node) and Ketu (South Node) are the astronomical points where eclipses occur. They are considered shadow entities that 'overpower' or 'afflict' the luminaries (Sun - soul, authority; Moon - mind, emotions) when conjunct. This dims the natural light and signifies psychological complexes, internal conflicts, or challenges related to the significations of the luminary involved.",
+     bphs_results="""
+     BPHS describes the results of Sun/Moon conjunctions with Rahu/Ketu:
+     - **Sun+Rahu/Ketu**: Can indicate issues with father, authority figures, government; lack of self-confidence, ego problems, health issues (heart, bones, eyes); potential for unconventional fame or downfall.
+     - **Moon+Rahu/Ketu**: Indicates mental turmoil, emotional instability, phobias, illusions, difficult relationship with mother; potential for psychic sensitivity or psychological issues; fluctuations in public life. Affliction is stronger during eclipses near the time of birth.
+     """,
+     lal_kitab_note="""
+     Called 'Grahan Yoga' (Eclipse Yoga). Considered highly significant and problematic.
+     - **Sun+Rahu**: Bad for father, government favors, reputation. Remedy: Floating coal ('koyla') or wheat ('gehu') in running water.
+     - **Sun+Ketu**: Bad for progeny (son), bodily health (joints). Remedy: Feeding monkeys (related to Sun), helping son/nephew.
+     - **Moon+Rahu**: Bad for mother, mental peace, finances ('khazana'). Remedy: Floating barley ('jau') washed in milk, wearing silver.
+     - **Moon+Ketu**: Bad for mother and progeny (son), causes detachment or mental confusion. Remedy: Feeding dogs (Ketu), wearing gold in ear (for progeny). The house of conjunction heavily modifies results.
+     """
+    ),
+    YogaRecord(category="Dosha", name="Kendradhipati Dosha",
+     formation="Applies ONLY to natural benefic planets (Jupiter, Venus, Mercury, strong/waxing Moon) when they OWN a Kendra house (1st, 4th, 7th, 10th from Ascendant). The 1st house lordship is generally exempt as it's also a Trikona. The dosha is strongest for Jupiter and Mercury owning the 7th or 10th.",
+     logic="This is a core Parashari principle of functional nature. Kendras are pillars requiring strong 'guards'. Benefics are considered 'gentle' and thus less effective or even obstructive when ruling these powerful houses; they lose some inherent beneficence. Conversely, natural malefics (Saturn, Mars) are 'tough' and become better 'guards', thus shedding some maleficence when ruling Kendras (esp. if not also ruling a Trikona).",
+     bphs_results="""
+     This principle is fundamental to how BPHS determines the functional benefic/malefic nature of planets for each Ascendant.
+     - **Example**: For Gemini Ascendant, Jupiter (great benefic) owns 7H & 10H (two Kendras) and is classified as a functional malefic, capable of causing significant issues during its Dasha. For Virgo Ascendant, Jupiter owns 4H & 7H, also gaining this dosha. Venus for Cancer (owns 4H/11H) or Leo (owns 3H/10H) gets the dosha from Kendra ownership.
+     - **Cancellation**: If the benefic also owns a Trikona (1H, 5H, 9H), it becomes a powerful Yogakaraka, cancelling the dosha (e.g., Venus for Capricorn/Aquarius, Mars for Cancer/Leo). Placement in Dusthanas (6, 8, 12) can sometimes mitigate the dosha by weakening the planet's ability to obstruct.
+     """,
+     lal_kitab_note="""
+     **This concept of functional maleficence based on Kendra lordship DOES NOT EXIST in Lal Kitab.**
+     - Planets are analyzed based on their inherent nature, house placement ('Pakka Ghar', 'Khaana'), conjunctions, aspects (Lal Kitab aspects are different), and ' सोया / जागा' (sleeping/awake) status.
+     - A benefic like Jupiter is always considered fundamentally benefic, but its results depend entirely on its house and combinations according to LK rules, not its Kendra lordship.
+     """
+    ),
+     YogaRecord(category="Dosha", name="Guru Chandal Dosha",
+     formation="Conjunction of Jupiter (Guru) and Rahu (Chandal - signifies outcast, unorthodox) OR Jupiter and Ketu in the same house.",
+     logic="Jupiter represents wisdom, dharma, teachers, expansion, and traditional knowledge. Rahu represents obsession, illusion, foreign influences, unconventionality, and breaking norms. Ketu represents detachment, past karma, headless action, spirituality, and criticism. \n  • **Jupiter+Rahu**: Rahu's obsessive, materialistic, and unorthodox energy 'pollutes' or overshadows Jupiter's wisdom and ethics. Can lead to flawed judgment, disrespect for gurus/tradition, using knowledge for selfish ends, unorthodox beliefs, or association with 'outcast' elements.\n  • **Jupiter+Ketu**: Ketu's critical, headless, or detached energy can undermine Jupiter's faith and expansion. Can lead to excessive self-criticism, doubt in teachers/beliefs, rejecting traditional wisdom, spiritual confusion, or focusing only on flaws.",
+     bphs_results="""
+     Classical texts consider these challenging conjunctions.
+     - **Jupiter+Rahu**: Often linked to heterodoxy, association with lower strata or foreigners, potential for financial speculation (Rahu amplifying Jupiter's wealth signification), but also clouded judgment and ethical compromises.
+     - **Jupiter+Ketu**: Can indicate deep spiritual seeking but also breaks in education, dissatisfaction with gurus, challenges with children, or sharp critical abilities used negatively. Effects highly dependent on sign, house, and strength.
+     """,
+     lal_kitab_note="""
+     Analyzed based on house.
+     - **Jupiter+Rahu**: Described as 'Hathi Be-Mahavat' (Elephant without a driver). Rahu (elephant) overpowers Jupiter (driver). Generally gives bad results for the house they occupy, causing misguided expansion or obsession. Remedies aim to separate them (e.g., wear gold for Jupiter, keep Rahu items like fennel separately).
+     - **Jupiter+Ketu**: Considered somewhat better than Jup+Rahu, especially in certain houses. Ketu (son) can sometimes follow Jupiter's (grandfather) guidance. However, can still cause issues related to progeny or spiritual path. Remedies might involve serving elders (Jupiter) and dogs (Ketu).
+     """
+    ),
+    YogaRecord(category="Dosha", name="Vish Yoga",
+     formation="'Poison Yoga'. Formed by the conjunction of Saturn (Shani) and the Moon (Chandra) in the same house, OR their strong mutual aspect (opposition 7/7, Saturn's 3rd/10th aspect on Moon, Moon aspecting Saturn).",
+     logic="The Moon represents the mind ('Manas'), emotions, mother, nourishment, and is soft/watery/receptive. Saturn represents sorrow ('Duhkha'), restriction, delays, coldness, discipline, and is hard/cold/dry/constrictive. When Saturn strongly influences the Moon, its heavy, pessimistic, and 'poisonous' qualities afflict the sensitive mind. This creates emotional blockages, pessimism, melancholy, fear, detachment from mother, or difficulty feeling/expressing emotions.",
+     bphs_results="""
+     This is a well-known and generally feared classical yoga. BPHS and other texts associate it with mental suffering, sorrow, emotional coldness, pessimism, difficulties with the mother, and potential for depression or psychological issues depending on severity and house placement (stronger in Kendras or afflicting Lagna). It can also make one disciplined and capable of enduring hardship, but often at the cost of emotional well-being.
+     """,
+     lal_kitab_note="""
+     Considered a very negative combination ('Zeher' - poison).
+     - Described as 'Maa ke doodh mein zeher' (poison in mother's milk) or 'Chandrama par Saanp ka pehra' (snake guarding the Moon).
+     - Highly detrimental to mental peace, mother's health/relationship, and finances (Moon represents liquidity).
+     - Effects vary by house (e.g., in H4 can ruin domestic peace, in H10 affects career).
+     - Remedies often involve separating their energies: Offering milk (Moon) on a Shivalingam (Saturn), donating Saturn items (oil, black cloth) while strengthening Moon (silver, pearls, serving mother), avoiding black/blue colors.
+     """
+    ),
+    YogaRecord(category="Dosha", name="Kemadruma Dosha",
+     formation="A major lunar dosha. Formed when there are NO planets (excluding the Sun, Rahu, and Ketu - Nodes are considered shadow points) in the 2nd house AND the 12th house counted *from the Moon's position*.",
+     logic="The Moon (mind) thrives on connection and reflection (planets nearby). The 2nd house from any point represents resources/support immediately following it, and the 12th represents support/expenditure just behind it. When both these adjacent houses are empty, the Moon is left isolated (' अकेली चंद्रमा '). This signifies a lack of immediate emotional, social, or financial support structure around the mind, leading to feelings of loneliness, instability, poverty, and mental distress.",
+     bphs_results="""
+     BPHS describes Kemadruma Yoga as causing poverty, sorrow, hard work with little reward, dependence on others, and a generally miserable or isolated existence. It is considered a strong 'Daridra Yoga' (yoga for poverty).
+     - **HOWEVER, BPHS and other texts give MANY CANCELLATIONS (Bhanga)** which are extremely common, making the *uncancelled* Kemadruma quite rare. Key cancellations include:
+       • Planets in a Kendra (1, 4, 7, 10) *from the Moon*.
+       • Planets in a Kendra *from the Ascendant*.
+       • Moon conjunct any planet (other than Sun/Nodes).
+       • Moon aspected by Jupiter.
+       • Moon in Navamsha exalted or in own sign.
+       • All planets aspecting the Moon.
+       If cancelled, the dosha's negative effects are greatly reduced or nullified.
+     """,
+     lal_kitab_note="""
+     The specific configuration of planets flanking the Moon (2nd/12th empty) is **not a primary concept** in Lal Kitab.
+     - The Moon's condition is assessed based on the HOUSE it occupies (e.g., Moon in H6, H8, H12 is generally bad), its conjunctions (e.g., Moon+Saturn = Vish Yoga, Moon+Rahu = Grahan), and whether it's 'sleeping' or 'awake'.
+     - Loneliness or lack of support would be interpreted based on afflictions to the Moon or houses like H4 (home/mother) or H11 (friends/network). Remedies would target the specific affliction found according to LK principles.
+     """
+    )
+)
+
+def get_dosha_data_detailed() -> Tuple[YogaRecord, ...]:
+    """Returns detailed structured data for common Doshas."""
+    return _DOSHA_DATA_DETAILED
+
+# All Yoga/Dosha records, in table order (Mahapurusha, Rajyoga, Dosha)
+_YOGA_DOSHA_RECORDS: Tuple[YogaRecord, ...] = (
+    *_MAHAPURUSHA_DATA_DETAILED, *_RAJYOGA_DATA_DETAILED, *_DOSHA_DATA_DETAILED)
+
+# Display order of the Yogas & Doshas list (by category, then name), and the
+# positions in it of each category's records, so the tab neither sorts nor
+# detects category boundaries itself
+_YOGA_DOSHA_SORTED: Tuple[YogaRecord, ...] = tuple(
+    sorted(_YOGA_DOSHA_RECORDS, key=lambda record: (record.category, record.name)))
+_YOGA_DOSHA_SORTED_GROUPS: Mapping[str, Tuple[int, ...]] = MappingProxyType({
+    category: tuple(index for index, record in enumerate(_YOGA_DOSHA_SORTED) if record.category == category)
+    for category in dict.fromkeys(record.category for record in _YOGA_DOSHA_SORTED)
+})
+
+@lru_cache(maxsize=None)
+def render_yoga_details(record: YogaRecord) -> str:
+    """
+    Builds the details-pane text for a Yoga/Dosha record (no Tk calls).
 
-DESCRIPTION
-──────────────────────────────────────────────────────────────────
- {rashi.get('description','N/A')}
+    Records are immutable, so each one is wrapped and formatted once; later
+    selections of the same record are served from the cache.
+    """
+    def wrap_line(stripped: str) -> str:
+        if not stripped:
+            return "" # Keep paragraph breaks as empty lines
+        # Check if line contains bullet points (•) or numbered lists (e.g., '• ')
+        is_list_item = stripped.startswith('•') or (len(stripped) > 1 and stripped[0].isdigit() and stripped[1:3] in ['. ','- '])
+
+        # List items get a deeper continuation indent to maintain alignment
+        wrapper = _DETAIL_LIST_WRAPPER if is_list_item else _DETAIL_WRAPPER
+        return wrapper.fill(stripped)
+
+    def wrap_text(text: str) -> str:
+        if not text or not text.strip(): return "  N/A"
+        # Single-paragraph fields (formation, logic) are wrapped directly,
+        # without splitting into lines and joining them back
+        if '\n' not in text:
+            return wrap_line(text.strip())
+        return '\n'.join([wrap_line(line.strip()) for line in text.split('\n')])
+
+    details = f"""
+ [{record.category.upper()}]
+{_SEP}
 
-LAL KITAB PERSPECTIVE
-──────────────────────────────────────────────────────────────────
- {rashi.get('lal_kitab_note','N/A')}
+ FORMATION:
+{_SEP}
+{wrap_text(record.formation)}
+"""
+    if record.planet:
+         details += f"""
+   {'Planet Involved':<18}: {record.planet}
 """
-        self.rashi_text.insert('1.0', details)
-        self.rashi_text.config(state='disabled')
-        
-# --- Enhanced Data Functions ---
 
-def get_mahapurusha_data_detailed() -> List[Dict[str, Any]]:
-    """Returns detailed structured data for Pancha Mahapurusha Yogas."""
-    return [
-        {"category": "Mahapurusha Yoga", "name": "Ruchaka Yoga", "devanagari": "रूचक योग", "planet": "Mars",
-         "formation": "Mars in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Aries, Scorpio) or exaltation sign (Capricorn).",
-         "logic": "Mars represents energy, courage, action, and determination. When strongly placed in an angular house (Kendra), which represents the pillars of life (self, home/mother, spouse/partnerships, career/public life), Mars infuses these areas with its core qualities. The individual becomes driven, courageous, and action-oriented in a way that defines their core identity and life path. It signifies a 'Martian' personality making its mark.",
-         "bphs_results": """
-         BPHS describes the native as having a long face, attractive brows, dark hair, possibly cruel tendencies, fond of battle, and commanding presence.
-         - **Effects**: Grants physical strength, bravery, leadership qualities, success in competitive fields (military, police, sports, surgery), acquisition of land/property, potentially a commanding or aggressive nature.
-         - **Variations**: Strongest in Capricorn (exaltation), then Aries (Mooltrikona), then Scorpio. Placement in different Kendras modifies expression (1H: Personality, 4H: Domestic strength/conflict, 7H: Dominant partner/business, 10H: Powerful career).
-         """,
-         "lal_kitab_note": """
-         Lal Kitab doesn't use the term 'Ruchaka Yoga'. However:
-         - Mars exalted in H10 (Capricorn) is considered extremely powerful ('Uchcha Mangal'), forming a 'Karmayogi' (driven worker) combination, excellent for career.
-         - Mars in H1 (Aries or Scorpio) can be 'Mangal Nek' (good) or 'Mangal Bad' depending on other factors, giving strong will but potential aggression.
-         - Focus is on the house Mars occupies and aspects, e.g., Mars in H3 ('Pakka Ghar') is strong. Remedies involve Mars items (honey, sindoor, helping brothers).
-         """
-        },
-        {"category": "Mahapurusha Yoga", "name": "Bhadra Yoga", "devanagari": "भद्र योग", "planet": "Mercury",
-         "formation": "Mercury in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Gemini) or own & exaltation sign (Virgo).",
-         "logic": "Mercury represents intellect ('Buddhi'), communication, analysis, adaptability, and skill. When strongly placed in a Kendra, these qualities become central to the native's life expression. The person's intelligence, speech, and analytical abilities define their interactions with the world and their path.",
-         "bphs_results": """
-         BPHS describes the native as lion-like (strong build), with a steady gait, long arms, learned, eloquent, virtuous, and having a 'satwik' nature.
-         - **Effects**: Grants high intelligence, sharp analytical skills, excellent communication (writing, speaking), dexterity, success in fields like academia, commerce, astrology, law, writing, media. Gives a youthful appearance and adaptability.
-         - **Variations**: Strongest in Virgo (exaltation + Mooltrikona), then Gemini. Placement modifies expression (1H: Intellectual personality, 4H: Learned mother/home environment, 7H: Intelligent partner/business, 10H: Career in communication/analysis).
-         """,
-         "lal_kitab_note": """
-         Term not used.
-         - Mercury exalted in H6 (Virgo) gives sharp intellect, good for analysis and dealing with enemies/competition, but potentially problematic for maternal relatives ('nankaa ghar').
-         - Mercury in H7 ('Pakka Ghar') needs support.
-         - Mercury in Gemini (e.g., H1, H4, H7, H10) is strong but analyzed based on house rules. Remedies often involve serving young girls ('kanya daan' symbolism), using green items, or piercing the nose.
-         """
-        },
-        {"category": "Mahapurusha Yoga", "name": "Hamsa Yoga", "devanagari": "हंस योग", "planet": "Jupiter",
-         "formation": "Jupiter in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Sagittarius, Pisces) or exaltation sign (Cancer).",
-         "logic": "Jupiter ('Guru') represents wisdom, knowledge, expansion, dharma (righteousness), wealth, and fortune. When strong in a Kendra, these divine qualities become foundational pillars of the native's life, guiding their actions and bestowing grace.",
-         "bphs_results": """
-         BPHS describes the native as having markings of Shankha (conch), Padma (lotus), etc. on hands/feet, handsome, virtuous, respected by rulers, fond of righteous deeds.
-         - **Effects**: Grants wisdom, knowledge of scriptures/philosophy, high morals, respect, good fortune, wealth, happiness from children, often association with teaching, law, finance, or spiritual guidance.
-         - **Variations**: Strongest in Cancer (exaltation), then Sagittarius (Mooltrikona), then Pisces. Placement modifies expression (1H: Wise/respected personality, 4H: Happy home/mother, good education, 7H: Noble partner, fortunate partnerships, 10H: Esteemed career in teaching/finance/law).
-         """,
-         "lal_kitab_note": """
-         Term not used.
-         - Jupiter exalted in H4 (Cancer) is considered extremely auspicious, granting immense happiness, property, and divine grace ('Dev Guru' blessings).
-         - Jupiter in H9 ('Pakka Ghar') is strong for dharma and fortune.
-         - Jupiter in Sagittarius/Pisces (e.g., H1, H4, H7, H10) is powerful but analyzed by house. Remedies involve wearing gold, applying saffron ('kesar') tilak, respecting elders/gurus.
-         """
-        },
-        {"category": "Mahapurusha Yoga", "name": "Malavya Yoga", "devanagari": "मालव्य योग", "planet": "Venus",
-         "formation": "Venus in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Taurus, Libra) or exaltation sign (Pisces).",
-         "logic": "Venus ('Shukra') represents love, beauty, arts, pleasure, luxury, relationships, and diplomacy. When strong in a Kendra, these qualities define the native's life experience, bringing refinement, comfort, and strong relationship focus.",
-         "bphs_results": """
-         BPHS describes the native as having a slender waist, attractive appearance, bright eyes, learned, wealthy, blessed with spouse, vehicles, and sensual enjoyments.
-         - **Effects**: Grants physical beauty, charm, artistic talents (music, arts, fashion), luxurious lifestyle, vehicles, happy relationships, diplomatic skills, success in creative fields or dealing with luxuries/women.
-         - **Variations**: Strongest in Pisces (exaltation), then Libra (Mooltrikona), then Taurus. Placement modifies expression (1H: Charming personality, 4H: Beautiful home/vehicles, happy mother, 7H: Attractive/loving spouse, success in partnerships, 10H: Career in arts/luxury/diplomacy).
-         """,
-         "lal_kitab_note": """
-         Term not used.
-         - Venus exalted in H12 (Pisces) gives high-level comforts and luxury ('Uchcha Shukra') but can also indicate high expenses or hidden relationships.
-         - Venus in H7 ('Pakka Ghar') affects marriage significantly.
-         - Venus in Taurus/Libra (e.g., H1, H4, H7, H10) is strong but analyzed by house rules. Remedies often involve serving cows ('Gau Seva'), donating ghee/curd, maintaining good character.
-         """
-        },
-        {"category": "Mahapurusha Yoga", "name": "Sasa Yoga", "devanagari": "शश योग", "planet": "Saturn",
-         "formation": "Saturn in a Kendra (1st, 4th, 7th, 10th house from Ascendant) AND in its own sign (Capricorn, Aquarius) or exaltation sign (Libra).",
-         "logic": "Saturn ('Shani') represents discipline, structure, responsibility, perseverance, justice, and connection to the masses. When strong in a Kendra, these qualities form the foundation of the native's life, leading to authority and influence built through hard work and time.",
-         "bphs_results": """
-         BPHS describes the native as commanding armies, ruling villages or towns, potentially having questionable morals (depending on other factors), interested in others' wealth, but successful and authoritative.
-         - **Effects**: Grants discipline, patience, perseverance, leadership, authority, influence over masses, success in politics, real estate, judiciary, or large organizations. Can indicate a serious demeanor. Rise often comes later in life after considerable effort.
-         - **Variations**: Strongest in Libra (exaltation), then Aquarius (Mooltrikona), then Capricorn. Placement modifies expression (1H: Serious/disciplined personality, 4H: Property, influence in homeland, 7H: Mature/stable partner, public dealings, 10H: Powerful career, leadership).
-         """,
-         "lal_kitab_note": """
-         Term not used.
-         - Saturn exalted in H7 (Libra) is considered very good for wealth and status ('Uchcha Shani') but potentially problematic for marital harmony (delay or detachment).
-         - Saturn in H10 ('Pakka Ghar') is strong for career.
-         - Saturn in Capricorn/Aquarius (e.g., H1, H4, H7, H10) gives strong results based on house rules. Remedies involve donating oil, black cloth, serving the needy, feeding crows/snakes.
-         """
-        }
-    ]
+    details += f"""
+ ASTROLOGICAL LOGIC:
+{_SEP}
+{wrap_text(record.logic)}
 
-def get_rajyoga_data_detailed() -> List[Dict[str, Any]]:
-    """Returns detailed structured data for common Rajyogas."""
-    return [
-        {"category": "Rajyoga", "name": "Dharma-Karmadhipati Yoga", "devanagari": "धर्म कर्माधिपति योग",
-         "formation": "A connection between the lord of the 9th house (Dharma Bhava - fortune, righteousness, father, higher learning) and the lord of the 10th house (Karma Bhava - career, status, public life, action). Connection types: \n  • Conjunction (in any house, stronger in auspicious ones like Kendras/Trikonas).\n  • Mutual Aspect (Parashari aspects).\n  • Parivartana Yoga (Exchange of signs).\n  • Placement in each other's house.",
-         "logic": "This yoga links the house of purpose, fortune, and divine grace (9H) with the house of action, status, and worldly achievement (10H). It signifies that the native's actions (10H) are aligned with their purpose and supported by fortune (9H), leading to significant rise, success, and recognition in their profession and public life.",
-         "bphs_results": """
-         Considered a Maha Raja Yoga (Great Royal Combination) in BPHS. Parashara states this makes one a 'King or equal to a King'.
-         - **Effects**: Grants high status, authority, success in career, fame, wealth, virtuous conduct, leadership roles, fulfillment of ambitions. The strength depends on the involved planets' dignity, house placement, and freedom from affliction. Strongest when formed in Kendras or Trikonas.
-         """,
-         "lal_kitab_note": """
-         The concept of linking fortune (H9 - Jupiter's domain) and career (H10 - Saturn's domain) is highly valued.
-         - Conjunctions of planets ruling/representing these houses are analyzed based on the house they occur in. For example, Jupiter+Saturn can be powerful but also indicate struggle depending on placement.
-         - Lal Kitab emphasizes the 'activation age' of planets and houses, suggesting such yogas might fructify strongly at specific times. Remedies aim to strengthen the positive planet and pacify any negative influences.
-         """
-        },
-        {"category": "Rajyoga", "name": "Gaja Kesari Yoga", "devanagari": "गज केसरी योग",
-         "formation": "Jupiter ('Gaja' - Elephant) is placed in a Kendra (1st, 4th, 7th, 10th house) from the Moon ('Kesari' - Lion, metaphorically). Important conditions for full effect: \n  • Jupiter and Moon should be strong (not debilitated, combust, or heavily afflicted).\n  • Ideally, Jupiter should not be in the 6th, 8th, or 12th house from the Ascendant.",
-         "logic": "The Moon represents the mind, emotions, and public perception. Jupiter represents wisdom, knowledge, expansion, and benevolence. When Jupiter strongly influences the Moon from an angular position, it imbues the mind with wisdom, optimism, morality, and expansive thinking. This leads to recognition, respect, and noble conduct.",
-         "bphs_results": """
-         BPHS highlights this yoga's positive effects: Makes the native intelligent, virtuous, wealthy, acclaimed by rulers (authorities), possess lasting fame, build villages/towns (implying leadership/development), and destroy enemies through intellect. The analogy suggests the noble power (Jupiter) protecting/guiding the mind (Moon).
-         - **Effects**: Generally bestows intelligence, good speech, virtuous nature, fame, wealth, respect, strong character, and ability to influence others positively.
-         """,
-         "lal_kitab_note": """
-         While the specific Kendra-from-Moon rule isn't used, the combination or mutual aspect of Moon and Jupiter is considered highly auspicious ('Sona+Chandi' - Gold+Silver).
-         - Jupiter exalted in H4 (Cancer - Moon's sign) strongly resonates with Gaja Kesari principles, giving immense domestic happiness and wisdom.
-         - If either planet is afflicted or in a 'bad' house (e.g., H6, H8, H12), the positive effects are reduced. Remedies aim to strengthen both planets (e.g., serving mother for Moon, respecting elders for Jupiter, using silver and gold).
-         """
-        },
-        {"category": "Rajyoga", "name": "Neecha Bhanga Rajyoga", "devanagari": "नीच भंग राजयोग",
-         "formation": "Cancellation ('Bhanga') of a planet's debilitation ('Neecha'). Numerous rules exist in classical texts, key ones include:\n  • Lord of the sign where the planet is debilitated (Dispositor) is in a Kendra from Lagna or Moon.\n  • Planet which gets Exalted in the sign where the planet is debilitated is in a Kendra from Lagna or Moon.\n  • Debilitated planet is conjunct or aspected by its Exaltation Lord.\n  • Debilitated planet aspects its own sign of debilitation.\n  • Debilitated planet exchanges signs with its Dispositor (a form of Parivartana).\n  • Two debilitated planets aspect each other.\n  • Debilitated planet is exalted in the Navamsha chart (D9).",
-         "logic": "A planet in debilitation is weak and struggles to express its positive qualities. 'Neecha Bhanga' implies that this weakness is overcome due to specific redeeming factors. This often signifies initial struggles, low self-esteem, or hardship related to the planet's significations, followed by a significant rise, often sudden or unexpected, as the 'cancellation' takes effect. The native gains strength through overcoming weakness.",
-         "bphs_results": """
-         BPHS and other classics like Phaladeepika extensively list the rules for cancellation. A properly cancelled debilitation is stated to produce results equivalent to an exalted planet ('Raja Yoga'), making the person powerful, wealthy, and virtuous. The timing often corresponds to the Dasha periods of the planets involved in the cancellation.
-         - **Effects**: Potential for great success after initial struggles, resilience, overcoming adversity, achieving high status unexpectedly. The specific area of life depends on the planet and house involved.
-         """,
-         "lal_kitab_note": """
-         Lal Kitab doesn't use the term 'Neecha Bhanga'. It analyzes debilitated planets ('Mandi Graha') based on house placement.
-         - A debilitated planet might receive support ('Madaad') from friendly planets placed in specific relative positions, mitigating the negativity.
-         - Some placements of debilitated planets are considered particularly bad (e.g., Sun in H7, Saturn in H1).
-         - Remedies focus on strengthening supporting planets or pacifying the debilitated planet through donations or actions related to its significations (e.g., serving uncles for bad Saturn).
-         """
-        },
-         {"category": "Rajyoga", "name": "Viparita Rajyoga", "devanagari": "विपरीत राजयोग",
-         "formation": "Formed by lords of Dusthana houses (6th: Roga/Ripu - disease, debt, enemies; 8th: Randhra/Ayur - obstacles, longevity, secrets; 12th: Vyaya - loss, expense, isolation). Three types:\n  • **Harsha Yoga**: 6th Lord in 8th or 12th house.\n  • **Sarala Yoga**: 8th Lord in 6th or 12th house.\n  • **Vimala Yoga**: 12th Lord in 6th or 8th house.\n  **Crucial Condition**: The involved Dusthana lords should be relatively strong (e.g., not combust or heavily afflicted by other malefics) and SHOULD NOT be conjunct or aspected by lords of auspicious houses (Kendras, Trikonas).",
-         "logic": "'Viparita' means contrary or inverse. The negative potential of one difficult house lord placed in another difficult house tends to destroy the negativity of both houses involved, leading to positive outcomes arising from adversity. It's like 'a poison nullifies another poison'. The native gains through loss, overcomes enemies through challenges, or benefits from unexpected events.",
-         "bphs_results": """
-         BPHS describes these yogas:
-         - **Harsha**: Happiness, enjoyment, destruction of enemies, good fortune.
-         - **Sarala**: Learning, prosperity, overcomes obstacles, long-lived, defeats foes.
-         - **Vimala**: Frugal, independent, virtuous conduct, happiness, good profession.
-         - **Effects**: Gives unexpected rise in life, sudden gains, ability to overcome powerful enemies or obstacles, success through unconventional means, often after a period of struggle or loss. Strength depends on the planets involved and lack of affliction.
-         """,
-         "lal_kitab_note": """
-         The direct concept doesn't exist. However, planets in H6, H8, H12 are analyzed with specific rules:
-         - Sometimes, a malefic planet placed in these houses is said to 'kill' the negativity of the house (e.g., Mars in H6 can destroy enemies, Ketu in H6).
-         - Conversely, benefics in these houses are often considered weak or problematic ('Mande Graha').
-         - Lal Kitab focuses heavily on specific conjunctions and aspects within these houses, rather than just lordship placements. Remedies are highly specific to the planets and house.
-         """
-        },
-        {"category": "Rajyoga", "name": "Budhaditya Yoga", "devanagari": "बुधादित्य योग",
-         "formation": "Conjunction of the Sun (Aditya) and Mercury (Budha) in the same house. Conditions for strength:\n  • Mercury should not be combust (too close to the Sun, typically within 8-12 degrees depending on tradition). If combust, its intellectual power is weakened.\n  • The conjunction should occur in an auspicious house (Kendra, Trikona, 2H, 11H) or in favorable signs (like Gemini, Virgo, Leo).",
-         "logic": "The Sun represents soul, authority, and vitality. Mercury represents intellect, communication, and skill. Their combination synergizes these qualities, bestowing sharp intelligence, analytical ability, eloquence, learning capacity, and potential for recognition or status.",
-         "bphs_results": """
-         BPHS and other texts praise this yoga. It is said to grant intelligence 'equal to the Sun's brilliance', skill in arts and sciences, persuasive speech, good reputation, wealth, and physical attractiveness. The house of conjunction significantly influences the area of manifestation.
-         - **Effects**: High intelligence, good education, strong communication skills, analytical mind, success in fields requiring intellect (writing, teaching, consulting, business).
-         """,
-         "lal_kitab_note": """
-         Sun + Mercury conjunction is analyzed based on the house it occupies.
-         - Very auspicious in houses like H1, H4, H5, H11, considered 'Raj Yoga Saman' (equal to Raj Yoga), promising intelligence, wealth, and status.
-         - Can be problematic in certain houses (e.g., H7 - affecting spouse/partners, H10 - potentially causing career instability if afflicted).
-         - Mercury's combustion ('Budh Ast') is a key factor. Remedies aim to strengthen Mercury (e.g., green items, serving sisters/aunts) or balance the Sun's dominance.
-         """
-         },
-        {"category": "Rajyoga", "name": "Chandra Mangala Yoga", "devanagari": "चंद्र मंगल योग",
-         "formation": "Conjunction of the Moon and Mars in the same house, or being in mutual aspect (opposition 7th/7th, or Mars' special 4th/8th aspect onto Moon).",
-         "logic": "Combines the Moon (mind, emotions, liquidity, public) with Mars (energy, action, drive, property). This synergy creates a dynamic mind focused on action and acquisition. Mars provides the energy to manifest the Moon's desires, particularly regarding wealth and assets.",
-         "bphs_results": """
-         Classical texts often associate this yoga strongly with wealth generation ('Dhana Yoga'). BPHS suggests wealth possibly earned through dealings related to women, liquids, or even potentially unethical means if afflicted. It can also indicate a quick temper, impulsiveness, but also strong initiative and earning capacity.
-         - **Effects**: Strong drive, ambition, ability to earn wealth quickly, potential for property ownership, energetic mind, sometimes impatience or emotional volatility. Strength depends on sign/house placement and aspects.
-         """,
-         "lal_kitab_note": """
-         Moon + Mars is generally considered a 'Lakshmi Yoga', highly auspicious for wealth ('Paisa'). Mars provides support ('Madaad') to the Moon (cash flow).
-         - Its effect is highly house-dependent. For example, in H4 (Moon's 'Pakka Ghar'), it can be excellent for property but potentially bad for mother's peace due to Mars. In H6, it might lead to debt issues.
-         - Remedies often focus on Mars (donating 'masoor dal', honey, sindoor) to channel its energy positively.
-         """
-        },
-        # Add more Rajyogas here...
-    ]
+ BPHS / CLASSICAL RESULTS:
+{_SEP}
+{wrap_text(record.bphs_results)}
 
-def get_dosha_data_detailed() -> List[Dict[str, Any]]:
-    """Returns detailed structured data for common Doshas."""
-    return [
-        {"category": "Dosha", "name": "Manglik Dosha", "devanagari": "मांगलिक दोष",
-         "formation": "Mars placed in the 1st (personality), 4th (domestic peace), 7th (spouse), 8th (marital longevity/obstacles), or 12th (bed pleasures/loss) house from the Ascendant (Lagna), Moon (Chandra Lagna), or Venus (Kalatra Karaka). Some traditions (esp. South India) also include the 2nd house (family/speech).",
-         "logic": "Mars is a fiery, aggressive planet representing energy, conflict, and separation. Its placement in these sensitive houses related to self, home, partnership, and intimacy disrupts harmony. It injects Martian qualities (aggression, dominance, impatience, accidents) into areas requiring sensitivity and compromise, leading to marital friction, separation, or potential harm/ill health to the partner.",
-         "bphs_results": """
-         BPHS (Stree Jataka chapter) explicitly links Mars in these houses (1, 4, 7, 8, 12) to potential widowhood for a female, implying danger to the spouse. It states the effect applies equally causing widower-hood for males.
-         - **Cancellation (Bhanga)**: The primary cancellation mentioned in BPHS is marriage to another person with a similar Manglik Dosha, nullifying the effect. Other classical cancellations include: Mars in own sign (Aries/Scorpio) or exaltation (Capricorn), Mars aspected by strong benefics (esp. Jupiter), Mars in certain signs within these houses (e.g., Mars in Leo/Aquarius often considered less malefic), presence of strong benefics in Kendras.
-         """,
-         "lal_kitab_note": """
-         Lal Kitab doesn't use the specific 1/4/7/8/12 house rule from Lagna/Moon/Venus. It identifies 'Mangal Bad' (Bad Mars) based on specific house placements or conjunctions, regardless of marriage implications:
-         - Mars in H1 or H8 is often considered 'Bad'.
-         - Mars in H4 is particularly bad, said to 'burn' family happiness.
-         - Mars conjunct Saturn is highly problematic ('Manda Mangal').
-         - Remedies focus on pacifying Mars ('Thanda Karna') or improving its effects, e.g., feeding sweet tandoori roti to dogs, donating 'masoor dal' (red lentils), keeping an elephant tusk (real/ivory substitute), respecting brothers.
-         """
-        },
-        {"category": "Dosha", "name": "Kaal Sarpa Dosha", "devanagari": "काल सर्प दोष",
-         "formation": "All seven classical planets (Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn) are located between the Rahu-Ketu axis (within 180 degrees). Two main types:\n  • **Anuloma**: Planets moving towards Rahu (Ketu -> Rahu direction).\n  • **Viloma**: Planets moving towards Ketu (Rahu -> Ketu direction).\n  Partial Kaal Sarpa is when one planet escapes the axis.",
-         "logic": "(Modern Interpretation) Rahu (the head - insatiable desire, future karma) and Ketu (the tail - detachment, past karma) represent the karmic axis. When all planets are 'hemmed' or 'trapped' between them, the native's life is strongly influenced by this karmic pull. It suggests a life where free will feels constrained, events happen suddenly, and progress is often blocked or delayed until the karmic pattern is worked through (often stated to be effective up to mid-life).",
-         "bphs_results": """
-         **This yoga is NOT mentioned in BPHS** or other primary classical astrological texts like Phaladeepika, Jataka Parijata, Saravali. It gained prominence in 20th-century Indian astrology. Classical scholars argue that Rahu/Ketu act through their dispositors and conjunctions, and this 'hemming' concept is not a standalone principle in Parashari astrology. The effects attributed to it can often be explained by other classical combinations involving Rahu/Ketu or house lordships.
-         """,
-         "lal_kitab_note": """
-         Lal Kitab **does not use the term 'Kaal Sarpa Dosha'**.
-         - It analyzes Rahu and Ketu based on their house placement, conjunctions, and aspects according to its unique principles.
-         - For example, Rahu in H12 ('Pakka Ghar') or Ketu in H6 ('Pakka Ghar') have specific interpretations. Conjunctions like Rahu+Moon (Grahan) or Rahu+Jupiter (Chandal) are given specific meanings and remedies.
-         - Remedies are always specific to Rahu or Ketu based on their position and affliction (e.g., floating coal/barley/radish, keeping items like solid silver elephant).
-         """
-        },
-        {"category": "Dosha", "name": "Pitra Dosha", "devanagari": "पितृ दोष",
-         "formation": "A broad category indicating ancestral afflictions or karmic debts. No single combination, but common indicators include:\n  • **Sun afflicted**: Sun (significator of father/lineage) conjunct/aspected by Saturn, Rahu, or Ketu, especially in malefic houses or debilitation (Libra).\n  • **9th House afflicted**: 9H (father, ancestors, past merits) or 9th Lord afflicted by Saturn, Rahu, Ketu, or lords of Dusthanas.\n  • **Moon afflicted**: Moon (mother/mind) can also indicate maternal lineage issues if afflicted similarly.\n  • **Rahu/Ketu axis**: Across Lagna/7H or 2H/8H involving Sun/Moon/Jupiter.",
-         "logic": "The Sun and 9th house represent the connection to the paternal lineage, ancestors ('Pitrs'), and the store of past good karma ('Punya'). Afflictions indicate unresolved issues, unfulfilled duties, or negative karmic patterns passed down ('Rin' - debt) or curses ('Shrap') from ancestors. This blockage manifests as obstacles in the native's life, particularly concerning progeny (5H often gets impacted), health, finances, and overall well-being, as the ancestral blessings are obstructed.",
-         "bphs_results": """
-         BPHS has a specific chapter titled **'Purva Janma Shapadyaya' (Curses from Past Lives)** which is the classical foundation for Pitra Dosha. It details numerous specific combinations indicating curses from father, mother, brother, spouse, Brahmin, etc., primarily manifesting as difficulty or denial in having children.
-         - **Example (Father's Curse)**: Sun in debilitation (Libra) in 5H, 5th Lord with malefic, Lagna Lord weak/afflicted.
-         - **Remedies**: BPHS suggests remedies like Japa (mantra), Homa (fire ritual), Daana (charity), Tarpana/Shraddha (rituals for ancestors), feeding Brahmins, and specific worship based on the afflicting planet.
-         """,
-         "lal_kitab_note": """
-         **Pitra Rin (Ancestral Debt) is a fundamental concept in Lal Kitab.** It believes certain planetary placements indicate specific debts owed due to actions (or inactions) of ancestors, which the native must remedy ('Upay').
-         - **Examples**: Jupiter in H5 (debt related to Guru/father), Venus in H2/H7 afflicted (debt related to wife/mother figure), Saturn in H10/H11 afflicted (debt related to property/livelihood).
-         - **Diagnosis**: Based on specific planet+house combinations.
-         - **Remedies**: Unique and specific to the identified debt, often involving collective action by blood relatives (e.g., collecting equal money for religious purpose), serving specific relatives (e.g., uncles for Saturn), or specific donations/rituals.
-         """
-        },
-        # ... (Include other Doshas like Grahan, Kendradhipati, etc. with similar detailed structure) ...
-         {"category": "Dosha", "name": "Grahan Dosha", "devanagari": "ग्रहण दोष",
-         "formation": "'Eclipse Affliction'. Sun or Moon conjunct Rahu or Ketu in the same house. Proximity (degrees) matters; closer conjunction is stronger.",
-         "logic": "Rahu (North Node) and Ketu (South Node) are the astronomical points where eclipses occur. They are considered shadow entities that 'overpower' or 'afflict' the luminaries (Sun - soul, authority; Moon - mind, emotions) when conjunct. This dims the natural light and signifies psychological complexes, internal conflicts, or challenges related to the significations of the luminary involved.",
-         "bphs_results": """
-         BPHS describes the results of Sun/Moon conjunctions with Rahu/Ketu:
-         - **Sun+Rahu/Ketu**: Can indicate issues with father, authority figures, government; lack of self-confidence, ego problems, health issues (heart, bones, eyes); potential for unconventional fame or downfall.
-         - **Moon+Rahu/Ketu**: Indicates mental turmoil, emotional instability, phobias, illusions, difficult relationship with mother; potential for psychic sensitivity or psychological issues; fluctuations in public life. Affliction is stronger during eclipses near the time of birth.
-         """,
-         "lal_kitab_note": """
-         Called 'Grahan Yoga' (Eclipse Yoga). Considered highly significant and problematic.
-         - **Sun+Rahu**: Bad for father, government favors, reputation. Remedy: Floating coal ('koyla') or wheat ('gehu') in running water.
-         - **Sun+Ketu**: Bad for progeny (son), bodily health (joints). Remedy: Feeding monkeys (related to Sun), helping son/nephew.
-         - **Moon+Rahu**: Bad for mother, mental peace, finances ('khazana'). Remedy: Floating barley ('jau') washed in milk, wearing silver.
-         - **Moon+Ketu**: Bad for mother and progeny (son), causes detachment or mental confusion. Remedy: Feeding dogs (Ketu), wearing gold in ear (for progeny). The house of conjunction heavily modifies results.
-         """
-        },
-        {"category": "Dosha", "name": "Kendradhipati Dosha", "devanagari": "केन्द्राधिपति दोष",
-         "formation": "Applies ONLY to natural benefic planets (Jupiter, Venus, Mercury, strong/waxing Moon) when they OWN a Kendra house (1st, 4th, 7th, 10th from Ascendant). The 1st house lordship is generally exempt as it's also a Trikona. The dosha is strongest for Jupiter and Mercury owning the 7th or 10th.",
-         "logic": "This is a core Parashari principle of functional nature. Kendras are pillars requiring strong 'guards'. Benefics are considered 'gentle' and thus less effective or even obstructive when ruling these powerful houses; they lose some inherent beneficence. Conversely, natural malefics (Saturn, Mars) are 'tough' and become better 'guards', thus shedding some maleficence when ruling Kendras (esp. if not also ruling a Trikona).",
-         "bphs_results": """
-         This principle is fundamental to how BPHS determines the functional benefic/malefic nature of planets for each Ascendant.
-         - **Example**: For Gemini Ascendant, Jupiter (great benefic) owns 7H & 10H (two Kendras) and is classified as a functional malefic, capable of causing significant issues during its Dasha. For Virgo Ascendant, Jupiter owns 4H & 7H, also gaining this dosha. Venus for Cancer (owns 4H/11H) or Leo (owns 3H/10H) gets the dosha from Kendra ownership.
-         - **Cancellation**: If the benefic also owns a Trikona (1H, 5H, 9H), it becomes a powerful Yogakaraka, cancelling the dosha (e.g., Venus for Capricorn/Aquarius, Mars for Cancer/Leo). Placement in Dusthanas (6, 8, 12) can sometimes mitigate the dosha by weakening the planet's ability to obstruct.
-         """,
-         "lal_kitab_note": """
-         **This concept of functional maleficence based on Kendra lordship DOES NOT EXIST in Lal Kitab.**
-         - Planets are analyzed based on their inherent nature, house placement ('Pakka Ghar', 'Khaana'), conjunctions, aspects (Lal Kitab aspects are different), and ' सोया / जागा' (sleeping/awake) status.
-         - A benefic like Jupiter is always considered fundamentally benefic, but its results depend entirely on its house and combinations according to LK rules, not its Kendra lordship.
-         """
-        },
-         {"category": "Dosha", "name": "Guru Chandal Dosha", "devanagari": "गुरु चांडाल दोष",
-         "formation": "Conjunction of Jupiter (Guru) and Rahu (Chandal - signifies outcast, unorthodox) OR Jupiter and Ketu in the same house.",
-         "logic": "Jupiter represents wisdom, dharma, teachers, expansion, and traditional knowledge. Rahu represents obsession, illusion, foreign influences, unconventionality, and breaking norms. Ketu represents detachment, past karma, headless action, spirituality, and criticism. \n  • **Jupiter+Rahu**: Rahu's obsessive, materialistic, and unorthodox energy 'pollutes' or overshadows Jupiter's wisdom and ethics. Can lead to flawed judgment, disrespect for gurus/tradition, using knowledge for selfish ends, unorthodox beliefs, or association with 'outcast' elements.\n  • **Jupiter+Ketu**: Ketu's critical, headless, or detached energy can undermine Jupiter's faith and expansion. Can lead to excessive self-criticism, doubt in teachers/beliefs, rejecting traditional wisdom, spiritual confusion, or focusing only on flaws.",
-         "bphs_results": """
-         Classical texts consider these challenging conjunctions.
-         - **Jupiter+Rahu**: Often linked to heterodoxy, association with lower strata or foreigners, potential for financial speculation (Rahu amplifying Jupiter's wealth signification), but also clouded judgment and ethical compromises.
-         - **Jupiter+Ketu**: Can indicate deep spiritual seeking but also breaks in education, dissatisfaction with gurus, challenges with children, or sharp critical abilities used negatively. Effects highly dependent on sign, house, and strength.
-         """,
-         "lal_kitab_note": """
-         Analyzed based on house.
-         - **Jupiter+Rahu**: Described as 'Hathi Be-Mahavat' (Elephant without a driver). Rahu (elephant) overpowers Jupiter (driver). Generally gives bad results for the house they occupy, causing misguided expansion or obsession. Remedies aim to separate them (e.g., wear gold for Jupiter, keep Rahu items like fennel separately).
-         - **Jupiter+Ketu**: Considered somewhat better than Jup+Rahu, especially in certain houses. Ketu (son) can sometimes follow Jupiter's (grandfather) guidance. However, can still cause issues related to progeny or spiritual path. Remedies might involve serving elders (Jupiter) and dogs (Ketu).
-         """
-        },
-        {"category": "Dosha", "name": "Vish Yoga", "devanagari": "विष योग",
-         "formation": "'Poison Yoga'. Formed by the conjunction of Saturn (Shani) and the Moon (Chandra) in the same house, OR their strong mutual aspect (opposition 7/7, Saturn's 3rd/10th aspect on Moon, Moon aspecting Saturn).",
-         "logic": "The Moon represents the mind ('Manas'), emotions, mother, nourishment, and is soft/watery/receptive. Saturn represents sorrow ('Duhkha'), restriction, delays, coldness, discipline, and is hard/cold/dry/constrictive. When Saturn strongly influences the Moon, its heavy, pessimistic, and 'poisonous' qualities afflict the sensitive mind. This creates emotional blockages, pessimism, melancholy, fear, detachment from mother, or difficulty feeling/expressing emotions.",
-         "bphs_results": """
-         This is a well-known and generally feared classical yoga. BPHS and other texts associate it with mental suffering, sorrow, emotional coldness, pessimism, difficulties with the mother, and potential for depression or psychological issues depending on severity and house placement (stronger in Kendras or afflicting Lagna). It can also make one disciplined and capable of enduring hardship, but often at the cost of emotional well-being.
-         """,
-         "lal_kitab_note": """
-         Considered a very negative combination ('Zeher' - poison).
-         - Described as 'Maa ke doodh mein zeher' (poison in mother's milk) or 'Chandrama par Saanp ka pehra' (snake guarding the Moon).
-         - Highly detrimental to mental peace, mother's health/relationship, and finances (Moon represents liquidity).
-         - Effects vary by house (e.g., in H4 can ruin domestic peace, in H10 affects career).
-         - Remedies often involve separating their energies: Offering milk (Moon) on a Shivalingam (Saturn), donating Saturn items (oil, black cloth) while strengthening Moon (silver, pearls, serving mother), avoiding black/blue colors.
-         """
-        },
-        {"category": "Dosha", "name": "Kemadruma Dosha", "devanagari": "केमद्रुम दोष",
-         "formation": "A major lunar dosha. Formed when there are NO planets (excluding the Sun, Rahu, and Ketu - Nodes are considered shadow points) in the 2nd house AND the 12th house counted *from the Moon's position*.",
-         "logic": "The Moon (mind) thrives on connection and reflection (planets nearby). The 2nd house from any point represents resources/support immediately following it, and the 12th represents support/expenditure just behind it. When both these adjacent houses are empty, the Moon is left isolated (' अकेली चंद्रमा '). This signifies a lack of immediate emotional, social, or financial support structure around the mind, leading to feelings of loneliness, instability, poverty, and mental distress.",
-         "bphs_results": """
-         BPHS describes Kemadruma Yoga as causing poverty, sorrow, hard work with little reward, dependence on others, and a generally miserable or isolated existence. It is considered a strong 'Daridra Yoga' (yoga for poverty).
-         - **HOWEVER, BPHS and other texts give MANY CANCELLATIONS (Bhanga)** which are extremely common, making the *uncancelled* Kemadruma quite rare. Key cancellations include:
-           • Planets in a Kendra (1, 4, 7, 10) *from the Moon*.
-           • Planets in a Kendra *from the Ascendant*.
-           • Moon conjunct any planet (other than Sun/Nodes).
-           • Moon aspected by Jupiter.
-           • Moon in Navamsha exalted or in own sign.
-           • All planets aspecting the Moon.
-           If cancelled, the dosha's negative effects are greatly reduced or nullified.
-         """,
-         "lal_kitab_note": """
-         The specific configuration of planets flanking the Moon (2nd/12th empty) is **not a primary concept** in Lal Kitab.
-         - The Moon's condition is assessed based on the HOUSE it occupies (e.g., Moon in H6, H8, H12 is generally bad), its conjunctions (e.g., Moon+Saturn = Vish Yoga, Moon+Rahu = Grahan), and whether it's 'sleeping' or 'awake'.
-         - Loneliness or lack of support would be interpreted based on afflictions to the Moon or houses like H4 (home/mother) or H11 (friends/network). Remedies would target the specific affliction found according to LK principles.
-         """
-        }
-    ]
+ LAL KITAB PERSPECTIVE:
+{_SEP}
+{wrap_text(record.lal_kitab_note)}
+"""
+    return details.strip()
+
+class YogaCategoryStyle(NamedTuple):
+    """Icon and list text color of one Yoga/Dosha category."""
+    icon: str
+    color: str
 
 class YogasDoshasTab(ttk.Frame):
     """
     This class defines the "Yogas & Doshas" tab using a list/detail layout
-    with category separators in the listbox.
+    with category separators in the list.
     """
+    # Delay (ms) after the last keystroke before the list is re-filtered
+    FILTER_DEBOUNCE_MS: int = 150
+
+    # Text class bindings the read-only details text keeps: mouse selection
+    # and scrolling, cursor movement, selection and copy. Editing keys, paste
+    # and Tab (so focus traversal still works) are left out.
+    READ_ONLY_TEXT_SEQUENCES: Tuple[str, ...] = (
+        '<Button-1>', '<B1-Motion>', '<B1-Leave>', '<B1-Enter>', '<ButtonRelease-1>',
+        '<Double-Button-1>', '<Triple-Button-1>', '<Shift-Button-1>',
+        '<Double-Shift-Button-1>', '<Triple-Shift-Button-1>',
+        '<Control-Button-1>', '<Control-B1-Motion>', '<Button-2>', '<B2-Motion>',
+        '<MouseWheel>', '<Shift-MouseWheel>', '<Option-MouseWheel>', '<Shift-Option-MouseWheel>',
+        '<Button-4>', '<Button-5>', '<Shift-Button-4>', '<Shift-Button-5>',
+        '<<PrevChar>>', '<<NextChar>>', '<<PrevWord>>', '<<NextWord>>',
+        '<<PrevLine>>', '<<NextLine>>', '<<PrevPara>>', '<<NextPara>>',
+        '<<LineStart>>', '<<LineEnd>>',
+        '<<SelectPrevChar>>', '<<SelectNextChar>>', '<<SelectPrevWord>>', '<<SelectNextWord>>',
+        '<<SelectPrevLine>>', '<<SelectNextLine>>', '<<SelectPrevPara>>', '<<SelectNextPara>>',
+        '<<SelectLineStart>>', '<<SelectLineEnd>>', '<<SelectAll>>', '<<SelectNone>>',
+        '<Prior>', '<Next>', '<Shift-Prior>', '<Shift-Next>', '<Control-Prior>', '<Control-Next>',
+        '<Control-Home>', '<Control-End>', '<Control-Shift-Home>', '<Control-Shift-End>',
+        '<Select>', '<Shift-Select>', '<Control-space>', '<Control-Shift-space>',
+        '<Control-Tab>', '<Control-Shift-Tab>', '<<Copy>>',
+    )
+
+    # Category specifics, shared read-only by every instance
+    CATEGORY_INFO: Mapping[str, YogaCategoryStyle] = MappingProxyType({
+        "Dosha": YogaCategoryStyle("🔥", "#FFA07A"), # Light Salmon
+        "Mahapurusha Yoga": YogaCategoryStyle("🌟", "#ADD8E6"), # Light Blue
+        "Rajyoga": YogaCategoryStyle("👑", "#90EE90"), # Light Green
+        "Unknown": YogaCategoryStyle("❓", "#ffffff"), # Default (the list foreground)
+    })
+
     def __init__(self, parent: ttk.Notebook, app: 'AstroVighatiElite') -> None:
         super().__init__(parent)
         self.app = app
+        self._filter_job: Optional[str] = None # Pending 'after' id for the debounced filter
+
+        # All records in display order (sorted once at import, shared by every instance)
+        self.all_data = _YOGA_DOSHA_SORTED
+        # Precompute folded search text (fields joined by newlines, which
+        # can't be typed into the search box)
+        self._search_haystacks: List[str] = [
+            self._fold_search_text("\n".join((item.name, item.category, item.planet, item.devanagari)))
+            for item in self.all_data
+        ]
+        # Character-set bitmap of each haystack, a cheap Bloom-style rejection
+        # test: a row lacking any character of the term can't contain it
+        self._haystack_masks: List[int] = [self._char_mask(text) for text in self._search_haystacks]
+        # Last search term and the all_data indexes that matched it; a term
+        # that extends it only needs to re-test those survivors
+        self._last_term: str = ""
+        self._last_survivors: List[int] = list(range(len(self.all_data)))
 
-        # Combine and Sort Data
-        self.all_data = get_mahapurusha_data_detailed() + get_rajyoga_data_detailed() + get_dosha_data_detailed()
-        self.all_data.sort(key=lambda item: (item['category'], item['name']))
-
-        # Define theme colors and category specifics
+        # Define theme colors
         self.theme_bg = "#2e2e2e"
         self.theme_fg = "#ffffff"
         self.select_bg = "#005f9e"
         self.header_fg = "#ffcc66" # Gold for headers
         self.separator_fg = "#aaaaaa" # Lighter gray for separators
-        self.category_info = {
-            "Dosha": {"icon": "🔥", "color": "#FFA07A"}, # Light Salmon
-            "Mahapurusha Yoga": {"icon": "🌟", "color": "#ADD8E6"}, # Light Blue
-            "Rajyoga": {"icon": "👑", "color": "#90EE90"}, # Light Green
-            "Unknown": {"icon": "❓", "color": self.theme_fg} # Default
-        }
-
-        # This will map listbox index to original self.all_data index
-        self.listbox_map: List[int] = []
-        # This will store indices of separator items
-        self.separator_indices: List[int] = []
+        self.category_info = self.CATEGORY_INFO
+        # The list row text and color tag of each item never change, so they
+        # are built once here; the rows are inserted once in create_ui, and
+        # the row text doubles as the details header
+        self._rendered_rows: List[str] = []
+        self._row_tags: List[str] = []
+        for item in self.all_data:
+            category = item.category if item.category in self.category_info else "Unknown"
+            info = self.category_info[category]
+            self._rendered_rows.append(f" {info.icon} {item.name} ({item.devanagari})")
+            self._row_tags.append(category)
+
+        # Tree item id of each item row (its all_data index)
+        self._row_iids: List[str] = [str(index) for index in range(len(self.all_data))]
+        # Separator row id -> all_data index of the first item below it
+        self._separator_targets: Dict[str, int] = {}
+        # Every row, separators included, in unfiltered display order
+        self._unfiltered_iids: List[str] = []
+        # all_data index of the item shown in the details pane, if any
+        self._shown_index: Optional[int] = None
 
         self.create_styles()
         self.create_ui()
@@ -6317,6 +6678,13 @@ class YogasDoshasTab(ttk.Frame):
                   fieldbackground=[('!focus', self.theme_bg)],
                   foreground=[('!focus', self.theme_fg)],
                   insertcolor=[('', self.theme_fg)])
+        # The list keeps its own dark colors whatever the app theme
+        style.configure("YogaDosha.Treeview", rowheight=24, background=self.theme_bg,
+                        fieldbackground=self.theme_bg, foreground=self.theme_fg,
+                        font=('Segoe UI', 11), borderwidth=0)
+        style.map("YogaDosha.Treeview",
+                  background=[('selected', self.select_bg)],
+                  foreground=[('selected', self.theme_fg)])
 
     def create_ui(self) -> None:
         paned = ttk.PanedWindow(self, orient='horizontal')
@@ -6335,29 +6703,43 @@ class YogasDoshasTab(ttk.Frame):
                                 font=('Segoe UI', 10))
         search_entry.pack(fill='x', pady=(0, 10))
 
-        # Listbox Frame
+        # List Frame
         list_frame = ttk.Frame(left_panel)
         list_frame.pack(fill='both', expand=True)
 
+        # A tree-only Treeview: rows are created once and filtering just
+        # detaches/reattaches them, so a keystroke costs one widget call
+        # however many rows the catalog holds
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical')
-        self.item_listbox = tk.Listbox(
+        self.item_tree = ttk.Treeview(
             list_frame,
-            font=('Segoe UI', 11),
-            exportselection=False,
-            yscrollcommand=scrollbar.set,
-            background=self.theme_bg,
-            foreground=self.theme_fg,
-            selectbackground=self.select_bg,
-            selectforeground=self.theme_fg,
-            highlightthickness=0,
-            borderwidth=0,
-            activestyle='none',
-            relief='flat'
+            columns=(),
+            show='tree',
+            selectmode='browse',
+            style="YogaDosha.Treeview",
+            yscrollcommand=scrollbar.set
         )
-        scrollbar.config(command=self.item_listbox.yview)
+        for category, info in self.category_info.items():
+            self.item_tree.tag_configure(category, foreground=info.color)
+        self.item_tree.tag_configure('separator', foreground=self.separator_fg)
+        scrollbar.config(command=self.item_tree.yview)
         scrollbar.pack(side='right', fill='y')
-        self.item_listbox.pack(side='left', fill='both', expand=True)
-        self.item_listbox.bind('<<ListboxSelect>>', self.on_select)
+        self.item_tree.pack(side='left', fill='both', expand=True)
+        self.item_tree.bind('<<TreeviewSelect>>', self.on_select)
+
+        # Insert every row once, with a separator header before each category
+        for category, indexes in _YOGA_DOSHA_SORTED_GROUPS.items():
+            category_display = category.replace(" Yoga", "").upper()
+            separator_iid = f"separator:{category}"
+            self.item_tree.insert('', 'end', iid=separator_iid, tags=('separator',),
+                                  text=f"────── {category_display} ──────")
+            self._separator_targets[separator_iid] = indexes[0]
+            self._unfiltered_iids.append(separator_iid)
+            for index in indexes:
+                iid = self._row_iids[index]
+                self.item_tree.insert('', 'end', iid=iid, text=self._rendered_rows[index],
+                                      tags=(self._row_tags[index],))
+                self._unfiltered_iids.append(iid)
 
         # Right Panel (Details)
         right_panel = ttk.Frame(paned, padding=(15, 10, 0, 10))
@@ -6379,221 +6761,171 @@ class YogasDoshasTab(ttk.Frame):
             highlightthickness=0,
             borderwidth=0,
             relief='flat',
-            insertbackground=self.theme_fg
+            insertbackground=self.theme_fg,
+            insertwidth=0 # No blinking cursor in the read-only text
         )
         self.item_text.pack(fill='both', expand=True)
-
-        # Populate Listbox and Select First Item AFTER Both Panels are Created
-        self.populate_list()
+        # The details text stays in 'normal' state (no state toggle around
+        # every update). It uses the ReadOnlyText bindings in place of the Text
+        # class ones, so it cannot be edited; any other key goes on to the
+        # toplevel and 'all' bindings (menu shortcuts, Tab traversal).
+        self._register_read_only_text_class()
+        self.item_text.bindtags((str(self.item_text), 'ReadOnlyText',
+                                 str(self.item_text.winfo_toplevel()), 'all'))
+
+        # The first item (and its long prose fields) is only wrapped and
+        # shown when the tab is first opened
+        self._first_map_bind = self.bind('<Map>', self._on_first_map)
+
+    def _register_read_only_text_class(self) -> None:
+        """Copies the non-editing Text class bindings onto the 'ReadOnlyText' bindtag."""
+        for sequence in self.READ_ONLY_TEXT_SEQUENCES:
+            script = self.bind_class('Text', sequence)
+            if script: # Some bindings only exist on one windowing system
+                self.bind_class('ReadOnlyText', sequence, script)
+
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Selects and displays the first item the first time the tab is mapped."""
+        self.unbind('<Map>', self._first_map_bind)
         self.select_first_item()
+        # Wrap and format the remaining records off the UI thread, so later
+        # clicks find their text in render_yoga_details' cache. The worker
+        # makes no Tk calls; a click that races it just renders inline.
+        threading.Thread(target=self._prerender_details, name="YogaDoshaPrerender", daemon=True).start()
+
+    def _prerender_details(self) -> None:
+        """Fills the render_yoga_details cache for every record (worker thread)."""
+        for record in self.all_data:
+            render_yoga_details(record)
+
+    @staticmethod
+    def _fold_search_text(text: str) -> str:
+        """
+        Casefolds text and drops combining marks after NFKD decomposition, so
+        the search ignores case, accents and compatibility variants.
+        """
+        decomposed = unicodedata.normalize('NFKD', text)
+        return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+    @staticmethod
+    def _char_mask(text: str) -> int:
+        """Returns a 256-bit bitmap of the characters in text (code points folded mod 256)."""
+        mask = 0
+        for char in set(text):
+            mask |= 1 << (ord(char) & 0xFF)
+        return mask
+
+    def _first_item_iid(self) -> Optional[str]:
+        """Returns the id of the first shown row that is not a separator, if any."""
+        return next((iid for iid in self.item_tree.get_children() if iid not in self._separator_targets), None)
 
     def select_first_item(self):
          """Selects the first non-separator item in the list."""
-         if self.item_listbox.size() > 0:
-             first_valid_index = -1
-             for i in range(self.item_listbox.size()):
-                 if i not in self.separator_indices:
-                     first_valid_index = i
-                     break
-             if first_valid_index != -1:
-                 # Ensure listbox is updated before trying to select
-                 self.item_listbox.update_idletasks()
-                 try:
-                     self.item_listbox.selection_set(first_valid_index)
-                     self.item_listbox.see(first_valid_index) # Scroll to selection
-                     self.on_select(None) # Trigger display
-                 except tk.TclError:
-                     print(f"Warning: Could not select index {first_valid_index} initially.")
-
+         first_iid = self._first_item_iid()
+         if first_iid is not None:
+             self.item_tree.selection_set(first_iid)
+             self.item_tree.see(first_iid) # Scroll to selection
+             self.on_select(None) # Trigger display
 
     def populate_list(self, filter_term: Optional[str] = None) -> None:
-        """Fills/Refills the listbox, optionally filtering, adding separators when not filtering."""
-        self.item_listbox.delete(0, tk.END)
-        self.listbox_map = []
-        self.separator_indices = []
-        search_term = filter_term.lower() if filter_term else None
-        current_category = None
-        listbox_idx = 0
-
-        for original_data_index, item in enumerate(self.all_data):
-            category = item.get('category', 'Unknown')
-            name = item.get('name', 'N/A')
-            devanagari = item.get('devanagari', '')
-
-            # Filtering Logic
-            should_add = True
-            if search_term:
-                match = (search_term in name.lower() or
-                         search_term in category.lower() or
-                         search_term in item.get('planet','').lower() or
-                         search_term in devanagari.lower())
-                if not match:
-                    should_add = False
-
-            if should_add:
-                # Add Separator Header (only if NOT filtering)
-                if not search_term and category != current_category:
-                    category_display = category.replace(" Yoga", "").upper()
-                    separator_text = f"────── {category_display} ──────"
-                    self.item_listbox.insert(tk.END, separator_text)
-                    self.item_listbox.itemconfig(listbox_idx,
-                                                foreground=self.separator_fg,
-                                                selectbackground=self.theme_bg,
-                                                selectforeground=self.separator_fg)
-                    self.separator_indices.append(listbox_idx)
-                    listbox_idx += 1
-                    current_category = category
-
-                # Add the Actual Item
-                info = self.category_info.get(category, self.category_info["Unknown"])
-                display_name = f" {info['icon']} {name} ({devanagari})"
-                self.item_listbox.insert(tk.END, display_name)
-                self.item_listbox.itemconfig(listbox_idx, foreground=info['color'])
-                self.listbox_map.append(original_data_index)
-                listbox_idx += 1
-
+        """Shows only the matching rows, with category separators when not filtering."""
+        search_term = self._fold_search_text(filter_term) if filter_term else None
+
+        # Filtering Logic (name, category, planet and Devanagari in one test).
+        # Rows that failed a prefix of this term can't match it, so typing
+        # further only re-tests the previous matches
+        if search_term and search_term.startswith(self._last_term):
+            candidates: Iterable[int] = self._last_survivors
+        else:
+            candidates = range(len(self.all_data))
+        if search_term:
+            haystacks, masks = self._search_haystacks, self._haystack_masks
+            term_mask = self._char_mask(search_term)
+            survivors = [i for i in candidates
+                         if masks[i] & term_mask == term_mask and search_term in haystacks[i]]
+        else:
+            survivors = list(candidates)
+        self._last_term, self._last_survivors = search_term or "", survivors
+
+        # set_children reattaches the shown rows in list order and detaches
+        # every other row in one call; no rows are deleted or recreated.
+        # Separator headers are only shown when not filtering
+        if search_term:
+            shown = [self._row_iids[index] for index in survivors]
+        else:
+            shown = self._unfiltered_iids
+        self.item_tree.set_children('', *shown)
 
     def filter_list(self, *args: Any) -> None:
+        """
+        Schedules _run_filter with the current search term.
+
+        Rapid keystrokes are coalesced: each one cancels the pending refresh,
+        so the list is refreshed once, FILTER_DEBOUNCE_MS after typing stops.
+        Clearing the search box refreshes immediately.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        if not self.search_var.get():
+            self._run_filter()
+        else:
+            self._filter_job = self.after(self.FILTER_DEBOUNCE_MS, self._run_filter)
+
+    def _run_filter(self) -> None:
         """Calls populate_list with the current search term and handles selection."""
+        self._filter_job = None
         search_term = self.search_var.get()
         self.populate_list(search_term)
         
         # Select first match after filtering or clear if no match
-        if self.item_listbox.size() > 0:
-             first_valid_index = -1
-             for i in range(self.item_listbox.size()):
-                 if i not in self.separator_indices: # Ensure it's not a separator
-                     first_valid_index = i
-                     break
-             if first_valid_index != -1:
-                 self.item_listbox.selection_set(first_valid_index)
-                 self.on_select(None)
-             else: # Only separators left, clear details
-                 self.item_header_label.config(text="")
-                 self.item_text.config(state='normal')
-                 self.item_text.delete('1.0', tk.END)
-                 self.item_text.insert('1.0', "  No matching Yogas or Doshas found.")
-                 self.item_text.config(state='disabled')
-        else: # Listbox is completely empty
+        first_iid = self._first_item_iid()
+        if first_iid is not None:
+             self.item_tree.selection_set(first_iid)
+             self.on_select(None)
+        else: # Nothing matched, clear details
+            self._shown_index = None
             self.item_header_label.config(text="")
-            self.item_text.config(state='normal')
             self.item_text.delete('1.0', tk.END)
             self.item_text.insert('1.0', "  No matching Yogas or Doshas found.")
-            self.item_text.config(state='disabled')
 
 
     def on_select(self, event: Optional[tk.Event]) -> None:
-        """Called when a user clicks on an item in the listbox."""
-        selection = self.item_listbox.curselection()
+        """Called when a user clicks on an item in the list."""
+        selection = self.item_tree.selection()
         if not selection: return
 
-        selected_listbox_index = selection[0]
-
-        # Prevent selection/action on separators
-        if selected_listbox_index in self.separator_indices:
-             # Find the next valid item index if possible
-             next_valid_index = -1
-             for i in range(selected_listbox_index + 1, self.item_listbox.size()):
-                 if i not in self.separator_indices:
-                     next_valid_index = i
-                     break
-             # If a valid item is found below, select it instead
-             if next_valid_index != -1:
-                 self.item_listbox.selection_clear(0, tk.END)
-                 self.item_listbox.selection_set(next_valid_index)
-                 self.item_listbox.activate(next_valid_index)
-                 self.item_listbox.see(next_valid_index)
-                 # Manually call on_select again for the NEW selection
-                 self.after(10, lambda: self.on_select(None)) # Use 'after' to avoid recursion depth issues
-             return # Stop processing the separator click
-
-        # Calculate correct index in listbox_map
-        num_separators_before = sum(1 for sep_idx in self.separator_indices if sep_idx < selected_listbox_index)
-        map_index = selected_listbox_index - num_separators_before
-
-        if 0 <= map_index < len(self.listbox_map):
-            original_data_index = self.listbox_map[map_index]
-            item_data = self.all_data[original_data_index]
-            self.show_details(item_data)
+        selected_iid = selection[0]
+
+        # Separators aren't selectable: a click on one selects and shows the
+        # first item of its category right away (the <<TreeviewSelect>> fired
+        # by the new selection then finds that item already shown)
+        if selected_iid in self._separator_targets:
+             index = self._separator_targets[selected_iid]
+             next_iid = self._row_iids[index]
+             self.item_tree.selection_set(next_iid)
+             self.item_tree.focus(next_iid)
+             self.item_tree.see(next_iid)
         else:
-             # Error handling
-             self.item_text.config(state='normal')
-             self.item_text.delete('1.0', tk.END)
-             self.item_text.insert('1.0', f"Error: Index mapping failed for selection {selected_listbox_index}.")
-             self.item_text.config(state='disabled')
+             # Item row ids are their all_data indexes
+             index = int(selected_iid)
 
+        # Re-selecting the item already shown (a repeat click, or the
+        # programmatic selection after a filter) leaves the details pane as it is
+        if index == self._shown_index:
+            return
+        self.show_details(index)
+        self._shown_index = index
 
-    def show_details(self, item: Dict[str, Any]) -> None:
-        """Displays the formatted details for a selected Yoga/Dosha."""
-        self.item_text.config(state='normal')
-        self.item_text.delete('1.0', tk.END)
-
-        category = item.get('category', 'Unknown')
-        name = item.get('name', 'N/A')
-        devanagari = item.get('devanagari', '')
-
-        info = self.category_info.get(category, self.category_info["Unknown"])
-        self.item_header_label.config(text=f" {info['icon']} {name} ({devanagari})")
-
-        separator = "─" * 66
-
-        def wrap_text(text: str, width: int = 66, indent='  ') -> str:
-            if not text or not text.strip(): return indent + "N/A"
-            text_str = str(text)
-            lines = text_str.split('\n')
-            wrapped_lines = []
-            for line in lines:
-                 # Check if line contains bullet points (•) or numbered lists (e.g., '• ')
-                 is_list_item = line.strip().startswith('•') or (len(line.strip()) > 1 and line.strip()[0].isdigit() and line.strip()[1:3] in ['. ','- '])
-                 
-                 # Adjust subsequent indent for list items to maintain alignment
-                 sub_indent = indent + '  ' if is_list_item else indent
-                 
-                 wrapped_line = textwrap.fill(
-                     line.strip(), 
-                     width=width,
-                     initial_indent=indent,
-                     subsequent_indent=sub_indent, # Use adjusted indent
-                     break_long_words=False,
-                     replace_whitespace=False
-                 )
-                 if not line.strip():
-                      wrapped_lines.append("") # Keep paragraph breaks as empty lines
-                 else:
-                      wrapped_lines.append(wrapped_line)
-
-            final_text = '\n'.join(wrapped_lines) if wrapped_lines else indent + "N/A"
-            return final_text
-
-
-        details = f"""
- [{category.upper()}]
-{separator}
-
- FORMATION:
-{separator}
-{wrap_text(item.get('formation', 'N/A'))}
-"""
-        if 'planet' in item:
-             details += f"""
-   {'Planet Involved':<18}: {item['planet']}
-"""
 
-        details += f"""
- ASTROLOGICAL LOGIC:
-{separator}
-{wrap_text(item.get('logic', 'N/A'))}
+    def show_details(self, index: int) -> None:
+        """Displays the formatted details for the Yoga/Dosha at all_data[index]."""
+        self.item_text.delete('1.0', tk.END)
 
- BPHS / CLASSICAL RESULTS:
-{separator}
-{wrap_text(item.get('bphs_results', 'N/A'))}
+        # Header (icon, name, Devanagari) is the precomputed list row text
+        self.item_header_label.config(text=self._rendered_rows[index])
 
- LAL KITAB PERSPECTIVE:
-{separator}
-{wrap_text(item.get('lal_kitab_note', 'N/A'))}
-"""
-        self.item_text.insert('1.0', details.strip())
-        self.item_text.config(state='disabled')
+        self.item_text.insert('1.0', render_yoga_details(self.all_data[index]))
         
 #===================================================================================================
 # MAIN EXECUTION BLOCK